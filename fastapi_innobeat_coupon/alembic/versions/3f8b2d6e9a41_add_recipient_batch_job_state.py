@@ -0,0 +1,36 @@
+"""add recipient batch job state
+
+Revision ID: 3f8b2d6e9a41
+Revises: e4a9f2c6b815
+Create Date: 2026-10-16 20:41:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b2d6e9a41'
+down_revision: Union[str, None] = 'e4a9f2c6b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('recipient_batches', sa.Column('status', sa.String(length=20), server_default='COMPLETED', nullable=False))
+    op.add_column('recipient_batches', sa.Column('file_size', sa.BigInteger(), nullable=True))
+    op.add_column('recipient_batches', sa.Column('processed_bytes', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('recipient_batches', sa.Column('error_message', sa.String(length=255), nullable=True))
+    op.add_column('recipient_batches', sa.Column('started_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('recipient_batches', sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('recipient_batches', 'finished_at')
+    op.drop_column('recipient_batches', 'started_at')
+    op.drop_column('recipient_batches', 'error_message')
+    op.drop_column('recipient_batches', 'processed_bytes')
+    op.drop_column('recipient_batches', 'file_size')
+    op.drop_column('recipient_batches', 'status')
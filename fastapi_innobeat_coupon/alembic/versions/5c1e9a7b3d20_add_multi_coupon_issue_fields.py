@@ -0,0 +1,39 @@
+"""add multi coupon issue fields
+
+Revision ID: 5c1e9a7b3d20
+Revises: fc82e281f51b
+Create Date: 2026-10-16 10:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e9a7b3d20'
+down_revision: Union[str, None] = 'fc82e281f51b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "campaigns",
+        sa.Column("coupons_per_recipient", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "coupon_issues",
+        sa.Column("order_seq", sa.Integer(), server_default="1", nullable=False),
+    )
+    # CREATE_CNT > 1 응답은 하나의 ORDER_ID에 여러 쿠폰이 묶이므로 (order_id, order_seq)로 유일성 보장
+    op.drop_constraint("order_id", "coupon_issues", type_="unique")
+    op.create_unique_constraint("uq_issue_order_seq", "coupon_issues", ["order_id", "order_seq"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_issue_order_seq", "coupon_issues", type_="unique")
+    op.create_unique_constraint("order_id", "coupon_issues", ["order_id"])
+    op.drop_column("coupon_issues", "order_seq")
+    op.drop_column("campaigns", "coupons_per_recipient")
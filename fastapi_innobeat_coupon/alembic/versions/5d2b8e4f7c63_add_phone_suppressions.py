@@ -0,0 +1,44 @@
+"""add phone suppressions
+
+Revision ID: 5d2b8e4f7c63
+Revises: 9c4e7a2b5d18
+Create Date: 2026-10-16 22:41:17.203845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b8e4f7c63'
+down_revision: Union[str, None] = '9c4e7a2b5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('phone_suppressions',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('phone_hash', sa.LargeBinary(), nullable=False),
+    sa.Column('reason', sa.String(length=50), nullable=True),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_by', sa.String(length=50), nullable=True),
+    sa.Column('updated_by', sa.String(length=50), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'uq_suppression_phone_hash',
+        'phone_suppressions',
+        ['phone_hash'],
+        unique=True,
+        mysql_length={'phone_hash': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_suppression_phone_hash', table_name='phone_suppressions')
+    op.drop_table('phone_suppressions')
@@ -0,0 +1,29 @@
+"""unique status cache per coupon issue
+
+Revision ID: 8d2f4b6a1c37
+Revises: 5c1e9a7b3d20
+Create Date: 2026-10-16 14:40:27.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a1c37'
+down_revision: Union[str, None] = '5c1e9a7b3d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 캐시는 쿠폰 발급 건당 최신 상태 1행만 유지한다.
+    op.create_unique_constraint(
+        "uq_status_cache_issue", "coufun_status_cache", ["coupon_issue_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_status_cache_issue", "coufun_status_cache", type_="unique")
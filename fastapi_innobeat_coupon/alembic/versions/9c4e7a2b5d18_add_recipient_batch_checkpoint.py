@@ -0,0 +1,26 @@
+"""add recipient batch checkpoint
+
+Revision ID: 9c4e7a2b5d18
+Revises: 3f8b2d6e9a41
+Create Date: 2026-10-16 21:58:04.527391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e7a2b5d18'
+down_revision: Union[str, None] = '3f8b2d6e9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('recipient_batches', sa.Column('last_committed_row', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('recipient_batches', 'last_committed_row')
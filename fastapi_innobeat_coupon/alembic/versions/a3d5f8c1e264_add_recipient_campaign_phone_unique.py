@@ -0,0 +1,46 @@
+"""add recipient campaign phone unique
+
+Revision ID: a3d5f8c1e264
+Revises: e8b1d4c7a352
+Create Date: 2026-10-17 09:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d5f8c1e264'
+down_revision: Union[str, None] = 'e8b1d4c7a352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 이미 발급/발송 이력이 붙었을 수 있는 수신자 행을 마이그레이션이 임의로 지우지 않는다.
+    # 중복이 남아 있으면 운영자가 정리한 뒤 다시 실행하도록 중단한다.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT campaign_id, COUNT(*) FROM campaign_recipients "
+            "GROUP BY campaign_id, phone_hash HAVING COUNT(*) > 1"
+        )
+    ).fetchall()
+    if duplicates:
+        campaign_ids = sorted({row[0] for row in duplicates})
+        raise RuntimeError(
+            f"캠페인 내 중복 수신자 번호 {len(duplicates)}건이 있습니다 (campaign_id: {campaign_ids[:20]}). "
+            "중복 행을 정리한 뒤 다시 실행하세요."
+        )
+    op.create_index(
+        'uq_recipient_campaign_phone',
+        'campaign_recipients',
+        ['campaign_id', 'phone_hash'],
+        unique=True,
+        mysql_length={'phone_hash': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_recipient_campaign_phone', table_name='campaign_recipients')
@@ -0,0 +1,45 @@
+"""add coupon exchange webhook fields
+
+Revision ID: b7e3c1d9a4f2
+Revises: 8d2f4b6a1c37
+Create Date: 2026-10-16 16:05:48.221904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c1d9a4f2'
+down_revision: Union[str, None] = '8d2f4b6a1c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.add_column('coupon_issues', sa.Column('barcode_hash', sa.LargeBinary(), nullable=True))
+    op.create_index(
+        'ix_issue_barcode_hash',
+        'coupon_issues',
+        ['barcode_hash'],
+        unique=False,
+        mysql_length={'barcode_hash': 32},
+    )
+    op.add_column('coupon_exchange_details', sa.Column('exchange_num', sa.String(length=30), nullable=True))
+    op.add_column('coupon_exchange_details', sa.Column('exchange_status', sa.String(length=3), nullable=True))
+    op.create_unique_constraint(
+        'uq_exchange_event',
+        'coupon_exchange_details',
+        ['coupon_issue_id', 'exchange_num', 'exchange_status'],
+    )
+    # 기존 발급 건의 barcode_hash는 암호화 키가 필요하므로 scripts/backfill_barcode_hash.py로 채운다.
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_exchange_event', 'coupon_exchange_details', type_='unique')
+    op.drop_column('coupon_exchange_details', 'exchange_status')
+    op.drop_column('coupon_exchange_details', 'exchange_num')
+    op.drop_index('ix_issue_barcode_hash', table_name='coupon_issues')
+    op.drop_column('coupon_issues', 'barcode_hash')
+
@@ -0,0 +1,26 @@
+"""add recipient batch file node
+
+Revision ID: b9e2d6a4c170
+Revises: a3d5f8c1e264
+Create Date: 2026-10-17 09:48:25.310477
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e2d6a4c170'
+down_revision: Union[str, None] = 'a3d5f8c1e264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('recipient_batches', sa.Column('file_node', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('recipient_batches', 'file_node')
@@ -0,0 +1,25 @@
+"""add suppression created_at index
+
+Revision ID: c4f1a7e9d352
+Revises: b9e2d6a4c170
+Create Date: 2026-10-17 10:21:52.804116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a7e9d352'
+down_revision: Union[str, None] = 'b9e2d6a4c170'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_suppression_created_at', 'phone_suppressions', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_suppression_created_at', table_name='phone_suppressions')
@@ -0,0 +1,28 @@
+"""add dispatch job heartbeat
+
+Revision ID: d6b3e8f2a519
+Revises: c4f1a7e9d352
+Create Date: 2026-10-17 10:57:14.662390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6b3e8f2a519'
+down_revision: Union[str, None] = 'c4f1a7e9d352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('dispatch_jobs', sa.Column('owner_node', sa.String(length=100), nullable=True))
+    op.add_column('dispatch_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('dispatch_jobs', 'heartbeat_at')
+    op.drop_column('dispatch_jobs', 'owner_node')
@@ -0,0 +1,49 @@
+"""add coupon issue ledger
+
+Revision ID: e4a9f2c6b815
+Revises: b7e3c1d9a4f2
+Create Date: 2026-10-16 18:22:10.640317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9f2c6b815'
+down_revision: Union[str, None] = 'b7e3c1d9a4f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('coupon_issue_ledger',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('tr_id', sa.String(length=50), nullable=False),
+    sa.Column('campaign_id', sa.BigInteger(), nullable=False),
+    sa.Column('recipient_id', sa.BigInteger(), nullable=False),
+    sa.Column('goods_id', sa.String(length=50), nullable=False),
+    sa.Column('create_count', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.String(length=50), nullable=True),
+    sa.Column('result_payload', sa.JSON(), nullable=True),
+    sa.Column('error_code', sa.String(length=20), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('requested_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ),
+    sa.ForeignKeyConstraint(['recipient_id'], ['campaign_recipients.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tr_id')
+    )
+    op.create_index('ix_issue_ledger_campaign_status', 'coupon_issue_ledger', ['campaign_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_issue_ledger_campaign_status', table_name='coupon_issue_ledger')
+    op.drop_table('coupon_issue_ledger')
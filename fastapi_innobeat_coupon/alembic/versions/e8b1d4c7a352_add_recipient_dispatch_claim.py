@@ -0,0 +1,26 @@
+"""add recipient dispatch claim
+
+Revision ID: e8b1d4c7a352
+Revises: a7c3e9f1b254
+Create Date: 2026-10-17 00:48:09.671254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b1d4c7a352'
+down_revision: Union[str, None] = 'a7c3e9f1b254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('campaign_recipients', sa.Column('dispatch_claim', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('campaign_recipients', 'dispatch_claim')
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from . import auth, campaigns, coupons, cs, health, media, products, send_query, uploads, users
+from . import auth, campaigns, coupons, cs, health, issue_ledger, media, products, send_query, suppressions, uploads, users, webhooks
 
 api_router = APIRouter()
 api_router.include_router(health.router)
@@ -10,6 +10,9 @@ api_router.include_router(campaigns.router)
 api_router.include_router(media.router)
 api_router.include_router(send_query.router)
 api_router.include_router(uploads.router)
+api_router.include_router(suppressions.router)
 api_router.include_router(coupons.router)
+api_router.include_router(issue_ledger.router)
 api_router.include_router(cs.router)
 api_router.include_router(users.router)
+api_router.include_router(webhooks.router)
@@ -4,13 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
-from app.core.roles import DEFAULT_WRITE_ROLES
+from app.core.roles import DEFAULT_READ_ROLES, DEFAULT_WRITE_ROLES
 from app.db.session import get_db
 from app.schemas.campaigns import CampaignCreate, CampaignRead
-from app.schemas.dispatch import DispatchSummary, DispatchSyncSummary
+from app.schemas.dispatch import DispatchJobRead, DispatchSyncSummary
+from app.services import dispatch_job_service
 from app.services.campaign_service import create_campaign
 from app.services.dispatch_result_service import sync_dispatch_results
-from app.services.dispatch_service import dispatch_campaign_messages
 from app.services.audit_service import log_action
 
 router = APIRouter(prefix="/campaigns", tags=["campaigns"])
@@ -70,25 +70,82 @@ def sync_dispatch_results_endpoint(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
-@router.post("/{campaign_id}/dispatch", response_model=DispatchSummary)
+@router.post(
+    "/{campaign_id}/dispatch",
+    response_model=DispatchJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 def dispatch_campaign(
     campaign_id: int,
     db: Session = Depends(get_db),
     current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
 ):
     """
-    VALIDATED 상태 수신자를 SNAP Agent UMS_MSG에 INSERT 하여 발송 큐에 적재.
+    VALIDATED 상태 수신자를 SNAP Agent UMS_MSG에 적재하는 발송 작업을 등록하고 바로 202를 반환한다.
+    쿠폰 발급/적재는 작업 풀에서 청크 단위로 진행되며, 진행 상황은 작업 조회 엔드포인트로 폴링한다.
     """
     try:
-        summary = dispatch_campaign_messages(db, campaign_id)
-        log_action(
+        job = dispatch_job_service.submit_dispatch_job(
             db,
-            user_id=current_user.id,
-            action="campaign.dispatch.enqueue",
-            target_type="campaign",
-            target_id=str(campaign_id),
-            commit=True,
+            campaign_id=campaign_id,
+            requested_by=current_user.id,
         )
-        return summary
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="campaign.dispatch.enqueue",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return DispatchJobRead.model_validate(job)
+
+
+@router.get(
+    "/{campaign_id}/dispatch-jobs/{job_id}",
+    response_model=DispatchJobRead,
+)
+def get_dispatch_job(
+    campaign_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
+):
+    """
+    발송 작업 상태/진행률 조회.
+    """
+    try:
+        job = dispatch_job_service.get_dispatch_job(db, campaign_id, job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return DispatchJobRead.model_validate(job)
+
+
+@router.post(
+    "/{campaign_id}/dispatch-jobs/{job_id}/cancel",
+    response_model=DispatchJobRead,
+)
+def cancel_dispatch_job(
+    campaign_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    발송 작업 취소. 실행 중이면 현재 청크까지 적재한 뒤 멈춘다.
+    """
+    try:
+        job = dispatch_job_service.cancel_dispatch_job(db, campaign_id, job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="campaign.dispatch.cancel",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return DispatchJobRead.model_validate(job)
@@ -15,11 +15,12 @@ router = APIRouter(prefix="/coupons", tags=["coupons"])
 @router.post("/{coupon_issue_id}/status")
 def refresh_status(
     coupon_issue_id: int,
+    force_refresh: bool = False,
     db: Session = Depends(get_db),
     current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
 ):
     try:
-        result = refresh_coupon_status(db, coupon_issue_id)
+        result = refresh_coupon_status(db, coupon_issue_id, force_refresh=force_refresh)
         log_action(
             db,
             user_id=current_user.id,
@@ -1,8 +1,24 @@
 from fastapi import APIRouter
 
+from app.services import coufun_service, coupon_exchange_service
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 
 @router.get("/ping")
 async def ping() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/coufun")
+async def coufun_health() -> dict:
+    """
+    COUFUN 엔드포인트별 호출 횟수/지연시간(ms) 누적 통계, 공유 호출 예산, 서킷 브레이커 상태,
+    교환정보 쓰기 큐 대기 건수.
+    """
+    return {
+        "latency": coufun_service.get_latency_stats(),
+        "rate_limits": coufun_service.get_rate_limit_stats(),
+        "circuit_breakers": coufun_service.get_circuit_breaker_stats(),
+        "exchange_queue_pending": coupon_exchange_service.pending_events(),
+    }
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.roles import DEFAULT_READ_ROLES, DEFAULT_WRITE_ROLES
+from app.db.session import get_db
+from app.schemas.issue_ledger import IssueLedgerPage, IssueLedgerRead, IssueLedgerResolveRequest
+from app.services import issue_ledger_service
+from app.services.audit_service import log_action
+
+router = APIRouter(prefix="/issue-ledger", tags=["issue-ledger"])
+
+
+@router.get("/unresolved", response_model=IssueLedgerPage)
+def list_unresolved(
+    campaign_id: int | None = None,
+    cursor: int | None = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
+):
+    """
+    발급 결과를 확정하지 못해(TR_ID 중복 응답, 바코드 수 불일치) 수동 확인이 필요한 원장 목록과 건수.
+    """
+    entries = issue_ledger_service.list_unresolved(
+        db,
+        campaign_id=campaign_id,
+        after_id=cursor,
+        limit=limit,
+    )
+    return IssueLedgerPage(
+        total=issue_ledger_service.count_unresolved(db, campaign_id=campaign_id),
+        items=[IssueLedgerRead.model_validate(entry) for entry in entries],
+        next_cursor=entries[-1].id if len(entries) == limit else None,
+    )
+
+
+@router.post("/{ledger_id}/resolve", response_model=IssueLedgerRead)
+def resolve_unresolved(
+    ledger_id: int,
+    payload: IssueLedgerResolveRequest,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    COUFUN에서 확인한 바코드로 발급 완료 처리한다. 바코드는 쿠폰 상태 조회로 검증한다.
+    """
+    try:
+        entry = issue_ledger_service.resolve_with_barcodes(db, ledger_id, payload.barcodes)
+    except ValueError as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="issue_ledger.resolve",
+        target_type="issue_ledger",
+        target_id=str(ledger_id),
+        commit=True,
+    )
+    return IssueLedgerRead.model_validate(entry)
+
+
+@router.post("/{ledger_id}/release", response_model=IssueLedgerRead)
+def release_unresolved(
+    ledger_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    COUFUN에서 미발급을 확인한 건을 놓아준다. 다음 발송 요청에서 새 TR_ID로 다시 발급한다.
+    """
+    try:
+        entry = issue_ledger_service.release_unresolved(db, ledger_id)
+    except ValueError as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="issue_ledger.release",
+        target_type="issue_ledger",
+        target_id=str(ledger_id),
+        commit=True,
+    )
+    return IssueLedgerRead.model_validate(entry)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.roles import DEFAULT_WRITE_ROLES
+from app.db.session import get_db
+from app.schemas.suppressions import (
+    SuppressionDeleteRequest,
+    SuppressionDeleteSummary,
+    SuppressionImportSummary,
+    SuppressionRequest,
+)
+from app.services import suppression_service
+from app.services.audit_service import log_action
+from app.services.upload_service import import_suppression_file
+
+router = APIRouter(prefix="/suppressions", tags=["suppressions"])
+
+
+@router.post("", response_model=SuppressionImportSummary)
+def add_suppressions(
+    payload: SuppressionRequest,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    발송 제외 번호 등록. 이미 등록된 번호와 형식 오류는 건너뛰고 건수만 돌려준다.
+    """
+    result = suppression_service.add_suppressions(
+        db,
+        payload.phones,
+        reason=payload.reason,
+        source="API",
+        actor=current_user.username,
+    )
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="suppressions.add",
+        target_type="suppression",
+        commit=True,
+    )
+    return SuppressionImportSummary.model_validate(result)
+
+
+@router.post("/import", response_model=SuppressionImportSummary)
+def import_suppressions(
+    file: UploadFile,
+    reason: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    phone 컬럼이 있는 CSV/XLSX 파일로 발송 제외 번호를 일괄 등록한다.
+    """
+    try:
+        file.file.seek(0)
+        result = import_suppression_file(
+            db,
+            file.file,
+            reason=reason,
+            source="FILE",
+            actor=current_user.username,
+        )
+    except ValueError as exc:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="suppressions.import",
+        target_type="suppression",
+        target_id=file.filename,
+        commit=True,
+    )
+    return SuppressionImportSummary.model_validate(result)
+
+
+@router.delete("", response_model=SuppressionDeleteSummary)
+def delete_suppressions(
+    payload: SuppressionDeleteRequest,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    removed = suppression_service.remove_suppressions(db, payload.phones)
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="suppressions.delete",
+        target_type="suppression",
+        commit=True,
+    )
+    return SuppressionDeleteSummary(removed=removed)
@@ -1,18 +1,28 @@
 from __future__ import annotations
 
-import io
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api import deps
 from app.core.roles import DEFAULT_READ_ROLES, DEFAULT_WRITE_ROLES
 from app.db.session import get_db
-from app.schemas.uploads import RecipientUploadSummary, RecipientValidationErrorRead
+from app.schemas.uploads import (
+    RecipientUploadJobRead,
+    RecipientUploadSessionRead,
+    RecipientUploadSummary,
+    RecipientValidationErrorFilters,
+    RecipientValidationErrorPage,
+    RecipientValidationErrorSummary,
+    UploadPartRead,
+)
+from app.services import upload_job_service
 from app.services.upload_service import (
-    generate_validation_error_csv,
     handle_recipient_upload,
+    has_validation_errors,
     list_validation_errors,
+    stream_validation_error_csv,
+    summarize_validation_errors,
 )
 from app.services.audit_service import log_action
 
@@ -20,22 +30,23 @@ router = APIRouter(prefix="/campaigns", tags=["recipients"])
 
 
 @router.post("/{campaign_id}/recipients/upload", response_model=RecipientUploadSummary)
-async def upload_recipients(
+def upload_recipients(
     campaign_id: int,
     file: UploadFile,
     db: Session = Depends(get_db),
     current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
 ):
     """
-    수신자 파일 업로드 엔드포인트 (현재는 요약 정보만 반환하는 골격 상태).
+    수신자 파일 업로드 엔드포인트. 업로드 임시 파일(SpooledTemporaryFile)에서 행을 바로 읽어
+    검증하며, 동기 핸들러로 두어 DB 작업이 이벤트 루프를 막지 않게 한다.
     """
-    file_bytes = await file.read()
     try:
+        file.file.seek(0)
         summary = handle_recipient_upload(
             db,
             campaign_id=campaign_id,
             filename=file.filename,
-            file_bytes=file_bytes,
+            stream=file.file,
         )
         log_action(
             db,
@@ -50,36 +61,278 @@ async def upload_recipients(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@router.post(
+    "/{campaign_id}/recipients/upload-jobs",
+    response_model=RecipientUploadJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def create_upload_job(
+    campaign_id: int,
+    file: UploadFile,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    수신자 파일 백그라운드 업로드. 파일을 받아 작업을 등록하고 바로 202를 반환하며,
+    진행 상황은 작업 조회 엔드포인트로 폴링한다.
+    """
+    try:
+        file.file.seek(0)
+        batch = upload_job_service.submit_upload_job(
+            db,
+            campaign_id=campaign_id,
+            filename=file.filename,
+            source=file.file,
+            uploaded_by=current_user.id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="recipients.upload",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return RecipientUploadJobRead.model_validate(batch)
+
+
+@router.get(
+    "/{campaign_id}/recipients/upload-jobs/{batch_id}",
+    response_model=RecipientUploadJobRead,
+)
+def get_upload_job(
+    campaign_id: int,
+    batch_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
+):
+    """
+    업로드 작업 상태/진행률 조회.
+    """
+    try:
+        batch = upload_job_service.get_upload_job(db, campaign_id, batch_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return RecipientUploadJobRead.model_validate(batch)
+
+
+@router.post(
+    "/{campaign_id}/recipients/upload-jobs/{batch_id}/resume",
+    response_model=RecipientUploadJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def resume_upload_job(
+    campaign_id: int,
+    batch_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    실패한 업로드 작업을 마지막 커밋 행 다음부터 이어서 처리한다.
+    """
+    try:
+        batch = upload_job_service.resume_upload_job(db, campaign_id, batch_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="recipients.upload.resume",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return RecipientUploadJobRead.model_validate(batch)
+
+
+@router.delete(
+    "/{campaign_id}/recipients/upload-jobs/{batch_id}",
+    response_model=RecipientUploadJobRead,
+)
+def discard_upload_job(
+    campaign_id: int,
+    batch_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    실패했거나 업로드 중인 작업을 폐기하고, 이미 들어간 수신자 행을 삭제한다.
+    """
+    try:
+        batch = upload_job_service.discard_upload_job(db, campaign_id, batch_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="recipients.upload.discard",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return RecipientUploadJobRead.model_validate(batch)
+
+
+@router.post(
+    "/{campaign_id}/recipients/upload-sessions",
+    response_model=RecipientUploadSessionRead,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_upload_session(
+    campaign_id: int,
+    filename: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    대용량 파일 분할 업로드 세션 생성. 파트를 번호별로 올린 뒤 complete로 작업을 시작한다.
+    """
+    try:
+        batch = upload_job_service.create_upload_session(
+            db,
+            campaign_id=campaign_id,
+            filename=filename,
+            uploaded_by=current_user.id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _session_read(batch)
+
+
+@router.get(
+    "/{campaign_id}/recipients/upload-sessions/{batch_id}",
+    response_model=RecipientUploadSessionRead,
+)
+def get_upload_session(
+    campaign_id: int,
+    batch_id: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
+):
+    """
+    세션 상태와 수신된 파트 목록. 끊긴 업로드는 여기서 빠진 파트만 확인해 다시 보낸다.
+    """
+    try:
+        batch = upload_job_service.get_upload_job(db, campaign_id, batch_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return _session_read(batch)
+
+
+@router.put(
+    "/{campaign_id}/recipients/upload-sessions/{batch_id}/parts/{part_number}",
+    response_model=RecipientUploadSessionRead,
+)
+def put_upload_part(
+    campaign_id: int,
+    batch_id: int,
+    part_number: int,
+    file: UploadFile,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    try:
+        file.file.seek(0)
+        batch = upload_job_service.put_upload_part(
+            db,
+            campaign_id,
+            batch_id,
+            part_number=part_number,
+            source=file.file,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _session_read(batch)
+
+
+@router.post(
+    "/{campaign_id}/recipients/upload-sessions/{batch_id}/complete",
+    response_model=RecipientUploadJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def complete_upload_session(
+    campaign_id: int,
+    batch_id: int,
+    part_count: int,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_WRITE_ROLES)),
+):
+    """
+    1..part_count 파트를 이어 붙여 백그라운드 업로드 작업을 시작한다.
+    """
+    try:
+        batch = upload_job_service.complete_upload_session(
+            db,
+            campaign_id,
+            batch_id,
+            part_count=part_count,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="recipients.upload",
+        target_type="campaign",
+        target_id=str(campaign_id),
+        commit=True,
+    )
+    return RecipientUploadJobRead.model_validate(batch)
+
+
+def _session_read(batch) -> RecipientUploadSessionRead:
+    session = RecipientUploadSessionRead.model_validate(batch)
+    session.parts = [
+        UploadPartRead.model_validate(part) for part in upload_job_service.list_upload_parts(batch.id)
+    ]
+    return session
+
+
 @router.get(
     "/{campaign_id}/recipients/errors",
-    response_model=list[RecipientValidationErrorRead],
+    response_model=RecipientValidationErrorPage,
 )
 def get_recipient_errors(
     campaign_id: int,
+    filters: RecipientValidationErrorFilters = Depends(),
     db: Session = Depends(get_db),
     current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
 ):
     """
-    최신 업로드 배치에서 발생한 검증 오류 목록을 제공한다.
+    검증 오류 목록 (keyset 페이지). batch_id로 특정 업로드 배치만 볼 수 있다.
     """
-    errors = list_validation_errors(db, campaign_id)
-    return [
-        RecipientValidationErrorRead.model_validate(err)
-        for err in errors
-    ]
+    return list_validation_errors(db, campaign_id, filters)
+
+
+@router.get(
+    "/{campaign_id}/recipients/errors/summary",
+    response_model=list[RecipientValidationErrorSummary],
+)
+def get_recipient_error_summary(
+    campaign_id: int,
+    batch_id: int | None = None,
+    db: Session = Depends(get_db),
+    current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
+):
+    """
+    검증 오류 사유별 건수.
+    """
+    return summarize_validation_errors(db, campaign_id, batch_id)
 
 
 @router.get("/{campaign_id}/recipients/errors/export")
 def export_errors_csv(
     campaign_id: int,
+    batch_id: int | None = None,
     db: Session = Depends(get_db),
     current_user: deps.AuthenticatedUser = Depends(deps.require_roles(DEFAULT_READ_ROLES)),
 ):
     """
-    검증 오류 목록을 CSV로 다운로드한다.
+    검증 오류 목록을 CSV로 다운로드한다. 전체를 메모리에 만들지 않고 조각 단위로 스트리밍한다.
     """
-    csv_text = generate_validation_error_csv(db, campaign_id)
-    if not csv_text.strip():
+    if not has_validation_errors(db, campaign_id, batch_id):
         raise HTTPException(status_code=404, detail="오류 데이터가 없습니다.")
     filename = f"campaign_{campaign_id}_validation_errors.csv"
     log_action(
@@ -90,9 +343,8 @@ def export_errors_csv(
         target_id=str(campaign_id),
         commit=True,
     )
-    stream = io.BytesIO(csv_text.encode("utf-8-sig"))
     return StreamingResponse(
-        stream,
+        stream_validation_error_csv(campaign_id, batch_id),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
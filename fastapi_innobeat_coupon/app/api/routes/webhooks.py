@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import get_db
+from app.services import coufun_service, coupon_exchange_service
+from app.services.coufun_service import (
+    EXCHANGE_RESULT_BARCODE_ERROR,
+    EXCHANGE_RESULT_ERROR,
+    EXCHANGE_RESULT_IP_ERROR,
+    EXCHANGE_RESULT_SUCCESS,
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/webhooks/coufun", tags=["webhooks"])
+
+
+@router.post("/exchange")
+def receive_exchange(
+    request: Request,
+    barcode_num: str = Form(default="", alias="BARCODE_NUM"),
+    exchange_num: str = Form(default="", alias="EXCHANGE_NUM"),
+    status: str = Form(default="", alias="STATUS"),
+    exchange_date: str = Form(default="", alias="EXCHANGE_DATE"),
+    branch_name: str = Form(default="", alias="BRANCH_NAME"),
+    branch_code: str = Form(default="", alias="BRANCH_CODE"),
+    barcode_type: str = Form(default="", alias="BARCODE_TYPE"),
+    price: str = Form(default="", alias="PRICE"),
+    balance: str = Form(default="", alias="BALANCE"),
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    COUFUN 교환정보(사용/사용취소) 실시간 통지 수신.
+
+    COUFUN은 00을 받으면 더 이상 재전송하지 않으므로, 검증 후 쓰기 큐에 넣고 묶음 커밋이 끝난 뒤에만
+    00으로 응답한다. 저장에 실패하거나 COUFUN_WEBHOOK_ACK_TIMEOUT_SECONDS 안에 끝나지 않으면 99로
+    응답해 재전송을 받는다. 중복 통지도 같은 EXCHANGE_ID와 00으로 응답하며 저장 단계에서 걸러진다.
+
+    인증 없이 쿠폰 상태를 바꾸는 경로이므로 COUFUN_WEBHOOK_ENABLED가 아니면 404로 숨기고,
+    COUFUN_WEBHOOK_ALLOWED_IPS에 등록된 발신 IP만 받는다 (목록이 비어 있으면 모두 거부).
+    """
+    if not settings.coufun_webhook_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    client_ip = _client_ip(request)
+    if client_ip not in settings.coufun_webhook_allowed_ip_set:
+        return _reply(EXCHANGE_RESULT_IP_ERROR, "Invalid IP", client_ip=client_ip)
+
+    params = {
+        "BARCODE_NUM": barcode_num,
+        "EXCHANGE_NUM": exchange_num,
+        "STATUS": status,
+        "EXCHANGE_DATE": exchange_date,
+        "BRANCH_NAME": branch_name,
+        "BRANCH_CODE": branch_code,
+        "BARCODE_TYPE": barcode_type,
+        "PRICE": price,
+        "BALANCE": balance,
+    }
+    try:
+        notice = coufun_service.parse_exchange_notice(params)
+    except ValueError as exc:
+        return _reply(EXCHANGE_RESULT_ERROR, "Invalid Parameter", client_ip=client_ip, detail=str(exc))
+
+    issue_id = coupon_exchange_service.resolve_coupon_issue_id(db, notice.barcode)
+    if issue_id is None:
+        return _reply(EXCHANGE_RESULT_BARCODE_ERROR, "Invalid Barcode", client_ip=client_ip)
+
+    event = coupon_exchange_service.new_event(issue_id, notice)
+    stored = coupon_exchange_service.enqueue_event(event)
+    if stored is None:
+        return _reply(EXCHANGE_RESULT_ERROR, "Busy", client_ip=client_ip, detail="queue full")
+    try:
+        stored.result(timeout=settings.coufun_webhook_ack_timeout_seconds)
+    except Exception as exc:  # noqa: BLE001
+        return _reply(
+            EXCHANGE_RESULT_ERROR,
+            "Retry",
+            client_ip=client_ip,
+            detail=f"store failed: {type(exc).__name__}",
+        )
+    return _reply(
+        EXCHANGE_RESULT_SUCCESS,
+        "Success",
+        client_ip=client_ip,
+        exchange_id=coupon_exchange_service.build_exchange_id(event),
+    )
+
+
+def _client_ip(request: Request) -> str:
+    """
+    요청 발신 IP. 직접 연결한 주소가 COUFUN_WEBHOOK_TRUSTED_PROXIES에 있을 때만
+    COUFUN_WEBHOOK_CLIENT_IP_HEADER 값을 믿으며, X-Forwarded-For처럼 여러 주소가 이어진 경우
+    오른쪽부터 신뢰 프록시를 건너뛴 첫 주소를 쓴다. 헤더는 누구나 넣을 수 있으므로 그 밖에는 무시한다.
+    """
+    peer_ip = request.client.host if request.client else ""
+    header = settings.coufun_webhook_client_ip_header
+    trusted = settings.coufun_webhook_trusted_proxy_set
+    if not header or peer_ip not in trusted:
+        return peer_ip
+    hops = [hop.strip() for hop in request.headers.get(header, "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if hop not in trusted:
+            return hop
+    return peer_ip
+
+
+def _reply(
+    code: str,
+    message: str,
+    *,
+    client_ip: str,
+    exchange_id: str | None = None,
+    detail: str | None = None,
+) -> Response:
+    # 매뉴얼상 응답 결과는 로그로 반드시 관리해야 한다.
+    logger.info(
+        "COUFUN 교환정보 응답 (ip=%s, code=%s, exchange_id=%s, detail=%s)",
+        client_ip,
+        code,
+        exchange_id,
+        detail,
+    )
+    return Response(
+        content=coufun_service.build_exchange_reply(code, message, exchange_id),
+        media_type="application/xml; charset=EUC-KR",
+    )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import math
+
+
+class BloomFilter:
+    """
+    SHA-256 다이제스트(phone_hash 등)를 키로 쓰는 블룸 필터.
+    키가 이미 균일한 해시값이므로 앞 16바이트를 두 개의 64비트 정수로 나눠 이중 해싱으로 위치를 만든다.
+    '없음'은 확정이고 '있음'은 오탐일 수 있으므로 정확한 조회로 확인해야 한다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(capacity, 1)
+        self.error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.size = max(int(-self.capacity * math.log(self.error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, digest: bytes) -> None:
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+    def _positions(self, digest: bytes):
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        size = self.size
+        return ((first + i * second) % size for i in range(self.hash_count))
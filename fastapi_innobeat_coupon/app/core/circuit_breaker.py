@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "CLOSED"
+STATE_OPEN = "OPEN"
+STATE_HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커 (CLOSED → OPEN → HALF_OPEN → CLOSED).
+
+    - CLOSED: 연속 실패가 failure_threshold에 도달하면 OPEN으로 전환.
+    - OPEN: recovery_seconds 동안 호출을 즉시 거절(CircuitOpenError).
+    - HALF_OPEN: half_open_max_calls 건만 시험 호출을 허용하고,
+      성공하면 CLOSED, 실패하면 다시 OPEN으로 전환.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int,
+        recovery_seconds: float,
+        half_open_max_calls: int = 1,
+        history_size: int = 20,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(failure_threshold, 1)
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max_calls = max(half_open_max_calls, 1)
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_at = 0.0
+        self._half_open_calls = 0
+        self._transitions: deque[dict[str, str]] = deque(maxlen=history_size)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def before_call(self) -> None:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == STATE_OPEN:
+                raise CircuitOpenError(f"{self.name} 서킷이 열려 있어 호출을 차단했습니다.")
+            if self._state == STATE_HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError(f"{self.name} 서킷 복구 확인 중입니다.")
+                self._half_open_calls += 1
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._state != STATE_CLOSED:
+                self._transition(STATE_CLOSED, "trial call succeeded")
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN:
+                self._open("trial call failed")
+            elif self._state == STATE_CLOSED and self._failures >= self.failure_threshold:
+                self._open(f"{self._failures} consecutive failures")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "transitions": list(self._transitions),
+            }
+
+    def _maybe_half_open(self) -> None:
+        now = time.monotonic()
+        if self._state == STATE_OPEN and now - self._opened_at >= self.recovery_seconds:
+            self._half_open_at = now
+            self._transition(STATE_HALF_OPEN, "recovery timeout elapsed")
+        elif self._state == STATE_HALF_OPEN and now - self._half_open_at >= self.recovery_seconds:
+            # 결과가 보고되지 않은 시험 호출(취소 등)로 슬롯이 묶이지 않도록 주기적으로 초기화
+            self._half_open_at = now
+            self._half_open_calls = 0
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = time.monotonic()
+        self._transition(STATE_OPEN, reason)
+
+    def _transition(self, new_state: str, reason: str) -> None:
+        previous = self._state
+        self._state = new_state
+        self._half_open_calls = 0
+        self._transitions.append(
+            {
+                "from": previous,
+                "to": new_state,
+                "reason": reason,
+                "at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        logger.warning("서킷 상태 전환 (%s: %s -> %s, %s)", self.name, previous, new_state, reason)
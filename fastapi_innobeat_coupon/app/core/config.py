@@ -1,3 +1,5 @@
+import os
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,10 +20,14 @@ class Settings(BaseSettings):
         default="0123456789abcdeffedcba98765432100123456789abcdeffedcba9876543210",
         alias="ENCRYPTION_KEY",
     )
+    crypto_workers: int = Field(default_factory=lambda: os.cpu_count() or 1, alias="CRYPTO_WORKERS")
+    crypto_batch_chunk_size: int = Field(default=128, alias="CRYPTO_BATCH_CHUNK_SIZE")
+    crypto_parallel_min_items: int = Field(default=256, alias="CRYPTO_PARALLEL_MIN_ITEMS")
     snap_traffic_type: str = Field(default="normal", alias="SNAP_TRAFFIC_TYPE")
     snap_req_channel: str = Field(default="MMS", alias="SNAP_REQ_CHANNEL")
     snap_req_dept_code: str | None = Field(default=None, alias="SNAP_REQ_DEPT_CODE")
     snap_req_user_id: str | None = Field(default=None, alias="SNAP_REQ_USER_ID")
+    snap_enqueue_chunk_size: int = Field(default=1000, alias="SNAP_ENQUEUE_CHUNK_SIZE")
     snap_sync_enabled: bool = Field(default=True, alias="SNAP_SYNC_ENABLED")
     snap_sync_interval_seconds: int = Field(default=180, alias="SNAP_SYNC_INTERVAL_SECONDS")
     snap_sync_lookback_minutes: int = Field(default=60, alias="SNAP_SYNC_LOOKBACK_MINUTES")
@@ -36,6 +42,74 @@ class Settings(BaseSettings):
         default=200,
         alias="COUPON_STATUS_SYNC_BATCH_SIZE",
     )
+    issue_ledger_recovery_enabled: bool = Field(default=True, alias="ISSUE_LEDGER_RECOVERY_ENABLED")
+    issue_ledger_recovery_interval_seconds: int = Field(
+        default=300,
+        alias="ISSUE_LEDGER_RECOVERY_INTERVAL_SECONDS",
+    )
+    issue_ledger_stale_seconds: int = Field(default=300, alias="ISSUE_LEDGER_STALE_SECONDS")
+    coupon_status_cache_ttl_seconds: int = Field(
+        default=60,
+        alias="COUPON_STATUS_CACHE_TTL_SECONDS",
+    )
+    coupon_status_cache_terminal_ttl_seconds: int = Field(
+        default=3600,
+        alias="COUPON_STATUS_CACHE_TERMINAL_TTL_SECONDS",
+    )
+    coupon_status_cache_lru_size: int = Field(
+        default=2048,
+        alias="COUPON_STATUS_CACHE_LRU_SIZE",
+    )
+    coupon_status_reconcile_interval_seconds: int = Field(
+        default=3600,
+        alias="COUPON_STATUS_RECONCILE_INTERVAL_SECONDS",
+    )
+    coufun_webhook_enabled: bool = Field(default=False, alias="COUFUN_WEBHOOK_ENABLED")
+    coufun_webhook_allowed_ips: str = Field(default="", alias="COUFUN_WEBHOOK_ALLOWED_IPS")
+    # 로드밸런서 뒤에서는 신뢰하는 프록시가 넣은 헤더(예: X-Forwarded-For)에서 발신 IP를 읽는다.
+    coufun_webhook_client_ip_header: str = Field(default="", alias="COUFUN_WEBHOOK_CLIENT_IP_HEADER")
+    coufun_webhook_trusted_proxies: str = Field(default="", alias="COUFUN_WEBHOOK_TRUSTED_PROXIES")
+    coufun_webhook_queue_size: int = Field(default=10000, alias="COUFUN_WEBHOOK_QUEUE_SIZE")
+    coufun_webhook_flush_batch_size: int = Field(
+        default=500,
+        alias="COUFUN_WEBHOOK_FLUSH_BATCH_SIZE",
+    )
+    coufun_webhook_flush_interval_seconds: float = Field(
+        default=1.0,
+        alias="COUFUN_WEBHOOK_FLUSH_INTERVAL_SECONDS",
+    )
+    coufun_webhook_ack_timeout_seconds: float = Field(
+        default=10.0,
+        alias="COUFUN_WEBHOOK_ACK_TIMEOUT_SECONDS",
+    )
+    upload_max_rows: int = Field(default=20_000, alias="UPLOAD_MAX_ROWS")
+    upload_job_max_rows: int = Field(default=1_000_000, alias="UPLOAD_JOB_MAX_ROWS")
+    upload_response_error_limit: int = Field(default=100, alias="UPLOAD_RESPONSE_ERROR_LIMIT")
+    upload_insert_chunk_size: int = Field(default=1000, alias="UPLOAD_INSERT_CHUNK_SIZE")
+    upload_job_workers: int = Field(default=2, alias="UPLOAD_JOB_WORKERS")
+    upload_job_dir: str = Field(default="temp/recipient_uploads", alias="UPLOAD_JOB_DIR")
+    upload_job_stale_seconds: int = Field(default=600, alias="UPLOAD_JOB_STALE_SECONDS")
+    upload_job_heartbeat_seconds: int = Field(default=60, alias="UPLOAD_JOB_HEARTBEAT_SECONDS")
+    # 업로드 파일을 보관하는 노드 이름 (비우면 호스트명). UPLOAD_JOB_DIR가 공유 스토리지면 SHARED_STORAGE=true
+    upload_job_node: str = Field(default="", alias="UPLOAD_JOB_NODE")
+    upload_job_shared_storage: bool = Field(default=False, alias="UPLOAD_JOB_SHARED_STORAGE")
+    upload_session_ttl_hours: int = Field(default=24, alias="UPLOAD_SESSION_TTL_HOURS")
+    recipient_hash_cache_campaigns: int = Field(
+        default=16,
+        alias="RECIPIENT_HASH_CACHE_CAMPAIGNS",
+    )
+    suppression_bloom_capacity: int = Field(default=1_000_000, alias="SUPPRESSION_BLOOM_CAPACITY")
+    suppression_bloom_error_rate: float = Field(default=0.001, alias="SUPPRESSION_BLOOM_ERROR_RATE")
+    suppression_bloom_rescan_seconds: int = Field(default=600, alias="SUPPRESSION_BLOOM_RESCAN_SECONDS")
+    suppression_bloom_rebuild_seconds: int = Field(default=3600, alias="SUPPRESSION_BLOOM_REBUILD_SECONDS")
+    dispatch_job_workers: int = Field(default=2, alias="DISPATCH_JOB_WORKERS")
+    dispatch_chunk_size: int = Field(default=500, alias="DISPATCH_CHUNK_SIZE")
+    dispatch_job_stale_seconds: int = Field(default=600, alias="DISPATCH_JOB_STALE_SECONDS")
+    dispatch_job_heartbeat_seconds: int = Field(default=60, alias="DISPATCH_JOB_HEARTBEAT_SECONDS")
+    dispatch_job_error_limit: int = Field(default=100, alias="DISPATCH_JOB_ERROR_LIMIT")
+    dispatch_claim_timeout_seconds: int = Field(default=600, alias="DISPATCH_CLAIM_TIMEOUT_SECONDS")
+    dispatch_worker_enabled: bool = Field(default=True, alias="DISPATCH_WORKER_ENABLED")
+    dispatch_worker_poll_seconds: int = Field(default=30, alias="DISPATCH_WORKER_POLL_SECONDS")
     virus_scan_enabled: bool = Field(default=False, alias="VIRUS_SCAN_ENABLED")
     virus_scan_command: str | None = Field(default=None, alias="VIRUS_SCAN_COMMAND")
     send_query_export_dir: str = Field(
@@ -55,6 +129,54 @@ class Settings(BaseSettings):
     coufun_poc_id: str | None = Field(default=None, alias="COUFUN_POC_ID")
     coufun_timeout: float = Field(default=10.0, alias="COUFUN_TIMEOUT")
     coufun_mock_mode: bool = Field(default=True, alias="COUFUN_MOCK_MODE")
+    coufun_simulator_enabled: bool = Field(default=False, alias="COUFUN_SIMULATOR_ENABLED")
+    coufun_simulator_latency: str = Field(default="fixed:0", alias="COUFUN_SIMULATOR_LATENCY")
+    coufun_simulator_endpoint_latency: str = Field(
+        default="",
+        alias="COUFUN_SIMULATOR_ENDPOINT_LATENCY",
+    )
+    coufun_simulator_error_rates: str = Field(default="", alias="COUFUN_SIMULATOR_ERROR_RATES")
+    coufun_simulator_http_error_rate: float = Field(
+        default=0.0,
+        alias="COUFUN_SIMULATOR_HTTP_ERROR_RATE",
+    )
+    coufun_simulator_goods_count: int = Field(default=50, alias="COUFUN_SIMULATOR_GOODS_COUNT")
+    coufun_simulator_seed: int | None = Field(default=None, alias="COUFUN_SIMULATOR_SEED")
+    coufun_max_connections: int = Field(default=20, alias="COUFUN_MAX_CONNECTIONS")
+    coufun_max_keepalive_connections: int = Field(
+        default=10,
+        alias="COUFUN_MAX_KEEPALIVE_CONNECTIONS",
+    )
+    coufun_keepalive_expiry: float = Field(default=30.0, alias="COUFUN_KEEPALIVE_EXPIRY")
+    coufun_async_concurrency: int = Field(default=10, alias="COUFUN_ASYNC_CONCURRENCY")
+    coufun_rate_limit_per_second: float = Field(default=20.0, alias="COUFUN_RATE_LIMIT_PER_SECOND")
+    coufun_rate_limit_min_per_second: float = Field(
+        default=1.0,
+        alias="COUFUN_RATE_LIMIT_MIN_PER_SECOND",
+    )
+    coufun_rate_limit_max_per_second: float = Field(
+        default=50.0,
+        alias="COUFUN_RATE_LIMIT_MAX_PER_SECOND",
+    )
+    coufun_rate_limit_burst: int = Field(default=20, alias="COUFUN_RATE_LIMIT_BURST")
+    coufun_rate_limit_increase_step: float = Field(
+        default=1.0,
+        alias="COUFUN_RATE_LIMIT_INCREASE_STEP",
+    )
+    # 토큰 버킷은 프로세스 단위다. 위 예산을 이 값(uvicorn 워커 수 x 노드 수)으로 나눠 쓴다.
+    coufun_rate_limit_processes: int = Field(default=1, alias="COUFUN_RATE_LIMIT_PROCESSES")
+    coufun_rate_limit_interactive_reserve: float = Field(
+        default=0.2,
+        alias="COUFUN_RATE_LIMIT_INTERACTIVE_RESERVE",
+    )
+    coufun_breaker_failure_threshold: int = Field(
+        default=5,
+        alias="COUFUN_BREAKER_FAILURE_THRESHOLD",
+    )
+    coufun_breaker_recovery_seconds: float = Field(
+        default=30.0,
+        alias="COUFUN_BREAKER_RECOVERY_SECONDS",
+    )
     jwt_secret_key: str = Field(default="coupon-admin-secret", alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(
@@ -68,6 +190,14 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @property
+    def coufun_webhook_allowed_ip_set(self) -> set[str]:
+        return {ip.strip() for ip in self.coufun_webhook_allowed_ips.split(",") if ip.strip()}
+
+    @property
+    def coufun_webhook_trusted_proxy_set(self) -> set[str]:
+        return {ip.strip() for ip in self.coufun_webhook_trusted_proxies.split(",") if ip.strip()}
+
     @property
     def encryption_key_bytes(self) -> bytes:
         return bytes.fromhex(self.encryption_key)
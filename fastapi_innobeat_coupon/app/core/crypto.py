@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 import hashlib
+from typing import Callable, List, Sequence, TypeVar
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from app.core.config import settings
 
+NONCE_SIZE = 12
+T = TypeVar("T")
+R = TypeVar("R")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
 
 @lru_cache(maxsize=1)
 def _get_cipher() -> AESGCM:
@@ -18,7 +28,7 @@ def encrypt_value(value: str | None) -> bytes:
     if value is None:
         return b""
     cipher = _get_cipher()
-    nonce = os.urandom(12)
+    nonce = os.urandom(NONCE_SIZE)
     ciphertext = cipher.encrypt(nonce, value.encode("utf-8"), None)
     return nonce + ciphertext
 
@@ -27,10 +37,91 @@ def decrypt_value(blob: bytes | None) -> str | None:
     if not blob:
         return None
     cipher = _get_cipher()
-    nonce, data = blob[:12], blob[12:]
+    nonce, data = blob[:NONCE_SIZE], blob[NONCE_SIZE:]
     plaintext = cipher.decrypt(nonce, data, None)
     return plaintext.decode("utf-8")
 
 
 def hash_value(value: str) -> bytes:
     return hashlib.sha256(value.encode("utf-8")).digest()
+
+
+def encrypt_many(values: Sequence[str | None]) -> List[bytes]:
+    """
+    encrypt_value의 일괄 버전 (입력 순서 유지). 청크마다 nonce를 한 번에 생성하고,
+    건수가 많으면 청크를 스레드 풀에 나눠 AES-GCM 연산(GIL 해제 구간)을 여러 코어에서 수행한다.
+    """
+    return _run_chunked(values, _encrypt_chunk)
+
+
+def decrypt_many(blobs: Sequence[bytes | None]) -> List[str | None]:
+    return _run_chunked(blobs, _decrypt_chunk)
+
+
+def hash_many(values: Sequence[str]) -> List[bytes]:
+    return _run_chunked(values, _hash_chunk)
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _encrypt_chunk(values: Sequence[str | None]) -> List[bytes]:
+    cipher = _get_cipher()
+    nonces = os.urandom(NONCE_SIZE * len(values))
+    encrypted: List[bytes] = []
+    for idx, value in enumerate(values):
+        if value is None:
+            encrypted.append(b"")
+            continue
+        nonce = nonces[idx * NONCE_SIZE : (idx + 1) * NONCE_SIZE]
+        encrypted.append(nonce + cipher.encrypt(nonce, value.encode("utf-8"), None))
+    return encrypted
+
+
+def _decrypt_chunk(blobs: Sequence[bytes | None]) -> List[str | None]:
+    cipher = _get_cipher()
+    return [
+        cipher.decrypt(blob[:NONCE_SIZE], blob[NONCE_SIZE:], None).decode("utf-8") if blob else None
+        for blob in blobs
+    ]
+
+
+def _hash_chunk(values: Sequence[str]) -> List[bytes]:
+    return [hashlib.sha256(value.encode("utf-8")).digest() for value in values]
+
+
+def _run_chunked(items: Sequence[T], func: Callable[[Sequence[T]], List[R]]) -> List[R]:
+    """
+    건수가 crypto_parallel_min_items 이상이면 워커 수만큼 고르게 나눠 스레드 풀에서 처리한다.
+    crypto_batch_chunk_size는 스레드 하나가 맡는 최소 건수로, 업로드 청크(1,000행)나
+    발송 청크(500건)도 여러 코어에 나뉘도록 작게 잡는다.
+    """
+    if not items:
+        return []
+    workers = settings.crypto_workers
+    if workers <= 1 or len(items) < settings.crypto_parallel_min_items:
+        return func(items)
+    chunk_size = max(settings.crypto_batch_chunk_size, -(-len(items) // workers), 1)
+    if chunk_size >= len(items):
+        return func(items)
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+    results: List[R] = []
+    for part in _get_executor().map(func, chunks):
+        results.extend(part)
+    return results
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.crypto_workers,
+                thread_name_prefix="crypto",
+            )
+        return _executor
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class LatencyStat:
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        avg = self.total_ms / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(avg, 2),
+            "max_ms": round(self.max_ms, 2),
+            "last_ms": round(self.last_ms, 2),
+        }
+
+
+class LatencyRecorder:
+    """
+    엔드포인트별 호출 횟수/지연시간을 누적하는 스레드 안전 카운터.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, LatencyStat] = {}
+
+    def record(self, key: str, elapsed_seconds: float, *, success: bool = True) -> None:
+        elapsed_ms = elapsed_seconds * 1000
+        with self._lock:
+            stat = self._stats.setdefault(key, LatencyStat())
+            stat.count += 1
+            if not success:
+                stat.errors += 1
+            stat.total_ms += elapsed_ms
+            stat.last_ms = elapsed_ms
+            stat.max_ms = max(stat.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {key: stat.as_dict() for key, stat in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
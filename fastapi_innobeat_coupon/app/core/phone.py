@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+from typing import List, Sequence
 
 PHONE_PATTERN = re.compile(r"^010\d{8}$")
+MOBILE_PREFIX = "010"
 
 
 def normalize_phone(phone: str | None) -> str | None:
@@ -27,3 +29,54 @@ def mask_phone(phone: str | None) -> str | None:
     prefix = digits[:3]
     suffix = digits[-4:]
     return f"{prefix}-****-{suffix}"
+
+
+# 일괄 처리용: 한 열(column)을 구분자로 이어 붙여 정규식 한 번으로 처리한다 (행마다 정규식을 돌리지 않는다).
+# 구분자나 표시 문자가 값에 섞여 있으면 행 단위 함수로 처리한다.
+_SEPARATOR = "\n"
+_VALID_MARK = "\x00"
+_NON_DIGIT_PATTERN = re.compile(r"[^\d\n]+")
+_VALID_LINE_PATTERN = re.compile(r"^010\d{8}$", re.MULTILINE)
+
+
+def normalize_phones(phones: Sequence[str | None]) -> List[str | None]:
+    """
+    normalize_phone의 일괄 버전. normalize_phone과 같이 유니코드 숫자도 남긴다.
+    """
+    if not phones:
+        return []
+    joined = _join_column(phones)
+    if joined is None:
+        return [normalize_phone(phone) for phone in phones]
+    return [digits or None for digits in _NON_DIGIT_PATTERN.sub("", joined).split(_SEPARATOR)]
+
+
+def validate_phones(phones: Sequence[str | None]) -> List[bool]:
+    """
+    is_valid_phone의 일괄 버전 (010 + 8자리). 정규화하지 않으므로 하이픈/공백이 섞인 값은 거부한다.
+    """
+    if not phones:
+        return []
+    joined = _join_column(phones)
+    if joined is None:
+        return [is_valid_phone(phone) for phone in phones]
+    # 치환 문자열에 그룹 참조를 쓰면 행마다 템플릿을 펼치므로, 유효한 줄을 표시 문자 하나로 바꾼다.
+    marked = _VALID_LINE_PATTERN.sub(_VALID_MARK, joined)
+    return list(map(_VALID_MARK.__eq__, marked.split(_SEPARATOR)))
+
+
+def mask_phones(phones: Sequence[str | None]) -> List[str | None]:
+    """
+    mask_phone의 일괄 버전. 정규화는 열 단위로 하고, 마스킹은 문자열 슬라이싱만 한다.
+    """
+    return [
+        None if not phone else f"{digits[:3]}-****-{digits[-4:]}" if digits and len(digits) >= 4 else "****"
+        for phone, digits in zip(phones, normalize_phones(phones))
+    ]
+
+
+def _join_column(values: Sequence[str | None]) -> str | None:
+    joined = _SEPARATOR.join(value or "" for value in values)
+    if joined.count(_SEPARATOR) != len(values) - 1 or _VALID_MARK in joined:
+        return None
+    return joined
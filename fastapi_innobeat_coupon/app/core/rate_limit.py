@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+
+_current_priority: ContextVar[str] = ContextVar("rate_limit_priority", default=PRIORITY_INTERACTIVE)
+
+
+def current_priority() -> str:
+    return _current_priority.get()
+
+
+@contextmanager
+def bulk_priority() -> Iterator[None]:
+    """
+    대량 작업(발송, 동기화 배치) 구간을 표시한다. 이 구간의 호출은 대화형(CS) 몫으로
+    남겨둔 토큰을 사용하지 않는다. 스레드/asyncio 컨텍스트 단위로 적용된다.
+    """
+    token = _current_priority.set(PRIORITY_BULK)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class AdaptiveTokenBucket:
+    """
+    AIMD(가법 증가/승법 감소) 방식으로 충전 속도를 조절하는 스레드 안전 토큰 버킷.
+    한 프로세스 안에서만 공유되므로 여러 워커/노드가 같은 업스트림을 부르면 실제 호출량은
+    프로세스 수만큼 늘어난다 (호출 측에서 예산을 나눠 넘긴다).
+
+    - on_success: increase_interval_seconds마다 한 번만 충전 속도를 increase_step 만큼 올린다
+      (max_rate 상한). 호출 건수가 아니라 시간 구간 단위로 올리므로 버스트에도 속도가 튀지 않는다.
+    - on_throttle: 충전 속도를 decrease_factor 배로 낮춘다 (min_rate 하한).
+      동시에 실패한 호출이 연달아 속도를 깎지 않도록 cooldown 동안 한 번만 반영한다.
+    - bulk 우선순위 호출은 capacity * interactive_reserve 만큼의 토큰을 남겨 둔다.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        capacity: float,
+        min_rate: float,
+        max_rate: float,
+        interactive_reserve: float = 0.2,
+        increase_step: float = 1.0,
+        increase_interval_seconds: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+    ) -> None:
+        self._lock = threading.Lock()
+        self.min_rate = max(min_rate, 0.01)
+        self.max_rate = max(max_rate, self.min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.capacity = max(capacity, 1.0)
+        self.reserved = self.capacity * min(max(interactive_reserve, 0.0), 0.9)
+        self.increase_step = increase_step
+        self.increase_interval_seconds = increase_interval_seconds
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._last_throttle_at = 0.0
+        self._last_increase_at = self._updated_at
+        self.throttle_count = 0
+
+    def acquire(self, priority: str | None = None) -> None:
+        while True:
+            wait = self.try_acquire(priority)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, priority: str | None = None) -> None:
+        while True:
+            wait = self.try_acquire(priority)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def try_acquire(self, priority: str | None = None) -> float:
+        """
+        토큰을 하나 가져오면 0을, 부족하면 다시 시도하기까지 기다릴 시간(초)을 반환한다.
+        """
+        floor = self.reserved if (priority or current_priority()) == PRIORITY_BULK else 0.0
+        with self._lock:
+            self._refill()
+            if self._tokens - 1 >= floor:
+                self._tokens -= 1
+                return 0.0
+            return (floor + 1 - self._tokens) / self.rate
+
+    def on_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_increase_at < self.increase_interval_seconds:
+                return
+            self._last_increase_at = now
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_throttle_at < self.cooldown_seconds:
+                return
+            self._refill()
+            self._last_throttle_at = now
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            # 낮춘 직후 구간에는 다시 올리지 않는다.
+            self._last_increase_at = now
+            self._tokens = min(self._tokens, self.reserved)
+            self.throttle_count += 1
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            self._refill()
+            return {
+                "rate_per_second": round(self.rate, 2),
+                "tokens": round(self._tokens, 2),
+                "capacity": self.capacity,
+                "throttle_count": self.throttle_count,
+            }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
@@ -13,9 +13,16 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
 
 from app.core.config import settings
 from app.tasks.coupon_status_sync import run_coupon_status_sync_job
+from app.tasks.dispatch_worker import (
+    run_dispatch_heartbeat_job,
+    run_dispatch_stale_cleanup_job,
+    run_dispatch_worker_job,
+)
+from app.tasks.issue_ledger_recovery import run_issue_ledger_recovery_job
 from app.tasks.product_sync import run_product_sync_job
 from app.tasks.send_query_export_cleanup import run_send_query_export_cleanup_job
 from app.tasks.snap_result_sync import run_snap_result_sync_job
+from app.tasks.upload_job_cleanup import run_upload_job_cleanup_job, run_upload_job_recovery_job
 
 logger = logging.getLogger(__name__)
 _scheduler: BackgroundScheduler | None = None
@@ -49,14 +56,64 @@ def start_scheduler() -> None:
             replace_existing=True,
         )
     if settings.coupon_status_sync_enabled:
+        # 교환정보 푸시(웹훅)를 받는 경우 폴링은 누락 보정용으로만 느리게 돌린다.
+        sync_interval = (
+            settings.coupon_status_reconcile_interval_seconds
+            if settings.coufun_webhook_enabled
+            else settings.coupon_status_sync_interval_seconds
+        )
         _scheduler.add_job(
             run_coupon_status_sync_job,
-            IntervalTrigger(seconds=settings.coupon_status_sync_interval_seconds),
+            IntervalTrigger(seconds=sync_interval),
             id="coupon_status_sync",
             max_instances=1,
             replace_existing=True,
             coalesce=True,
         )
+    if settings.issue_ledger_recovery_enabled:
+        _scheduler.add_job(
+            run_issue_ledger_recovery_job,
+            IntervalTrigger(seconds=settings.issue_ledger_recovery_interval_seconds),
+            id="issue_ledger_recovery",
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+        )
+    # 워커 폴링을 끈 노드도 자기 워커가 붙은 작업의 하트비트는 남긴다.
+    _scheduler.add_job(
+        run_dispatch_heartbeat_job,
+        IntervalTrigger(seconds=settings.dispatch_job_heartbeat_seconds),
+        id="dispatch_job_heartbeat",
+        max_instances=1,
+        replace_existing=True,
+        coalesce=True,
+    )
+    # 워커가 모두 빠진 작업이 RUNNING/PENDING으로 남아 새 발송 요청을 막지 않도록 주기적으로 정리한다.
+    _scheduler.add_job(
+        run_dispatch_stale_cleanup_job,
+        IntervalTrigger(seconds=settings.dispatch_job_heartbeat_seconds),
+        id="dispatch_job_stale_cleanup",
+        max_instances=1,
+        replace_existing=True,
+        coalesce=True,
+    )
+    if settings.dispatch_worker_enabled:
+        _scheduler.add_job(
+            run_dispatch_worker_job,
+            IntervalTrigger(seconds=settings.dispatch_worker_poll_seconds),
+            id="dispatch_worker",
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+        )
+    _scheduler.add_job(
+        run_upload_job_recovery_job,
+        IntervalTrigger(seconds=settings.upload_job_heartbeat_seconds),
+        id="upload_job_recovery",
+        max_instances=1,
+        replace_existing=True,
+        coalesce=True,
+    )
     if settings.export_cleanup_enabled:
         _scheduler.add_job(
             run_send_query_export_cleanup_job,
@@ -66,6 +123,14 @@ def start_scheduler() -> None:
             replace_existing=True,
             coalesce=True,
         )
+        _scheduler.add_job(
+            run_upload_job_cleanup_job,
+            IntervalTrigger(minutes=settings.export_cleanup_interval_minutes),
+            id="upload_job_cleanup",
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+        )
 
     _scheduler.start()
     logger.info("스케줄러 시작")
@@ -1,10 +1,21 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import api_router
+from app.core import crypto
 from app.core.config import settings
 from app.core.scheduler import shutdown_scheduler, start_scheduler
+from app.services import (
+    coufun_async_service,
+    coufun_service,
+    coupon_exchange_service,
+    dispatch_job_service,
+    upload_job_service,
+)
 
+logger = logging.getLogger(__name__)
 app = FastAPI(title=settings.app_name, version="0.1.0")
 
 app.add_middleware(
@@ -20,12 +31,28 @@ app.include_router(api_router)
 
 @app.on_event("startup")
 def _startup() -> None:
+    coufun_service.init_http_client()
+    coupon_exchange_service.start_writer()
+    try:
+        upload_job_service.recover_stale_upload_jobs()
+    except Exception:  # noqa: BLE001
+        logger.exception("중단된 업로드 작업 정리 실패")
+    try:
+        dispatch_job_service.fail_stale_dispatch_jobs()
+    except Exception:  # noqa: BLE001
+        logger.exception("중단된 발송 작업 정리 실패")
     start_scheduler()
 
 
 @app.on_event("shutdown")
 def _shutdown() -> None:
     shutdown_scheduler()
+    coupon_exchange_service.stop_writer()
+    coufun_service.close_http_client()
+    coufun_async_service.close_shared_client()
+    upload_job_service.shutdown_executor()
+    dispatch_job_service.shutdown_executor()
+    crypto.shutdown_executor()
 
 @app.get("/", tags=["health"])
 async def root() -> dict[str, str]:
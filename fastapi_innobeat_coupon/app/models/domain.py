@@ -110,6 +110,9 @@ class Campaign(TimestampMixin, AuditMixin, Base):
     requester_phone_enc: Mapped[bytes | None] = mapped_column(LargeBinary)
     requester_phone_hash: Mapped[bytes | None] = mapped_column(LargeBinary)
     requester_email_enc: Mapped[bytes | None] = mapped_column(LargeBinary)
+    coupons_per_recipient: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
     status: Mapped[str] = mapped_column(String(20), default="DRAFT", nullable=False)
 
     @property
@@ -157,6 +160,20 @@ class RecipientBatch(TimestampMixin, AuditMixin, Base):
     valid_count: Mapped[int] = mapped_column(Integer, default=0)
     invalid_count: Mapped[int] = mapped_column(Integer, default=0)
     uploaded_by: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
+    # 업로드 작업 상태: (UPLOADING →) PENDING → RUNNING → COMPLETED/FAILED, 폐기 시 CANCELLED
+    # 동기 업로드는 바로 COMPLETED
+    status: Mapped[str] = mapped_column(
+        String(20), default="COMPLETED", server_default="COMPLETED", nullable=False
+    )
+    file_size: Mapped[int | None] = mapped_column(BigInteger)
+    processed_bytes: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+    # 마지막으로 커밋된 파일 행 번호 (재개 시 이 행 다음부터 처리)
+    last_committed_row: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    error_message: Mapped[str | None] = mapped_column(String(255))
+    # 업로드 파일이 저장된 노드 (공유 스토리지가 아니면 이 노드에서만 처리/재개할 수 있다)
+    file_node: Mapped[str | None] = mapped_column(String(100))
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
 
 class CampaignRecipient(TimestampMixin, AuditMixin, Base):
@@ -164,6 +181,13 @@ class CampaignRecipient(TimestampMixin, AuditMixin, Base):
     __table_args__ = (
         Index("ix_recipient_campaign_status", "campaign_id", "status"),
         Index("ix_recipient_phone_hash", "phone_hash"),
+        Index(
+            "uq_recipient_campaign_phone",
+            "campaign_id",
+            "phone_hash",
+            unique=True,
+            mysql_length={"phone_hash": 32},
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
@@ -172,8 +196,11 @@ class CampaignRecipient(TimestampMixin, AuditMixin, Base):
     enc_phone: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     phone_hash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     enc_name: Mapped[bytes | None] = mapped_column(LargeBinary)
+    # 발송 흐름: VALIDATED → DISPATCHING(워커 점유) → QUEUED, 발송 준비 실패 시 DISPATCH_FAILED
     status: Mapped[str] = mapped_column(String(20), default="PENDING", nullable=False)
     validation_error: Mapped[str | None] = mapped_column(String(255))
+    # DISPATCHING 수신자를 점유한 워커의 토큰
+    dispatch_claim: Mapped[str | None] = mapped_column(String(32))
 
 
 class RecipientHistory(TimestampMixin, AuditMixin, Base):
@@ -198,6 +225,24 @@ class RecipientValidationError(TimestampMixin, Base):
     reason: Mapped[str] = mapped_column(String(255), nullable=False)
 
 
+class PhoneSuppression(TimestampMixin, AuditMixin, Base):
+    """
+    발송 제외(수신 거부) 번호. 캠페인과 무관하게 전역으로 적용되며 phone_hash로만 보관한다.
+    """
+
+    __tablename__ = "phone_suppressions"
+    __table_args__ = (
+        Index("uq_suppression_phone_hash", "phone_hash", unique=True, mysql_length=32),
+        # 블룸 필터 갱신 시 늦게 커밋된 행을 다시 읽는 구간 조회용
+        Index("ix_suppression_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    phone_hash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    reason: Mapped[str | None] = mapped_column(String(50))
+    source: Mapped[str | None] = mapped_column(String(50))
+
+
 class CouponProduct(TimestampMixin, AuditMixin, Base):
     __tablename__ = "coupon_products"
 
@@ -226,21 +271,45 @@ class ProductSyncLog(TimestampMixin, Base):
 class CouponIssue(TimestampMixin, AuditMixin, Base):
     __tablename__ = "coupon_issues"
     __table_args__ = (
+        UniqueConstraint("order_id", "order_seq", name="uq_issue_order_seq"),
         Index("ix_issue_campaign_status", "campaign_id", "status"),
         Index("ix_issue_order_id", "order_id"),
+        Index("ix_issue_barcode_hash", "barcode_hash", mysql_length=32),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     campaign_id: Mapped[int] = mapped_column(ForeignKey("campaigns.id"))
     recipient_id: Mapped[int] = mapped_column(ForeignKey("campaign_recipients.id"))
-    order_id: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    order_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    order_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     barcode_enc: Mapped[bytes | None] = mapped_column(LargeBinary)
+    barcode_hash: Mapped[bytes | None] = mapped_column(LargeBinary)
     valid_end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     status: Mapped[str] = mapped_column(String(20), nullable=False)
     vendor_payload: Mapped[dict | None] = mapped_column(JSON)
     issued_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
 
+class CouponIssueLedger(TimestampMixin, Base):
+    __tablename__ = "coupon_issue_ledger"
+    __table_args__ = (Index("ix_issue_ledger_campaign_status", "campaign_id", "status"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    tr_id: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    campaign_id: Mapped[int] = mapped_column(ForeignKey("campaigns.id"))
+    recipient_id: Mapped[int] = mapped_column(ForeignKey("campaign_recipients.id"))
+    goods_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    create_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="PENDING")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    order_id: Mapped[str | None] = mapped_column(String(50))
+    result_payload: Mapped[dict | None] = mapped_column(JSON)
+    error_code: Mapped[str | None] = mapped_column(String(20))
+    error_message: Mapped[str | None] = mapped_column(Text)
+    requested_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
 class CouponStatusHistory(TimestampMixin, AuditMixin, Base):
     __tablename__ = "coupon_status_history"
 
@@ -254,9 +323,16 @@ class CouponStatusHistory(TimestampMixin, AuditMixin, Base):
 
 class CouponExchangeDetail(TimestampMixin, AuditMixin, Base):
     __tablename__ = "coupon_exchange_details"
+    __table_args__ = (
+        UniqueConstraint(
+            "coupon_issue_id", "exchange_num", "exchange_status", name="uq_exchange_event"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     coupon_issue_id: Mapped[int] = mapped_column(ForeignKey("coupon_issues.id", ondelete="CASCADE"))
+    exchange_num: Mapped[str | None] = mapped_column(String(30))
+    exchange_status: Mapped[str | None] = mapped_column(String(3))
     exchange_store: Mapped[str | None] = mapped_column(String(100))
     exchange_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     cancel_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -316,6 +392,34 @@ class MmsJob(TimestampMixin, AuditMixin, Base):
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
 
 
+class DispatchJob(TimestampMixin, AuditMixin, Base):
+    """
+    캠페인 발송 작업. 요청은 바로 반환하고 작업 풀에서 수신자를 청크 단위로 처리한다.
+    """
+
+    __tablename__ = "dispatch_jobs"
+    __table_args__ = (Index("ix_dispatch_job_campaign_status", "campaign_id", "status"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    campaign_id: Mapped[int] = mapped_column(ForeignKey("campaigns.id"))
+    # PENDING → RUNNING → COMPLETED/FAILED, 취소 요청 시 CANCELLED
+    status: Mapped[str] = mapped_column(String(20), default="PENDING", nullable=False)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    processed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    enqueued_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # 수신자별 실패 사유 (앞부분만 보관)
+    errors: Mapped[list | None] = mapped_column(JSON)
+    error_message: Mapped[str | None] = mapped_column(String(255))
+    requested_by: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
+    # 마지막으로 하트비트를 남긴 워커 프로세스(host:pid)와 시각. 끊긴 지 오래된 작업만 중단으로 본다.
+    owner_node: Mapped[str | None] = mapped_column(String(100))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
 class DispatchResult(TimestampMixin, Base):
     __tablename__ = "dispatch_results"
 
@@ -402,6 +506,7 @@ class SnapMsgView(TimestampMixin, Base):
 
 class CoufunStatusCache(TimestampMixin, Base):
     __tablename__ = "coufun_status_cache"
+    __table_args__ = (UniqueConstraint("coupon_issue_id", name="uq_status_cache_issue"),)
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     coupon_issue_id: Mapped[int] = mapped_column(ForeignKey("coupon_issues.id"))
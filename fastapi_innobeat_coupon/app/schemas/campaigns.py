@@ -24,6 +24,7 @@ class CampaignCreate(BaseModel):
     sender_number: str = Field(..., max_length=20)
     message_title: str = Field(..., max_length=120)
     message_body: str
+    coupons_per_recipient: int = Field(default=1, ge=1, le=10, description="수신자당 발급 쿠폰 수")
     product_items: List[CampaignProductItem] = Field(default_factory=list)
 
 
@@ -38,6 +39,7 @@ class CampaignRead(BaseModel):
     scheduled_at: datetime | None
     sender_number: str
     message_title: str
+    coupons_per_recipient: int = 1
     status: str
     sales_manager_name: str | None = None
     requester_name: str | None = None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 
 class DispatchError(BaseModel):
@@ -8,10 +10,38 @@ class DispatchError(BaseModel):
     reason: str
 
 
-class DispatchSummary(BaseModel):
-    enqueued: int
-    failed: int
-    errors: list[DispatchError]
+class DispatchJobRead(BaseModel):
+    model_config = {"from_attributes": True}
+
+    job_id: int = Field(..., validation_alias="id")
+    campaign_id: int
+    status: str
+    total_count: int = 0
+    processed_count: int = 0
+    enqueued_count: int = 0
+    failed_count: int = 0
+    cancel_requested: bool = False
+    errors: list[DispatchError] = Field(default_factory=list)
+    error_message: str | None = None
+    owner_node: str | None = None
+    heartbeat_at: datetime | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @field_validator("errors", mode="before")
+    @classmethod
+    def _default_errors(cls, value):
+        return value or []
+
+    @computed_field
+    @property
+    def progress_percent(self) -> float:
+        if self.status == "COMPLETED":
+            return 100.0
+        if not self.total_count:
+            return 0.0
+        return round(min(self.processed_count / self.total_count, 1.0) * 100, 1)
 
 
 class DispatchSyncSummary(BaseModel):
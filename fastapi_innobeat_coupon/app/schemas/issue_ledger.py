@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class IssueLedgerRead(BaseModel):
+    model_config = {"from_attributes": True}
+
+    id: int
+    tr_id: str
+    campaign_id: int
+    recipient_id: int
+    goods_id: str
+    create_count: int
+    status: str
+    attempts: int
+    order_id: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+    requested_at: datetime | None = None
+    completed_at: datetime | None = None
+
+
+class IssueLedgerPage(BaseModel):
+    total: int
+    items: list[IssueLedgerRead]
+    next_cursor: int | None
+
+
+class IssueLedgerResolveRequest(BaseModel):
+    barcodes: list[str] = Field(..., min_length=1, max_length=10)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class SuppressionRequest(BaseModel):
+    phones: list[str] = Field(..., min_length=1, max_length=10_000)
+    reason: str | None = Field(default=None, max_length=50)
+
+
+class SuppressionDeleteRequest(BaseModel):
+    phones: list[str] = Field(..., min_length=1, max_length=10_000)
+
+
+class SuppressionImportSummary(BaseModel):
+    imported: int = Field(..., ge=0)
+    duplicates: int = Field(..., ge=0)
+    invalid: int = Field(..., ge=0)
+
+    model_config = {"from_attributes": True}
+
+
+class SuppressionDeleteSummary(BaseModel):
+    removed: int = Field(..., ge=0)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class RecipientUploadSummary(BaseModel):
@@ -11,13 +11,71 @@ class RecipientUploadSummary(BaseModel):
     invalid_count: int = Field(..., ge=0)
     batch_id: int | None = None
     errors: list[str] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+
+class RecipientUploadJobRead(BaseModel):
+    model_config = {"from_attributes": True}
+
+    batch_id: int = Field(..., validation_alias="id")
+    status: str
+    original_filename: str | None = None
+    file_size: int | None = None
+    processed_bytes: int = 0
+    uploaded_total: int = Field(0, validation_alias="total_count")
+    valid_count: int = 0
+    invalid_count: int = 0
+    last_committed_row: int = 0
+    error_message: str | None = None
+    file_node: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @computed_field
+    @property
+    def progress_percent(self) -> float:
+        if self.status == "COMPLETED":
+            return 100.0
+        if not self.file_size:
+            return 0.0
+        return round(min(self.processed_bytes / self.file_size, 1.0) * 100, 1)
+
+
+class UploadPartRead(BaseModel):
+    model_config = {"from_attributes": True}
+
+    part_number: int
+    size: int
+
+
+class RecipientUploadSessionRead(RecipientUploadJobRead):
+    parts: list[UploadPartRead] = Field(default_factory=list)
 
 
 class RecipientValidationErrorRead(BaseModel):
     model_config = {"from_attributes": True}
 
+    id: int
+    batch_id: int
     row_number: int
     raw_phone: str | None
     raw_name: str | None
     reason: str
     created_at: datetime
+
+
+class RecipientValidationErrorFilters(BaseModel):
+    batch_id: int | None = Field(default=None, ge=1)
+    cursor: int | None = Field(default=None, ge=1)
+    limit: int = Field(default=100, ge=1, le=1000)
+
+
+class RecipientValidationErrorPage(BaseModel):
+    items: list[RecipientValidationErrorRead]
+    next_cursor: int | None
+
+
+class RecipientValidationErrorSummary(BaseModel):
+    reason: str
+    count: int
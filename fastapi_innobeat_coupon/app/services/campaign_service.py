@@ -49,6 +49,7 @@ def create_campaign(db: Session, payload: CampaignCreate, actor: str | None = No
         sender_number=payload.sender_number,
         message_title=payload.message_title,
         message_body=payload.message_body,
+        coupons_per_recipient=payload.coupons_per_recipient,
         sales_manager_name=payload.sales_manager_name,
         requester_name_enc=encrypt_value(payload.requester_name),
         requester_phone_enc=encrypt_value(normalized_phone)
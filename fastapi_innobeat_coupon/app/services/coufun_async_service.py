@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, TypeVar
+
+import httpx
+
+from app.core.config import settings
+from app.core.rate_limit import PRIORITY_BULK, bulk_priority, current_priority
+from app.services import coufun_service
+from app.services.coufun_service import (
+    CoufunAPIError,
+    CoufunGoodsResponse,
+    CoufunIssueResult,
+    CoufunStatus,
+)
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CoufunIssueRequest:
+    goods_id: str
+    tr_id: str
+    create_count: int = 1
+
+
+class AsyncCoufunClient:
+    """
+    asyncio 기반 COUFUN 클라이언트.
+
+    동시 호출 수는 세마포어로 제한하고, 재시도 대기는 asyncio.sleep으로 처리해
+    이벤트 루프를 막지 않는다. 하나의 인스턴스는 하나의 이벤트 루프에서만 사용한다.
+    """
+
+    def __init__(self, *, concurrency: int | None = None) -> None:
+        limit = concurrency or settings.coufun_async_concurrency
+        self._semaphore = asyncio.Semaphore(max(limit, 1))
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> AsyncCoufunClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def issue_coupon(
+        self,
+        *,
+        goods_id: str,
+        tr_id: str,
+        create_count: int = 1,
+    ) -> CoufunIssueResult:
+        results = await self.issue_coupons(
+            goods_id=goods_id,
+            tr_id=tr_id,
+            create_count=create_count,
+        )
+        return results[0]
+
+    async def issue_coupons(
+        self,
+        *,
+        goods_id: str,
+        tr_id: str,
+        create_count: int = 1,
+    ) -> List[CoufunIssueResult]:
+        payload = coufun_service.build_issue_payload(
+            goods_id=goods_id,
+            tr_id=tr_id,
+            create_count=create_count,
+        )
+
+        async def _call() -> List[CoufunIssueResult]:
+            xml_text = await self._post("coufunCreate.do", payload, mock_key="issue")
+            return coufun_service.parse_issue_batch_response(
+                xml_text,
+                tr_id,
+                expected_count=create_count,
+            )
+
+        return await self._run_with_retry("coufunCreate", _call)
+
+    async def fetch_goods_list(self) -> CoufunGoodsResponse:
+        async def _call() -> CoufunGoodsResponse:
+            xml_text = await self._post("coufunProduct.do", {}, mock_key="goods")
+            return coufun_service.parse_goods_response(xml_text)
+
+        return await self._run_with_retry("coufunProduct", _call)
+
+    async def get_coupon_status(self, goods_id: str, barcode: str) -> CoufunStatus:
+        payload = {"GOODS_ID": goods_id, "BARCODE_NUM": barcode}
+
+        async def _call() -> CoufunStatus:
+            xml_text = await self._post("coufunPartAmountStatus.do", payload, mock_key="status")
+            return coufun_service.parse_status_response(xml_text, barcode)
+
+        return await self._run_with_retry("coufunPartAmountStatus", _call)
+
+    async def cancel_coupon(
+        self,
+        goods_id: str,
+        barcode: str,
+        reason: str | None = None,
+    ) -> CoufunStatus:
+        payload = {"GOODS_ID": goods_id, "BARCODE_NUM": barcode}
+        if reason:
+            payload["MEMO"] = reason
+
+        async def _call() -> CoufunStatus:
+            xml_text = await self._post("coufunPartCancel.do", payload, mock_key="cancel")
+            return coufun_service.parse_cancel_response(xml_text, barcode)
+
+        return await self._run_with_retry("coufunPartCancel", _call)
+
+    async def issue_many(
+        self,
+        requests: Sequence[CoufunIssueRequest],
+    ) -> List[List[CoufunIssueResult] | CoufunAPIError]:
+        """
+        여러 발급 요청을 동시에 처리한다. 결과는 요청 순서대로 반환하며,
+        요청별로 발급된 쿠폰 목록 또는 실패 시 CoufunAPIError 인스턴스를 채운다.
+        """
+
+        async def _issue(request: CoufunIssueRequest) -> List[CoufunIssueResult] | CoufunAPIError:
+            try:
+                return await self.issue_coupons(
+                    goods_id=request.goods_id,
+                    tr_id=request.tr_id,
+                    create_count=request.create_count,
+                )
+            except CoufunAPIError as exc:
+                return exc
+
+        return list(await asyncio.gather(*(_issue(request) for request in requests)))
+
+    async def _post(self, endpoint: str, payload: Dict[str, Any], *, mock_key: str) -> str:
+        if coufun_service.is_mock_mode():
+            return coufun_service.mock_response(mock_key, payload)
+
+        url, final_payload = coufun_service.build_request(endpoint, payload)
+        coufun_service.guard_call(endpoint)
+        limiter = coufun_service.get_rate_limiter(coufun_service.operation_name(endpoint))
+        await limiter.acquire_async()
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                response = await self._get_client().post(url, data=final_payload)
+            except httpx.HTTPError as exc:  # 네트워크/타임아웃 오류
+                coufun_service.record_latency(endpoint, time.perf_counter() - started, success=False)
+                raise CoufunAPIError(f"COUFUN API 호출 실패: {exc}", retryable=True) from exc
+        coufun_service.record_latency(
+            endpoint,
+            time.perf_counter() - started,
+            success=response.status_code < 400,
+        )
+        coufun_service.raise_for_http_status(response.status_code)
+        return response.text
+
+    async def _run_with_retry(self, operation: str, func: Callable[[], Awaitable[T]]) -> T:
+        attempt = 1
+        while True:
+            try:
+                result = await func()
+            except CoufunAPIError as exc:
+                coufun_service.record_call_outcome(operation, exc)
+                delay = coufun_service.next_retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            coufun_service.record_call_outcome(operation)
+            return result
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.coufun_timeout,
+                verify=True,
+                limits=httpx.Limits(
+                    max_connections=settings.coufun_max_connections,
+                    max_keepalive_connections=settings.coufun_max_keepalive_connections,
+                    keepalive_expiry=settings.coufun_keepalive_expiry,
+                ),
+                transport=coufun_service.simulator_transport(),
+            )
+        return self._client
+
+
+# --------------------------------------------------------------------------- #
+# 동기 코드(발송 워커, 스케줄러 작업)용 공용 루프
+
+
+class _ClientLoop:
+    """
+    전용 스레드에서 이벤트 루프 하나를 계속 돌리고, 그 루프에 묶인 AsyncCoufunClient 하나를
+    프로세스 전체가 공유한다. 호출마다 asyncio.run으로 루프와 커넥션 풀을 새로 만들지 않으므로
+    keep-alive 연결이 재사용되고, 세마포어가 프로세스 전체의 동시 호출 수를 제한한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: AsyncCoufunClient | None = None
+
+    def run(self, func: Callable[[AsyncCoufunClient], Awaitable[T]]) -> T:
+        """
+        공용 루프에서 func(client)를 실행하고 결과를 기다린다. 루프 스레드 밖에서만 호출한다.
+        호출 스레드의 우선순위(bulk_priority)는 루프 쪽 태스크에 그대로 넘긴다.
+        """
+        loop, client = self._ensure_started()
+        priority = current_priority()
+
+        async def _call() -> T:
+            if priority == PRIORITY_BULK:
+                with bulk_priority():
+                    return await func(client)
+            return await func(client)
+
+        return asyncio.run_coroutine_threadsafe(_call(), loop).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop, self._thread, self._client = None, None, None
+        if loop is None or thread is None or client is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+        except Exception:  # noqa: BLE001
+            logger.exception("COUFUN 비동기 클라이언트 종료 실패")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not thread.is_alive():
+                loop.close()
+
+    def _ensure_started(self) -> tuple[asyncio.AbstractEventLoop, AsyncCoufunClient]:
+        with self._lock:
+            if self._loop is None or self._client is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="coufun-async", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._client = AsyncCoufunClient()
+            return self._loop, self._client
+
+
+_client_loop = _ClientLoop()
+
+
+def issue_many_blocking(
+    requests: Sequence[CoufunIssueRequest],
+) -> List[List[CoufunIssueResult] | CoufunAPIError]:
+    """
+    이벤트 루프가 없는 스레드에서 공용 클라이언트로 동시 발급을 실행한다.
+    """
+    if not requests:
+        return []
+    return _client_loop.run(lambda client: client.issue_many(requests))
+
+
+def close_shared_client() -> None:
+    """
+    앱 종료 시 공용 클라이언트의 커넥션 풀과 루프 스레드를 정리한다.
+    """
+    _client_loop.close()
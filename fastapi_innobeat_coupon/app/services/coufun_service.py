@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 from xml.etree import ElementTree as ET
 
 import httpx
 
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.core.config import settings
+from app.core.metrics import LatencyRecorder
+from app.core.rate_limit import AdaptiveTokenBucket
 
 T = TypeVar("T")
 
 COUFUN_SUCCESS_CODES = {"00", "0000"}
 COUFUN_RETRYABLE_CODES = {"50", "95", "98", "99"}
+COUFUN_THROTTLE_CODES = {"09", "50"}
+CIRCUIT_OPEN_CODE = "CIRCUIT_OPEN"
+# 발급 응답의 바코드 수가 CREATE_CNT와 다름 (일부 쿠폰은 발급됐을 수 있음)
+ISSUE_COUNT_MISMATCH_CODE = "ISSUE_COUNT_MISMATCH"
 COUFUN_RESULT_CODE_MESSAGES = {
     "00": "처리 성공",
     "01": "IP 오류 (등록되지 않은 IP)",
@@ -60,8 +68,23 @@ COUFUN_STATUS_TO_INTERNAL = {
     "001": "USED",
     "100": "CANCELLED",
 }
+# 교환정보 푸시(교환정보 연동매뉴얼) 응답 코드
+EXCHANGE_RESULT_SUCCESS = "00"
+EXCHANGE_RESULT_IP_ERROR = "01"
+EXCHANGE_RESULT_BARCODE_ERROR = "03"
+EXCHANGE_RESULT_DUPLICATE = "04"
+EXCHANGE_RESULT_ERROR = "99"
 MAX_RETRY_ATTEMPTS = 3
 BASE_RETRY_DELAY = 0.4
+MAX_CREATE_COUNT = 10
+
+latency_recorder = LatencyRecorder()
+_rate_limiters: Dict[str, AdaptiveTokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
 
 
 class CoufunAPIError(RuntimeError):
@@ -104,12 +127,98 @@ class CoufunGoodsResponse:
     result_message: Optional[str]
 
 
+class CoufunGoodsStream:
+    """
+    coufunProduct.do 응답을 PRODUCT_INFO 단위로 증분 파싱해 흘려보내는 반복자.
+
+    완료된 요소는 즉시 트리에서 떼어내므로 상품 수와 무관하게 메모리 사용량이 일정하다.
+    result_code/result_message는 반복이 시작된 뒤(헤더 파싱 후) 채워진다.
+    """
+
+    ITEM_TAGS = {"PRODUCT_INFO", "GOODS"}
+
+    def __init__(self, open_chunks: Callable[[], Iterable[str]], *, retry: bool = True) -> None:
+        self._open_chunks = open_chunks
+        self._retry = retry
+        self.result_code: Optional[str] = None
+        self.result_message: Optional[str] = None
+        self.count = 0
+
+    def __iter__(self) -> Iterator[CoufunProduct]:
+        attempt = 1
+        while True:
+            yielded = False
+            try:
+                for product in self._parse(self._open_chunks()):
+                    yielded = True
+                    yield product
+                record_call_outcome("coufunProduct")
+                return
+            except CoufunAPIError as exc:
+                record_call_outcome("coufunProduct", exc)
+                # 일부 상품을 이미 내보낸 뒤에는 중복 방지를 위해 재시도하지 않는다.
+                delay = next_retry_delay(exc, attempt) if self._retry and not yielded else None
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    def _parse(self, chunks: Iterable[str]) -> Iterator[CoufunProduct]:
+        self.count = 0
+        header: Dict[str, Any] = {}
+        checked = False
+        parser = ET.XMLPullParser(events=("start", "end"))
+        stack: List[ET.Element] = []
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == "start":
+                        stack.append(element)
+                        continue
+                    stack.pop()
+                    tag = element.tag.upper()
+                    if len(stack) == 1:
+                        header[tag] = (element.text or "").strip()
+                    if tag not in self.ITEM_TAGS:
+                        continue
+                    if not checked:
+                        self._check_header(header)
+                        checked = True
+                    data = {child.tag.upper(): (child.text or "").strip() for child in element}
+                    element.clear()
+                    if stack:
+                        stack[-1].remove(element)
+                    product = _build_product(data)
+                    if product is not None:
+                        self.count += 1
+                        yield product
+            parser.close()
+        except ET.ParseError as exc:
+            raise CoufunAPIError(f"COUFUN 응답 XML 파싱 실패: {exc}") from exc
+
+        if not checked:
+            self._check_header(header)
+        if not self.count and is_mock_mode():
+            self.result_code = "00"
+            self.result_message = "MOCK"
+            for product in _mock_goods_list():
+                self.count += 1
+                yield product
+
+    def _check_header(self, header: Dict[str, Any]) -> None:
+        _ensure_success(header, "coufunProduct", raw_payload=header)
+        self.result_code = _normalize_code(header.get("RESULT_CODE"))
+        self.result_message = header.get("RESULT_MSG")
+
+
 @dataclass
 class CoufunIssueResult:
     order_id: str
     barcode: str
     valid_end_date: Optional[datetime]
     raw_payload: Dict[str, Any]
+    order_seq: int = 1
 
 
 @dataclass
@@ -128,88 +237,69 @@ class CoufunStatus:
     raw_payload: Dict[str, Any]
 
 
-def issue_coupon(*, goods_id: str, tr_id: str, create_count: int = 1) -> CoufunIssueResult:
-    payload = {
-        "GOODS_ID": goods_id,
-        "CREATE_CNT": str(create_count),
-        "TR_ID": tr_id,
-    }
+@dataclass
+class CoufunExchangeNotice:
+    barcode: str
+    exchange_num: str
+    status_code: str
+    status: str
+    exchanged_at: Optional[datetime]
+    branch_name: Optional[str]
+    branch_code: Optional[str]
+    barcode_type: Optional[str]
+    price: Optional[float]
+    balance: Optional[float]
+
+    def to_status(self) -> CoufunStatus:
+        cancelled = self.status == "CANCELLED"
+        return CoufunStatus(
+            barcode=self.barcode,
+            status=self.status,
+            remain_amount=self.balance,
+            coupon_type=self.barcode_type,
+            status_code=self.status_code,
+            status_label=COUFUN_STATUS_LABELS.get(self.status_code),
+            total_amount=None,
+            order_date=None,
+            valid_end_date=None,
+            exchanged_at=None if cancelled else self.exchanged_at,
+            cancelled_at=self.exchanged_at if cancelled else None,
+            raw_payload={},
+        )
 
-    def _call() -> CoufunIssueResult:
-        xml_text = _post("coufunCreate.do", payload, mock_key="issue")
-        parsed = _parse_simple_map(xml_text)
-        _ensure_success(parsed, "coufunCreate", raw_payload=parsed)
 
-        barcode = parsed.get("BARCODE_NUM") or parsed.get("barcodeNum")
-        order_id = parsed.get("ORDER_ID") or parsed.get("orderId") or tr_id
-        valid_end = parsed.get("VALID_DATE") or parsed.get("VALID_END_DATE")
-        valid_dt = _parse_datetime(valid_end)
+def issue_coupon(*, goods_id: str, tr_id: str, create_count: int = 1) -> CoufunIssueResult:
+    return issue_coupons(goods_id=goods_id, tr_id=tr_id, create_count=create_count)[0]
 
-        if not barcode:
-            raise CoufunAPIError("COUFUN 응답에 BARCODE_NUM이 없습니다.", payload=parsed)
 
-        return CoufunIssueResult(
-            order_id=order_id,
-            barcode=barcode,
-            valid_end_date=valid_dt,
-            raw_payload=parsed,
-        )
+def issue_coupons(*, goods_id: str, tr_id: str, create_count: int = 1) -> List[CoufunIssueResult]:
+    """
+    CREATE_CNT(최대 10)만큼 쿠폰을 한 번의 호출로 발급하고 ORDER_INFO 순서대로 반환한다.
+    """
+    payload = build_issue_payload(goods_id=goods_id, tr_id=tr_id, create_count=create_count)
+
+    def _call() -> List[CoufunIssueResult]:
+        xml_text = _post("coufunCreate.do", payload, mock_key="issue")
+        return parse_issue_batch_response(xml_text, tr_id, expected_count=create_count)
 
     return _run_with_retry("coufunCreate", _call)
 
 
 def fetch_goods_list() -> CoufunGoodsResponse:
-    def _call() -> CoufunGoodsResponse:
-        xml_text = _post("coufunProduct.do", {}, mock_key="goods")
-        root = _load_xml(xml_text)
-        _ensure_success(root, "coufunProduct")
-
-        products: List[CoufunProduct] = []
-        items = root.findall(".//PRODUCT_INFO")
-        if not items:
-            items = root.findall(".//GOODS")
-        for item in items:
-            data = {child.tag.upper(): (child.text or "").strip() for child in item}
-            goods_id = data.get("GOODS_ID")
-            if not goods_id:
-                continue
-            valid_end_type = data.get("VALID_END_TYPE")
-            valid_end_date = _parse_datetime(data.get("VALID_END_DATE"))
-            valid_days = _to_int(data.get("VALID_DAYS"))
-            if valid_days is None and valid_end_type == "D":
-                valid_days = _to_int(data.get("VALID_END_DATE"))
-            products.append(
-                CoufunProduct(
-                    goods_id=goods_id,
-                    name=data.get("GOODS_NM") or data.get("GOODS_NAME") or "",
-                    face_value=_to_float(data.get("FACE_VALUE") or data.get("GOODS_ORI_PRICE")),
-                    purchase_price=_to_float(data.get("SALE_AMT") or data.get("GOODS_PRICE")),
-                    valid_days=valid_days,
-                    status=data.get("GOODS_STATUS") or "AVAILABLE",
-                    category_id=data.get("CAT_ID"),
-                    valid_end_type=valid_end_type,
-                    valid_end_date=valid_end_date,
-                    send_type=data.get("SEND_TYPE"),
-                    image_path=data.get("IMAGE_PATH_B") or data.get("IMAGE_PATH_M"),
-                    raw_payload=data,
-                )
-            )
+    stream = stream_goods_list()
+    products = list(stream)
+    return CoufunGoodsResponse(
+        products=products,
+        result_code=stream.result_code,
+        result_message=stream.result_message,
+    )
 
-        if not products and settings.coufun_mock_mode:
-            mock_products = _mock_goods_list()
-            return CoufunGoodsResponse(
-                products=mock_products,
-                result_code="00",
-                result_message="MOCK",
-            )
 
-        return CoufunGoodsResponse(
-            products=products,
-            result_code=_normalize_code(_extract_value(root, "RESULT_CODE")),
-            result_message=_extract_value(root, "RESULT_MSG"),
-        )
-
-    return _run_with_retry("coufunProduct", _call)
+def stream_goods_list() -> CoufunGoodsStream:
+    """
+    상품 목록을 응답 수신과 동시에 하나씩 파싱한다. 대량 동기화는 이 함수를 사용한다.
+    """
+    return CoufunGoodsStream(lambda: _post_stream("coufunProduct.do", {}, mock_key="goods"))
 
 
 def get_coupon_status(goods_id: str, barcode: str) -> CoufunStatus:
@@ -217,27 +307,7 @@ def get_coupon_status(goods_id: str, barcode: str) -> CoufunStatus:
 
     def _call() -> CoufunStatus:
         xml_text = _post("coufunPartAmountStatus.do", payload, mock_key="status")
-        parsed = _parse_simple_map(xml_text)
-        _ensure_success(parsed, "coufunPartAmountStatus", raw_payload=parsed)
-
-        status_code = _normalize_code(parsed.get("RESULT_STATUS") or parsed.get("STATUS"))
-        status_label = COUFUN_STATUS_LABELS.get(status_code)
-        internal_status = COUFUN_STATUS_TO_INTERNAL.get(status_code, status_code or "UNKNOWN")
-
-        return CoufunStatus(
-            barcode=barcode,
-            status=internal_status,
-            remain_amount=_to_float(parsed.get("REMAIN_AMOUNT")),
-            coupon_type=parsed.get("COUPON_TYPE"),
-            status_code=status_code,
-            status_label=status_label,
-            total_amount=_to_float(parsed.get("TOTAL_AMOUNT")),
-            order_date=_parse_datetime(parsed.get("ORDER_DATE")),
-            valid_end_date=_parse_datetime(parsed.get("VALID_END_DATE")),
-            exchanged_at=_parse_datetime(parsed.get("EXCHANGE_DATE")),
-            cancelled_at=_parse_datetime(parsed.get("CANCEL_DATE")),
-            raw_payload=parsed,
-        )
+        return parse_status_response(xml_text, barcode)
 
     return _run_with_retry("coufunPartAmountStatus", _call)
 
@@ -249,56 +319,462 @@ def cancel_coupon(goods_id: str, barcode: str, reason: str | None = None) -> Cou
 
     def _call() -> CoufunStatus:
         xml_text = _post("coufunPartCancel.do", payload, mock_key="cancel")
-        parsed = _parse_simple_map(xml_text)
-        _ensure_success(parsed, "coufunPartCancel", raw_payload=parsed)
-        return CoufunStatus(
-            barcode=barcode,
-            status="CANCELLED",
-            remain_amount=None,
-            coupon_type=None,
-            status_code="100",
-            status_label=COUFUN_STATUS_LABELS.get("100"),
-            total_amount=None,
-            order_date=None,
-            valid_end_date=None,
-            exchanged_at=None,
-            cancelled_at=_parse_datetime(parsed.get("CANCEL_DATE")),
-            raw_payload=parsed,
-        )
+        return parse_cancel_response(xml_text, barcode)
 
     return _run_with_retry("coufunPartCancel", _call)
 
 
+# --------------------------------------------------------------------------- #
+# Response parsers (sync/async 클라이언트 공용)
+
+def build_issue_payload(*, goods_id: str, tr_id: str, create_count: int) -> Dict[str, Any]:
+    if not 1 <= create_count <= MAX_CREATE_COUNT:
+        raise ValueError(f"CREATE_CNT는 1~{MAX_CREATE_COUNT} 사이여야 합니다.")
+    return {
+        "GOODS_ID": goods_id,
+        "CREATE_CNT": str(create_count),
+        "TR_ID": tr_id,
+    }
+
+
+def parse_issue_response(xml_text: str, tr_id: str) -> CoufunIssueResult:
+    return parse_issue_batch_response(xml_text, tr_id, expected_count=1)[0]
+
+
+def parse_issue_batch_response(
+    xml_text: str,
+    tr_id: str,
+    *,
+    expected_count: int | None = None,
+) -> List[CoufunIssueResult]:
+    """
+    반복되는 ORDER_INFO 블록을 각각 CoufunIssueResult로 변환한다.
+    ORDER_ID/유효기간은 응답 헤더 값을 모든 쿠폰이 공유한다.
+
+    expected_count(CREATE_CNT)를 주면 바코드가 있는 블록 수가 이와 다를 때
+    ISSUE_COUNT_MISMATCH_CODE 오류를 낸다. 어느 순번이 빠졌는지는 payload의 MISSING_SEQ에 담는다.
+    """
+    root = _load_xml(xml_text)
+    header = {
+        child.tag.upper(): (child.text or "").strip()
+        for child in root
+        if child.tag.upper() != "ORDER_INFO"
+    }
+    _ensure_success(header, "coufunCreate", raw_payload=header)
+
+    order_id = header.get("ORDER_ID") or header.get("ORDERID") or tr_id
+    valid_dt = _parse_datetime(header.get("VALID_DATE") or header.get("VALID_END_DATE"))
+
+    blocks = [
+        {child.tag.upper(): (child.text or "").strip() for child in item}
+        for item in root.iter("ORDER_INFO")
+    ]
+    if not blocks and header.get("BARCODE_NUM"):
+        blocks = [{"BARCODE_NUM": header["BARCODE_NUM"]}]
+
+    results: List[CoufunIssueResult] = []
+    for seq, block in enumerate(blocks, start=1):
+        barcode = block.get("BARCODE_NUM")
+        if not barcode:
+            continue
+        results.append(
+            CoufunIssueResult(
+                order_id=order_id,
+                barcode=barcode,
+                valid_end_date=valid_dt,
+                raw_payload={**header, **block},
+                order_seq=seq,
+            )
+        )
+
+    if not results:
+        raise CoufunAPIError("COUFUN 응답에 BARCODE_NUM이 없습니다.", payload=header)
+    if expected_count is not None and len(results) != expected_count:
+        received = {result.order_seq for result in results}
+        missing = [seq for seq in range(1, max(expected_count, len(blocks)) + 1) if seq not in received]
+        raise CoufunAPIError(
+            f"COUFUN 발급 응답 바코드 수가 CREATE_CNT와 다릅니다. "
+            f"(요청 {expected_count}건, 수신 {len(results)}건, 누락 순번 {missing})",
+            code=ISSUE_COUNT_MISMATCH_CODE,
+            payload={**header, "MISSING_SEQ": missing},
+        )
+    return results
+
+
+def parse_goods_response(xml_text: str) -> CoufunGoodsResponse:
+    stream = CoufunGoodsStream(lambda: [xml_text], retry=False)
+    products = list(stream)
+    return CoufunGoodsResponse(
+        products=products,
+        result_code=stream.result_code,
+        result_message=stream.result_message,
+    )
+
+
+def _build_product(data: Dict[str, Any]) -> Optional[CoufunProduct]:
+    goods_id = data.get("GOODS_ID")
+    if not goods_id:
+        return None
+    valid_end_type = data.get("VALID_END_TYPE")
+    valid_end_date = _parse_datetime(data.get("VALID_END_DATE"))
+    valid_days = _to_int(data.get("VALID_DAYS"))
+    if valid_days is None and valid_end_type == "D":
+        valid_days = _to_int(data.get("VALID_END_DATE"))
+    return CoufunProduct(
+        goods_id=goods_id,
+        name=data.get("GOODS_NM") or data.get("GOODS_NAME") or "",
+        face_value=_to_float(data.get("FACE_VALUE") or data.get("GOODS_ORI_PRICE")),
+        purchase_price=_to_float(data.get("SALE_AMT") or data.get("GOODS_PRICE")),
+        valid_days=valid_days,
+        status=data.get("GOODS_STATUS") or "AVAILABLE",
+        category_id=data.get("CAT_ID"),
+        valid_end_type=valid_end_type,
+        valid_end_date=valid_end_date,
+        send_type=data.get("SEND_TYPE"),
+        image_path=data.get("IMAGE_PATH_B") or data.get("IMAGE_PATH_M"),
+        raw_payload=data,
+    )
+
+
+def parse_status_response(xml_text: str, barcode: str) -> CoufunStatus:
+    parsed = _parse_simple_map(xml_text)
+    _ensure_success(parsed, "coufunPartAmountStatus", raw_payload=parsed)
+
+    status_code = _normalize_code(parsed.get("RESULT_STATUS") or parsed.get("STATUS"))
+    status_label = COUFUN_STATUS_LABELS.get(status_code)
+    internal_status = COUFUN_STATUS_TO_INTERNAL.get(status_code, status_code or "UNKNOWN")
+
+    return CoufunStatus(
+        barcode=barcode,
+        status=internal_status,
+        remain_amount=_to_float(parsed.get("REMAIN_AMOUNT")),
+        coupon_type=parsed.get("COUPON_TYPE"),
+        status_code=status_code,
+        status_label=status_label,
+        total_amount=_to_float(parsed.get("TOTAL_AMOUNT")),
+        order_date=_parse_datetime(parsed.get("ORDER_DATE")),
+        valid_end_date=_parse_datetime(parsed.get("VALID_END_DATE")),
+        exchanged_at=_parse_datetime(parsed.get("EXCHANGE_DATE")),
+        cancelled_at=_parse_datetime(parsed.get("CANCEL_DATE")),
+        raw_payload=parsed,
+    )
+
+
+def parse_cancel_response(xml_text: str, barcode: str) -> CoufunStatus:
+    parsed = _parse_simple_map(xml_text)
+    _ensure_success(parsed, "coufunPartCancel", raw_payload=parsed)
+    return CoufunStatus(
+        barcode=barcode,
+        status="CANCELLED",
+        remain_amount=None,
+        coupon_type=None,
+        status_code="100",
+        status_label=COUFUN_STATUS_LABELS.get("100"),
+        total_amount=None,
+        order_date=None,
+        valid_end_date=None,
+        exchanged_at=None,
+        cancelled_at=_parse_datetime(parsed.get("CANCEL_DATE")),
+        raw_payload=parsed,
+    )
+
+
+def parse_exchange_notice(params: Dict[str, Any]) -> CoufunExchangeNotice:
+    """
+    COUFUN이 사용/사용취소 시 POST로 전달하는 교환정보 파라미터를 해석한다.
+    금액권(AMOUNT)은 잔액이 남아 있으면 재사용 가능(REUSABLE) 상태로 본다.
+    """
+    data = {key.upper(): (str(value).strip() if value is not None else "") for key, value in params.items()}
+    barcode = data.get("BARCODE_NUM")
+    exchange_num = data.get("EXCHANGE_NUM")
+    status_code = _normalize_code(data.get("STATUS"))
+    if not barcode or not exchange_num:
+        raise ValueError("BARCODE_NUM/EXCHANGE_NUM 값이 없습니다.")
+    if status_code not in COUFUN_STATUS_TO_INTERNAL:
+        raise ValueError(f"알 수 없는 STATUS 값입니다: {data.get('STATUS')}")
+
+    barcode_type = data.get("BARCODE_TYPE") or None
+    balance = _to_float(data.get("BALANCE"))
+    status = COUFUN_STATUS_TO_INTERNAL[status_code]
+    if status == "USED" and barcode_type == "AMOUNT" and balance:
+        status = "REUSABLE"
+    return CoufunExchangeNotice(
+        barcode=barcode,
+        exchange_num=exchange_num,
+        status_code=status_code,
+        status=status,
+        exchanged_at=_parse_datetime(data.get("EXCHANGE_DATE")),
+        branch_name=data.get("BRANCH_NAME") or None,
+        branch_code=data.get("BRANCH_CODE") or None,
+        barcode_type=barcode_type,
+        price=_to_float(data.get("PRICE")),
+        balance=balance,
+    )
+
+
+def build_exchange_reply(code: str, message: str, exchange_id: Optional[str] = None) -> bytes:
+    """
+    교환정보 수신 결과 XML(EUC-KR). 메시지는 영문/숫자만 사용한다.
+    """
+    root = ET.Element("COUPONEXCHANGE")
+    ET.SubElement(root, "RESULTCODE").text = code
+    ET.SubElement(root, "RESULTMSG").text = message
+    if exchange_id:
+        ET.SubElement(root, "EXCHANGE_ID").text = exchange_id
+    return ET.tostring(root, encoding="EUC-KR", xml_declaration=True)
+
+# --------------------------------------------------------------------------- #
+# HTTP client lifecycle
+
+def init_http_client() -> None:
+    """
+    앱 기동 시 COUFUN 커넥션 풀을 미리 생성한다.
+    """
+    if is_mock_mode():
+        return
+    _get_http_client()
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+def get_latency_stats() -> Dict[str, Dict[str, Any]]:
+    return latency_recorder.snapshot()
+
+
+def record_latency(endpoint: str, elapsed: float, *, success: bool) -> None:
+    """
+    지연 시간을 토큰 버킷/서킷 브레이커와 같은 키(operation_name, 예: coufunCreate)로 기록한다.
+    """
+    latency_recorder.record(operation_name(endpoint), elapsed, success=success)
+
+
+def _get_http_client() -> httpx.Client:
+    global _http_client
+    if _http_client is not None:
+        return _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=settings.coufun_timeout,
+                verify=True,
+                limits=_build_http_limits(),
+                transport=simulator_transport(),
+            )
+        return _http_client
+
+
+def simulator_transport() -> Any:
+    """
+    COUFUN_SIMULATOR_ENABLED면 네트워크 대신 프로세스 내 시뮬레이터로 보내는 전송 계층을 돌려준다.
+    """
+    if not settings.coufun_simulator_enabled:
+        return None
+    from app.services import coufun_simulator
+
+    return coufun_simulator.get_transport()
+
+
+def _build_http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.coufun_max_connections,
+        max_keepalive_connections=settings.coufun_max_keepalive_connections,
+        keepalive_expiry=settings.coufun_keepalive_expiry,
+    )
+
+
+# --------------------------------------------------------------------------- #
+# Rate limiting (엔드포인트별 공유 예산)
+
+def get_rate_limiter(operation: str) -> AdaptiveTokenBucket:
+    """
+    프로세스 내 모든 호출자(발송, CS, 동기화 작업)가 공유하는 엔드포인트별 토큰 버킷.
+    버킷은 프로세스 단위이므로 COUFUN_RATE_LIMIT_* 예산을 COUFUN_RATE_LIMIT_PROCESSES
+    (uvicorn 워커 수 x 노드 수)로 나눠 각 프로세스에 배정한다.
+    """
+    limiter = _rate_limiters.get(operation)
+    if limiter is not None:
+        return limiter
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(operation)
+        if limiter is None:
+            processes = max(settings.coufun_rate_limit_processes, 1)
+            limiter = AdaptiveTokenBucket(
+                rate=settings.coufun_rate_limit_per_second / processes,
+                capacity=settings.coufun_rate_limit_burst / processes,
+                min_rate=settings.coufun_rate_limit_min_per_second / processes,
+                max_rate=settings.coufun_rate_limit_max_per_second / processes,
+                interactive_reserve=settings.coufun_rate_limit_interactive_reserve,
+                increase_step=settings.coufun_rate_limit_increase_step / processes,
+            )
+            _rate_limiters[operation] = limiter
+        return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    with _rate_limiters_lock:
+        limiters = dict(_rate_limiters)
+    return {operation: limiter.snapshot() for operation, limiter in limiters.items()}
+
+
+def record_call_outcome(operation: str, exc: CoufunAPIError | None = None) -> None:
+    """
+    호출 결과를 토큰 버킷과 서킷 브레이커에 반영한다.
+
+    - 토큰 버킷: 성공이 이어지면 1초에 한 번씩 속도를 조금 올리고, 스로틀링 코드(09/50) 또는
+      코드 없는 재시도 오류(5xx/네트워크) 시 속도를 절반으로 낮춘다.
+    - 서킷 브레이커: 재시도 대상 오류(장애성)만 실패로 세고, 업무 오류는 정상 응답으로 본다.
+    """
+    if exc is not None and exc.code == CIRCUIT_OPEN_CODE:
+        return
+    limiter = get_rate_limiter(operation)
+    breaker = get_circuit_breaker(operation)
+    if exc is None:
+        limiter.on_success()
+        breaker.on_success()
+        return
+    if exc.code in COUFUN_THROTTLE_CODES or (exc.retryable and exc.code is None):
+        limiter.on_throttle()
+    if exc.retryable:
+        breaker.on_failure()
+    else:
+        breaker.on_success()
+
+
+# --------------------------------------------------------------------------- #
+# Circuit breaker (엔드포인트별)
+
+def get_circuit_breaker(operation: str) -> CircuitBreaker:
+    breaker = _circuit_breakers.get(operation)
+    if breaker is not None:
+        return breaker
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(operation)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                operation,
+                failure_threshold=settings.coufun_breaker_failure_threshold,
+                recovery_seconds=settings.coufun_breaker_recovery_seconds,
+            )
+            _circuit_breakers[operation] = breaker
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    with _circuit_breakers_lock:
+        breakers = dict(_circuit_breakers)
+    return {operation: breaker.snapshot() for operation, breaker in breakers.items()}
+
+
+def guard_call(endpoint: str) -> None:
+    """
+    서킷이 열려 있으면 네트워크 호출 없이 즉시 실패시킨다.
+    """
+    try:
+        get_circuit_breaker(operation_name(endpoint)).before_call()
+    except CircuitOpenError as exc:
+        raise CoufunAPIError(str(exc), code=CIRCUIT_OPEN_CODE, retryable=False) from exc
+
+
+def operation_name(endpoint: str) -> str:
+    return endpoint.removesuffix(".do")
+
+
 # --------------------------------------------------------------------------- #
 # Internal helpers
 
-def _post(endpoint: str, payload: Dict[str, Any], *, mock_key: str) -> str:
-    if settings.coufun_mock_mode or not settings.coufun_base_url:
-        return _mock_response(mock_key, payload)
+def is_mock_mode() -> bool:
+    if settings.coufun_simulator_enabled:
+        return False
+    return settings.coufun_mock_mode or not settings.coufun_base_url
+
 
-    if not settings.coufun_poc_id:
+def build_request(endpoint: str, payload: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+    """
+    POC_ID를 포함한 최종 요청 URL/폼 데이터를 만든다.
+    """
+    poc_id = settings.coufun_poc_id
+    base_url = settings.coufun_base_url
+    if settings.coufun_simulator_enabled:
+        from app.services.coufun_simulator import SIMULATOR_BASE_URL, SIMULATOR_POC_ID
+
+        poc_id = poc_id or SIMULATOR_POC_ID
+        base_url = base_url or SIMULATOR_BASE_URL
+    if not poc_id:
         raise CoufunAPIError("COUFUN_POC_ID 환경 변수가 설정되지 않았습니다.")
 
-    final_payload = {"POC_ID": settings.coufun_poc_id}
+    final_payload = {"POC_ID": poc_id}
     final_payload.update(payload)
-    url = f"{settings.coufun_base_url.rstrip('/')}/b2c_api/{endpoint}"
+    url = f"{base_url.rstrip('/')}/b2c_api/{endpoint}"
+    return url, final_payload
 
-    try:
-        with httpx.Client(timeout=settings.coufun_timeout, verify=True) as client:
-            response = client.post(url, data=final_payload)
-    except httpx.HTTPError as exc:  # 네트워크/타임아웃 오류
-        raise CoufunAPIError(f"COUFUN API 호출 실패: {exc}", retryable=True) from exc
 
-    if response.status_code >= 400:
-        retryable = response.status_code >= 500
+def raise_for_http_status(status_code: int) -> None:
+    if status_code >= 400:
+        retryable = status_code >= 500
         raise CoufunAPIError(
-            f"COUFUN API HTTP 오류: {response.status_code}",
+            f"COUFUN API HTTP 오류: {status_code}",
             retryable=retryable,
         )
 
+
+def next_retry_delay(exc: CoufunAPIError, attempt: int) -> Optional[float]:
+    """
+    재시도 대상이면 대기 시간(초)을, 아니면 None을 돌려준다.
+    """
+    if not exc.retryable or attempt >= MAX_RETRY_ATTEMPTS or is_mock_mode():
+        return None
+    return min(BASE_RETRY_DELAY * (2 ** (attempt - 1)), 2.0)
+
+
+def _post(endpoint: str, payload: Dict[str, Any], *, mock_key: str) -> str:
+    if is_mock_mode():
+        return mock_response(mock_key, payload)
+
+    url, final_payload = build_request(endpoint, payload)
+    guard_call(endpoint)
+    get_rate_limiter(operation_name(endpoint)).acquire()
+    started = time.perf_counter()
+    try:
+        response = _get_http_client().post(url, data=final_payload)
+    except httpx.HTTPError as exc:  # 네트워크/타임아웃 오류
+        record_latency(endpoint, time.perf_counter() - started, success=False)
+        raise CoufunAPIError(f"COUFUN API 호출 실패: {exc}", retryable=True) from exc
+    record_latency(endpoint, time.perf_counter() - started, success=response.status_code < 400)
+
+    raise_for_http_status(response.status_code)
     return response.text
 
 
+def _post_stream(endpoint: str, payload: Dict[str, Any], *, mock_key: str) -> Iterator[str]:
+    """
+    응답 본문을 디코딩된 텍스트 조각 단위로 돌려준다. 전체 본문을 메모리에 올리지 않는다.
+    """
+    if is_mock_mode():
+        yield mock_response(mock_key, payload)
+        return
+
+    url, final_payload = build_request(endpoint, payload)
+    guard_call(endpoint)
+    get_rate_limiter(operation_name(endpoint)).acquire()
+    started = time.perf_counter()
+    success = False
+    try:
+        with _get_http_client().stream("POST", url, data=final_payload) as response:
+            raise_for_http_status(response.status_code)
+            yield from response.iter_text()
+            success = True
+    except httpx.HTTPError as exc:  # 네트워크/타임아웃 오류
+        raise CoufunAPIError(f"COUFUN API 호출 실패: {exc}", retryable=True) from exc
+    finally:
+        record_latency(endpoint, time.perf_counter() - started, success=success)
+
+
 def _parse_simple_map(xml_text: str) -> Dict[str, Any]:
     root = _load_xml(xml_text)
     data: Dict[str, Any] = {}
@@ -347,16 +823,22 @@ def _to_int(value: Optional[str]) -> Optional[int]:
         return None
 
 
-def _mock_response(kind: str, payload: Dict[str, Any]) -> str:
+def mock_response(kind: str, payload: Dict[str, Any]) -> str:
     if kind == "issue":
-        barcode = f"{payload.get('GOODS_ID','GOOD')}-{datetime.now().strftime('%y%m%d')}"
+        barcode_prefix = f"{payload.get('GOODS_ID','GOOD')}-{datetime.now().strftime('%y%m%d')}"
+        create_count = _to_int(payload.get("CREATE_CNT")) or 1
+        order_info = "".join(
+            f"<ORDER_INFO><BARCODE_NUM>{barcode_prefix}-{seq}</BARCODE_NUM></ORDER_INFO>"
+            for seq in range(1, create_count + 1)
+        )
         return f"""
         <COUFUNCREATE>
             <RESULT_CODE>00</RESULT_CODE>
             <RESULT_MSG>SUCCESS</RESULT_MSG>
-            <BARCODE_NUM>{barcode}</BARCODE_NUM>
             <ORDER_ID>{payload.get('TR_ID')}</ORDER_ID>
-            <VALID_DATE>{(datetime.now(timezone.utc)+timedelta(days=60)).strftime('%Y%m%d')}</VALID_DATE>
+            <ORDER_CNT>{create_count}</ORDER_CNT>
+            <VALID_END_DATE>{(datetime.now(timezone.utc)+timedelta(days=60)).strftime('%Y%m%d')}</VALID_END_DATE>
+            {order_info}
         </COUFUNCREATE>
         """
     if kind == "goods":
@@ -464,14 +946,14 @@ def _run_with_retry(operation: str, func: Callable[[], T]) -> T:
     attempt = 1
     while True:
         try:
-            return func()
+            result = func()
         except CoufunAPIError as exc:
-            if (
-                not exc.retryable
-                or attempt >= MAX_RETRY_ATTEMPTS
-                or settings.coufun_mock_mode
-            ):
+            record_call_outcome(operation, exc)
+            delay = next_retry_delay(exc, attempt)
+            if delay is None:
                 raise
-            delay = min(BASE_RETRY_DELAY * (2 ** (attempt - 1)), 2.0)
             time.sleep(delay)
             attempt += 1
+            continue
+        record_call_outcome(operation)
+        return result
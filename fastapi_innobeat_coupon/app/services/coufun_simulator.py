@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qsl
+from xml.etree import ElementTree as ET
+
+import httpx
+
+from app.core.config import settings
+
+SIMULATOR_BASE_URL = "http://coufun-simulator.local"
+SIMULATOR_POC_ID = "SIMULATOR"
+_MEDIA_TYPE = "text/xml; charset=EUC-KR"
+SIMULATOR_ENDPOINTS = {
+    "coufunCreate",
+    "coufunProduct",
+    "coufunPartAmountStatus",
+    "coufunPartCancel",
+}
+MAX_CREATE_COUNT = 10
+RESULT_MESSAGES = {
+    "00": "SUCCESS",
+    "02": "POC_ID ERROR",
+    "12": "TR_ID DUPLICATE",
+    "16": "BARCODE ERROR",
+    "17": "ALREADY USED",
+    "18": "ALREADY CANCELLED",
+    "31": "GOODS_ID ERROR",
+    "50": "SYSTEM DELAY",
+    "99": "SYSTEM ERROR",
+}
+LATENCY_DISTRIBUTIONS = {"fixed", "uniform", "normal", "lognormal", "exponential"}
+
+
+@dataclass
+class LatencyModel:
+    """
+    응답 지연 분포 (단위 ms).
+
+    - fixed:MS / uniform:MIN:MAX / normal:MEAN:STDDEV
+    - lognormal:MEDIAN:SIGMA / exponential:MEAN
+    """
+
+    distribution: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyModel:
+        parts = [part.strip() for part in spec.split(":") if part.strip()]
+        if not parts or parts[0] not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {spec}")
+        try:
+            values = [float(part) for part in parts[1:3]]
+        except ValueError as exc:
+            raise ValueError(f"지연 분포 값이 올바르지 않습니다: {spec}") from exc
+        values += [0.0] * (2 - len(values))
+        return cls(distribution=parts[0], a=values[0], b=values[1])
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        지연 시간(초)을 하나 뽑는다. 음수는 0으로 자른다.
+        """
+        if self.distribution == "uniform":
+            value = rng.uniform(self.a, self.b)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.a, self.b)
+        elif self.distribution == "lognormal":
+            value = self.a * rng.lognormvariate(0.0, self.b) if self.a > 0 else 0.0
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1.0 / self.a) if self.a > 0 else 0.0
+        else:
+            value = self.a
+        return max(value, 0.0) / 1000.0
+
+
+@dataclass
+class SimulatorProfile:
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    endpoint_latency: Dict[str, LatencyModel] = field(default_factory=dict)
+    error_rates: Dict[str, float] = field(default_factory=dict)
+    http_error_rate: float = 0.0
+    goods_count: int = 50
+    seed: int | None = None
+
+    @classmethod
+    def from_settings(cls) -> SimulatorProfile:
+        return cls(
+            latency=LatencyModel.parse(settings.coufun_simulator_latency),
+            endpoint_latency=parse_endpoint_latency(settings.coufun_simulator_endpoint_latency),
+            error_rates=parse_error_rates(settings.coufun_simulator_error_rates),
+            http_error_rate=settings.coufun_simulator_http_error_rate,
+            goods_count=settings.coufun_simulator_goods_count,
+            seed=settings.coufun_simulator_seed,
+        )
+
+
+def parse_error_rates(spec: str | None) -> Dict[str, float]:
+    """
+    "50:0.03,99:0.02" 형식을 {결과코드: 확률}로 변환한다.
+    """
+    rates: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        code, _, rate = item.partition(":")
+        try:
+            rates[code.strip()] = float(rate)
+        except ValueError as exc:
+            raise ValueError(f"오류 비율 형식이 올바르지 않습니다: {item}") from exc
+    if sum(rates.values()) > 1.0:
+        raise ValueError("오류 비율 합계는 1을 넘을 수 없습니다.")
+    return rates
+
+
+def parse_endpoint_latency(spec: str | None) -> Dict[str, LatencyModel]:
+    """
+    "coufunCreate=lognormal:300:0.4;coufunProduct=fixed:800" 형식의 엔드포인트별 지연 설정.
+    """
+    models: Dict[str, LatencyModel] = {}
+    for item in (spec or "").split(";"):
+        if not item.strip():
+            continue
+        endpoint, _, latency = item.partition("=")
+        endpoint = _endpoint_name(endpoint)
+        if endpoint not in SIMULATOR_ENDPOINTS:
+            raise ValueError(f"알 수 없는 엔드포인트입니다: {endpoint}")
+        models[endpoint] = LatencyModel.parse(latency)
+    return models
+
+
+@dataclass
+class _SimCoupon:
+    goods_id: str
+    order_id: str
+    status: str = "000"
+    amount: float = 0.0
+
+
+class CoufunSimulator:
+    """
+    오프라인 성능 테스트용 COUFUN 대역. 발급/상품/상태조회/취소 4개 엔드포인트를
+    실제 응답 형식(EUC-KR XML)으로 흉내 내며, 지연 분포와 오류 코드 비율을 주입할 수 있다.
+
+    발급된 쿠폰과 TR_ID는 메모리에 보관해 TR_ID 중복(12), 미발급 바코드(16),
+    사용/취소 완료 건 재요청(17/18)을 실제와 같이 돌려준다.
+    """
+
+    def __init__(self, profile: SimulatorProfile | None = None) -> None:
+        self.profile = profile or SimulatorProfile()
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._orders: Dict[str, str] = {}
+        self._coupons: Dict[str, _SimCoupon] = {}
+        self._sequence = 0
+        self._calls: Counter[Tuple[str, str]] = Counter()
+        self._goods = {
+            f"{index:010d}": (f"Simulated Goods {index}", 1000 * (index % 50 + 1))
+            for index in range(1, max(self.profile.goods_count, 1) + 1)
+        }
+
+    # ------------------------------------------------------------------ #
+    # 요청 처리
+
+    def sample_latency(self, endpoint: str) -> float:
+        model = self.profile.endpoint_latency.get(_endpoint_name(endpoint), self.profile.latency)
+        with self._lock:
+            return model.sample(self._rng)
+
+    def handle(self, endpoint: str, form: Dict[str, str]) -> Tuple[int, bytes]:
+        """
+        (HTTP 상태코드, 응답 본문)을 반환한다. 지연은 호출 측(전송 계층/서버)에서 적용한다.
+        """
+        name = _endpoint_name(endpoint)
+        if name not in SIMULATOR_ENDPOINTS:
+            return 404, b""
+        with self._lock:
+            if self._rng.random() < self.profile.http_error_rate:
+                self._calls[(name, "HTTP_503")] += 1
+                return 503, b""
+            injected = self._pick_error_code()
+            if injected:
+                root = _result_root(_root_tag(name), injected)
+            else:
+                root = self._dispatch(name, form)
+            code = root.findtext("RESULT_CODE") or ""
+            self._calls[(name, code)] += 1
+        return 200, ET.tostring(root, encoding="EUC-KR", xml_declaration=True)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            result: Dict[str, Dict[str, int]] = {}
+            for (endpoint, code), count in self._calls.items():
+                result.setdefault(endpoint, {})[code] = count
+            result["_state"] = {"orders": len(self._orders), "coupons": len(self._coupons)}
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._orders.clear()
+            self._coupons.clear()
+            self._calls.clear()
+            self._sequence = 0
+            self._rng = random.Random(self.profile.seed)
+
+    def _pick_error_code(self) -> str | None:
+        roll = self._rng.random()
+        threshold = 0.0
+        for code, rate in self.profile.error_rates.items():
+            threshold += rate
+            if roll < threshold:
+                return code
+        return None
+
+    def _dispatch(self, name: str, form: Dict[str, str]) -> ET.Element:
+        if not form.get("POC_ID"):
+            return _result_root(_root_tag(name), "02")
+        if name == "coufunCreate":
+            return self._create(form)
+        if name == "coufunProduct":
+            return self._product()
+        if name == "coufunPartAmountStatus":
+            return self._status(form)
+        return self._cancel(form)
+
+    def _create(self, form: Dict[str, str]) -> ET.Element:
+        goods_id = form.get("GOODS_ID", "")
+        tr_id = form.get("TR_ID", "")
+        if goods_id not in self._goods:
+            return _result_root("COUFUNCREATE", "31")
+        if not tr_id or tr_id in self._orders:
+            return _result_root("COUFUNCREATE", "12")
+        try:
+            create_count = int(form.get("CREATE_CNT") or 1)
+        except ValueError:
+            create_count = 0
+        if not 1 <= create_count <= MAX_CREATE_COUNT:
+            return _result_root("COUFUNCREATE", "99")
+
+        self._sequence += 1
+        order_id = f"SIM{self._sequence:012d}"
+        self._orders[tr_id] = order_id
+        amount = float(self._goods[goods_id][1])
+        root = _result_root("COUFUNCREATE", "00")
+        _append(root, "ORDER_ID", order_id)
+        _append(root, "ORDER_CNT", str(create_count))
+        _append(root, "VALID_END_DATE", _valid_end_date())
+        for seq in range(1, create_count + 1):
+            barcode = f"9{self._sequence:011d}{seq:02d}"
+            self._coupons[barcode] = _SimCoupon(goods_id=goods_id, order_id=order_id, amount=amount)
+            order_info = ET.SubElement(root, "ORDER_INFO")
+            _append(order_info, "BARCODE_NUM", barcode)
+        return root
+
+    def _product(self) -> ET.Element:
+        root = _result_root("PRODUCTLIST", "00")
+        _append(root, "LIST_CNT", str(len(self._goods)))
+        for goods_id, (name, price) in self._goods.items():
+            item = ET.SubElement(root, "PRODUCT_INFO")
+            _append(item, "CAT_ID", "001")
+            _append(item, "GOODS_ID", goods_id)
+            _append(item, "GOODS_NAME", name)
+            _append(item, "GOODS_ORI_PRICE", str(price))
+            _append(item, "GOODS_PRICE", str(int(price * 0.95)))
+            _append(item, "VALID_END_TYPE", "D")
+            _append(item, "VALID_END_DATE", "60")
+            _append(item, "SEND_TYPE", "M")
+        return root
+
+    def _status(self, form: Dict[str, str]) -> ET.Element:
+        barcode = form.get("BARCODE_NUM", "")
+        coupon = self._coupons.get(barcode)
+        if coupon is None or coupon.goods_id != form.get("GOODS_ID"):
+            return _result_root("COUFUNSEARCH", "16")
+        root = _result_root("COUFUNSEARCH", "00")
+        _append(root, "COUPON_TYPE", "BARCODE")
+        _append(root, "STATUS", coupon.status)
+        _append(root, "BARCODE_NUM", barcode)
+        _append(root, "REMAIN_AMOUNT", "0")
+        _append(root, "TOTAL_AMOUNT", str(int(coupon.amount)))
+        _append(root, "VALID_END_DATE", _valid_end_date())
+        return root
+
+    def _cancel(self, form: Dict[str, str]) -> ET.Element:
+        barcode = form.get("BARCODE_NUM", "")
+        coupon = self._coupons.get(barcode)
+        if coupon is None or coupon.goods_id != form.get("GOODS_ID"):
+            return _result_root("COUFUNCANCEL", "16")
+        if coupon.status == "001":
+            return _result_root("COUFUNCANCEL", "17")
+        if coupon.status == "100":
+            return _result_root("COUFUNCANCEL", "18")
+        coupon.status = "100"
+        root = _result_root("COUFUNCANCEL", "00")
+        _append(root, "BARCODE_NUM", barcode)
+        _append(root, "CANCEL_DATE", datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S"))
+        return root
+
+    # ------------------------------------------------------------------ #
+    # 테스트 보조
+
+    def mark_used(self, barcode: str) -> None:
+        with self._lock:
+            coupon = self._coupons.get(barcode)
+            if coupon is not None:
+                coupon.status = "001"
+
+
+class SimulatorTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx 클라이언트에 꽂아 쓰는 프로세스 내 전송 계층. 네트워크 없이 시뮬레이터로 요청을 보낸다.
+    동기 클라이언트는 time.sleep, 비동기 클라이언트는 asyncio.sleep으로 지연을 적용한다.
+    """
+
+    def __init__(self, simulator: CoufunSimulator) -> None:
+        self.simulator = simulator
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint, form = _read_request(request, request.read())
+        time.sleep(self.simulator.sample_latency(endpoint))
+        return _build_response(request, *self.simulator.handle(endpoint, form))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint, form = _read_request(request, await request.aread())
+        await asyncio.sleep(self.simulator.sample_latency(endpoint))
+        return _build_response(request, *self.simulator.handle(endpoint, form))
+
+
+def create_app(simulator: CoufunSimulator | None = None) -> Any:
+    """
+    독립 실행용 ASGI 앱. `python coufun_simulator.py`로 띄우고 COUFUN_BASE_URL을 이 서버로 지정한다.
+    """
+    from fastapi import FastAPI, Request, Response
+
+    sim = simulator or CoufunSimulator(SimulatorProfile.from_settings())
+    app = FastAPI(title="COUFUN Simulator")
+
+    @app.post("/b2c_api/{endpoint}")
+    async def coufun_endpoint(endpoint: str, request: Request) -> Response:
+        form = {key: str(value) for key, value in (await request.form()).items()}
+        await asyncio.sleep(sim.sample_latency(endpoint))
+        status_code, body = sim.handle(endpoint, form)
+        return Response(content=body, status_code=status_code, media_type=_MEDIA_TYPE)
+
+    @app.get("/_simulator/stats")
+    async def simulator_stats() -> dict:
+        return sim.stats()
+
+    @app.post("/_simulator/reset")
+    async def simulator_reset() -> dict:
+        sim.reset()
+        return {"status": "ok"}
+
+    @app.post("/_simulator/coupons/{barcode}/use")
+    async def simulator_use(barcode: str) -> dict:
+        sim.mark_used(barcode)
+        return {"status": "ok"}
+
+    return app
+
+
+# --------------------------------------------------------------------------- #
+# 앱 설정(COUFUN_SIMULATOR_ENABLED)용 공용 인스턴스
+
+_shared_simulator: CoufunSimulator | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_simulator() -> CoufunSimulator:
+    global _shared_simulator
+    with _shared_lock:
+        if _shared_simulator is None:
+            _shared_simulator = CoufunSimulator(SimulatorProfile.from_settings())
+        return _shared_simulator
+
+
+def get_transport() -> SimulatorTransport:
+    return SimulatorTransport(get_shared_simulator())
+
+
+def _read_request(request: httpx.Request, body: bytes) -> Tuple[str, Dict[str, str]]:
+    endpoint = request.url.path.rsplit("/", 1)[-1]
+    form = dict(parse_qsl(body.decode("utf-8"), keep_blank_values=True))
+    return endpoint, form
+
+
+def _build_response(request: httpx.Request, status_code: int, body: bytes) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers={"Content-Type": _MEDIA_TYPE},
+        content=body,
+        request=request,
+    )
+
+
+def _endpoint_name(endpoint: str) -> str:
+    endpoint = endpoint.strip()
+    return endpoint[:-3] if endpoint.endswith(".do") else endpoint
+
+
+def _root_tag(name: str) -> str:
+    return {
+        "coufunCreate": "COUFUNCREATE",
+        "coufunProduct": "PRODUCTLIST",
+        "coufunPartAmountStatus": "COUFUNSEARCH",
+        "coufunPartCancel": "COUFUNCANCEL",
+    }[name]
+
+
+def _result_root(tag: str, code: str) -> ET.Element:
+    root = ET.Element(tag)
+    _append(root, "RESULT_CODE", code)
+    _append(root, "RESULT_MSG", RESULT_MESSAGES.get(code, "ERROR"))
+    return root
+
+
+def _append(parent: ET.Element, tag: str, text: str) -> None:
+    ET.SubElement(parent, tag).text = text
+
+
+def _valid_end_date() -> str:
+    return (datetime.now(timezone.utc) + timedelta(days=60)).strftime("%Y%m%d")
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.crypto import decrypt_value, hash_value
+from app.db.session import SessionLocal
+from app.models.domain import CouponExchangeDetail, CouponIssue, CouponStatusHistory
+from app.services import coupon_status_cache_service
+from app.services.coufun_service import CoufunExchangeNotice
+
+logger = logging.getLogger(__name__)
+STATUS_SOURCE = "COUFUN_PUSH"
+
+
+@dataclass
+class ExchangeEvent:
+    coupon_issue_id: int
+    notice: CoufunExchangeNotice
+    received_at: datetime
+
+    @property
+    def key(self) -> tuple[int, str, str]:
+        return (self.coupon_issue_id, self.notice.exchange_num, self.notice.status_code)
+
+
+def new_event(coupon_issue_id: int, notice: CoufunExchangeNotice) -> ExchangeEvent:
+    return ExchangeEvent(
+        coupon_issue_id=coupon_issue_id,
+        notice=notice,
+        received_at=datetime.now(timezone.utc),
+    )
+
+
+def resolve_coupon_issue_id(db: Session, barcode: str) -> int | None:
+    """
+    바코드 블라인드 인덱스(barcode_hash)로 발급 건을 찾는다. 해시 충돌에 대비해 복호화 값도 확인한다.
+    """
+    rows = db.execute(
+        select(CouponIssue.id, CouponIssue.barcode_enc)
+        .where(CouponIssue.barcode_hash == hash_value(barcode))
+        .order_by(CouponIssue.id.desc())
+    ).all()
+    for issue_id, barcode_enc in rows:
+        if decrypt_value(barcode_enc) == barcode:
+            return issue_id
+    return None
+
+
+def build_exchange_id(event: ExchangeEvent) -> str:
+    # 재전송된 동일 통지에는 같은 처리 ID를 돌려준다 (영문/숫자, 50byte 이내).
+    return f"X{event.coupon_issue_id}S{event.notice.status_code}N{event.notice.exchange_num}"[:50]
+
+
+@dataclass
+class _QueuedEvent:
+    event: ExchangeEvent
+    done: Future = field(default_factory=Future)
+
+
+class ExchangeWriteQueue:
+    """
+    교환정보 웹훅 쓰기 큐. 백그라운드 스레드가 요청들을 모아 CouponExchangeDetail/CouponStatusHistory
+    일괄 INSERT와 CouponIssue 상태 갱신을 한 트랜잭션으로 수행하고(그룹 커밋), 요청 스레드는
+    자기 이벤트가 커밋될 때까지 기다렸다가 응답한다. 00은 저장이 끝난 통지에만 나간다.
+    """
+
+    def __init__(self, *, maxsize: int, batch_size: int, flush_interval: float) -> None:
+        self._queue: queue.Queue[_QueuedEvent] = queue.Queue(maxsize=max(maxsize, 1))
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = max(flush_interval, 0.05)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="coufun-exchange-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+
+    def put(self, event: ExchangeEvent) -> Future | None:
+        """
+        저장(커밋)이 끝나면 완료되는 Future를 반환한다. 큐가 가득 차면 None을 반환하며,
+        이 경우 오류 코드로 응답해 COUFUN 재전송에 맡긴다.
+        """
+        self.start()
+        item = _QueuedEvent(event)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            return None
+        return item.done
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            batch = self._drain()
+            if not batch:
+                continue
+            if len(batch) > 1:
+                try:
+                    flush_events([item.event for item in batch])
+                except Exception:  # noqa: BLE001
+                    logger.exception("교환정보 일괄 저장 실패 (%s건), 건별로 다시 저장합니다.", len(batch))
+                else:
+                    for item in batch:
+                        item.done.set_result(True)
+                    continue
+            # 한 건의 오류가 묶음 전체를 실패시키지 않도록 건별로 저장한다.
+            # 실패한 건은 요청 스레드가 오류 코드로 응답해 COUFUN이 재전송한다.
+            for item in batch:
+                try:
+                    flush_events([item.event])
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("교환정보 저장 실패 (coupon_issue_id=%s)", item.event.coupon_issue_id)
+                    item.done.set_exception(exc)
+                else:
+                    item.done.set_result(True)
+
+    def _drain(self) -> List[_QueuedEvent]:
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+
+_writer = ExchangeWriteQueue(
+    maxsize=settings.coufun_webhook_queue_size,
+    batch_size=settings.coufun_webhook_flush_batch_size,
+    flush_interval=settings.coufun_webhook_flush_interval_seconds,
+)
+
+
+def enqueue_event(event: ExchangeEvent) -> Future | None:
+    return _writer.put(event)
+
+
+def start_writer() -> None:
+    _writer.start()
+
+
+def stop_writer() -> None:
+    _writer.stop()
+
+
+def pending_events() -> int:
+    return _writer.pending()
+
+
+def flush_events(events: List[ExchangeEvent]) -> int:
+    """
+    교환 이벤트 묶음을 한 트랜잭션으로 저장한다. 이미 저장된 (발급건, 인증번호, 상태)는 건너뛰며
+    저장한 신규 이벤트 수를 반환한다.
+
+    통지는 순서 없이(다른 묶음, 다른 노드로) 도착할 수 있으므로, 발급 건 행을 잠근 뒤 이미 저장된
+    교환 일시보다 이르지 않은 이벤트만 CouponIssue 상태에 반영한다. 이력은 모두 남긴다.
+    """
+    unique: Dict[tuple[int, str, str], ExchangeEvent] = {}
+    for event in events:
+        unique.setdefault(event.key, event)
+
+    session = SessionLocal()
+    try:
+        # 같은 발급 건을 동시에 갱신하는 다른 쓰기(다른 프로세스의 큐)와 순서를 맞춘다.
+        session.execute(
+            select(CouponIssue.id)
+            .where(CouponIssue.id.in_({key[0] for key in unique}))
+            .order_by(CouponIssue.id)
+            .with_for_update()
+        )
+        existing = {
+            tuple(row)
+            for row in session.execute(
+                select(
+                    CouponExchangeDetail.coupon_issue_id,
+                    CouponExchangeDetail.exchange_num,
+                    CouponExchangeDetail.exchange_status,
+                ).where(
+                    CouponExchangeDetail.coupon_issue_id.in_({key[0] for key in unique}),
+                    CouponExchangeDetail.exchange_num.in_({key[1] for key in unique}),
+                )
+            )
+        }
+        fresh = [event for key, event in unique.items() if key not in existing]
+        if not fresh:
+            return 0
+        stored_latest = _stored_latest_exchange(session, {event.coupon_issue_id for event in fresh})
+
+        session.execute(
+            insert(CouponExchangeDetail),
+            [
+                {
+                    "coupon_issue_id": event.coupon_issue_id,
+                    "exchange_num": event.notice.exchange_num,
+                    "exchange_status": event.notice.status_code,
+                    "exchange_store": event.notice.branch_name or event.notice.branch_code,
+                    "exchange_at": None if event.notice.status == "CANCELLED" else event.notice.exchanged_at,
+                    "cancel_at": event.notice.exchanged_at if event.notice.status == "CANCELLED" else None,
+                    "remain_amount": event.notice.balance,
+                }
+                for event in fresh
+            ],
+        )
+        session.execute(
+            insert(CouponStatusHistory),
+            [
+                {
+                    "coupon_issue_id": event.coupon_issue_id,
+                    "status": event.notice.status,
+                    "status_source": STATUS_SOURCE,
+                    "status_at": event.notice.exchanged_at or event.received_at,
+                    "memo": f"exchange={event.notice.exchange_num} branch={event.notice.branch_code or '-'}",
+                }
+                for event in fresh
+            ],
+        )
+
+        latest: Dict[int, ExchangeEvent] = {}
+        for event in fresh:
+            current = latest.get(event.coupon_issue_id)
+            if current is None or _event_order(event) >= _event_order(current):
+                latest[event.coupon_issue_id] = event
+        latest = {
+            issue_id: event
+            for issue_id, event in latest.items()
+            if _is_not_older(event, stored_latest.get(issue_id))
+        }
+        if not latest:
+            session.commit()
+            return len(fresh)
+        session.execute(
+            update(CouponIssue),
+            [{"id": issue_id, "status": event.notice.status} for issue_id, event in latest.items()],
+        )
+        coupon_status_cache_service.store_statuses(
+            session,
+            [
+                (issue_id, event.notice.barcode, event.notice.to_status())
+                for issue_id, event in latest.items()
+            ],
+            source=STATUS_SOURCE,
+        )
+        session.commit()
+        return len(fresh)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _event_order(event: ExchangeEvent) -> tuple[datetime, datetime]:
+    return (event.notice.exchanged_at or event.received_at, event.received_at)
+
+
+def _stored_latest_exchange(session: Session, issue_ids: set[int]) -> Dict[int, datetime]:
+    """
+    발급 건별로 이미 저장된 교환/취소 일시의 최댓값.
+    """
+    rows = session.execute(
+        select(
+            CouponExchangeDetail.coupon_issue_id,
+            func.max(func.coalesce(CouponExchangeDetail.exchange_at, CouponExchangeDetail.cancel_at)),
+        )
+        .where(CouponExchangeDetail.coupon_issue_id.in_(issue_ids))
+        .group_by(CouponExchangeDetail.coupon_issue_id)
+    )
+    return {issue_id: _as_utc(value) for issue_id, value in rows if value is not None}
+
+
+def _is_not_older(event: ExchangeEvent, stored: datetime | None) -> bool:
+    # 교환 일시가 없는 통지는 비교할 수 없으므로 도착 순서대로 반영한다.
+    if stored is None or event.notice.exchanged_at is None:
+        return True
+    return _as_utc(event.notice.exchanged_at) >= stored
+
+
+def _as_utc(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
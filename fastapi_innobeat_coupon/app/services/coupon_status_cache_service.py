@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Sequence, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.crypto import hash_value
+from app.models.domain import CoufunStatusCache, CouponIssue
+from app.services import coufun_service
+from app.services.coufun_service import CoufunStatus
+
+# 종결 상태는 거의 바뀌지 않으므로 더 긴 TTL을 쓴다 (사용/취소 철회가 있어 만료는 둔다).
+TERMINAL_STATUSES = {"USED", "CANCELLED"}
+# 커밋 전 세션에서 기록한 LRU 항목 (Session.info 키). 커밋 후에만 LRU에 올린다.
+_PENDING_KEY = "coupon_status_cache_pending"
+_DATETIME_FIELDS = ("order_date", "valid_end_date", "exchanged_at", "cancelled_at")
+_VALUE_FIELDS = (
+    "status",
+    "remain_amount",
+    "coupon_type",
+    "status_code",
+    "status_label",
+    "total_amount",
+)
+
+
+@dataclass
+class CachedCouponStatus:
+    status: CoufunStatus
+    status_at: datetime
+    cached: bool
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """
+    LRU 항목. 여러 요청이 공유하므로 바꾸지 않으며, status는 바코드/원문을 비운 복사본만 담는다.
+    """
+
+    barcode_hash: str
+    status: CoufunStatus
+    status_at: datetime
+
+    @classmethod
+    def build(cls, barcode_hash: str, status: CoufunStatus, status_at: datetime) -> _Entry:
+        return cls(
+            barcode_hash=barcode_hash,
+            status=replace(status, barcode="", raw_payload={}),
+            status_at=status_at,
+        )
+
+    def to_status(self, barcode: str) -> CoufunStatus:
+        return replace(self.status, barcode=barcode, raw_payload={})
+
+
+class _StatusLRU:
+    """
+    coupon_issue_id 기준 프로세스 내 LRU. DB 캐시 앞단에서 같은 쿠폰의 연속 조회를 흡수한다.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max(max_size, 1)
+        self._items: OrderedDict[int, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int) -> _Entry | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                self._items.move_to_end(key)
+            return entry
+
+    def put(self, key: int, entry: _Entry) -> None:
+        with self._lock:
+            self._items[key] = entry
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def discard(self, key: int) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_lru = _StatusLRU(settings.coupon_status_cache_lru_size)
+
+
+def get_coupon_status(
+    db: Session,
+    issue: CouponIssue,
+    *,
+    goods_id: str,
+    barcode: str,
+    force_refresh: bool = False,
+) -> CachedCouponStatus:
+    """
+    쿠폰 상태를 캐시 우선으로 조회한다 (LRU → coufun_status_cache → COUFUN).
+
+    신선도는 상태별 TTL로 판단하며(USED/CANCELLED는 COUPON_STATUS_CACHE_TERMINAL_TTL_SECONDS),
+    force_refresh면 항상 COUFUN을 호출한다. 캐시 행은 flush까지만 하고 커밋은 호출 측 트랜잭션에
+    맡기며, 프로세스 LRU에는 그 트랜잭션이 커밋된 뒤에 올린다.
+    """
+    barcode_hash = _barcode_hash(barcode)
+    if not force_refresh:
+        entry = _lru.get(issue.id)
+        if entry is None or entry.barcode_hash != barcode_hash:
+            entry = _load_entry(db, issue.id)
+            # 이 세션이 아직 커밋하지 않은 값이면 LRU에 올리지 않는다 (커밋 시 올라간다).
+            if entry is not None and issue.id not in db.info.get(_PENDING_KEY, {}):
+                _lru.put(issue.id, entry)
+        if entry is not None and entry.barcode_hash == barcode_hash and _is_fresh(entry):
+            return CachedCouponStatus(
+                status=entry.to_status(barcode),
+                status_at=entry.status_at,
+                cached=True,
+            )
+
+    status = coufun_service.get_coupon_status(goods_id, barcode)
+    status_at = store_status(db, issue.id, barcode, status, source="COUFUN")
+    return CachedCouponStatus(status=status, status_at=status_at, cached=False)
+
+
+def store_status(
+    db: Session,
+    coupon_issue_id: int,
+    barcode: str,
+    status: CoufunStatus,
+    *,
+    source: str,
+) -> datetime:
+    """
+    COUFUN에서 받은 최신 상태를 캐시에 기록한다 (상태 조회/취소 응답 공용).
+    """
+    return store_statuses(db, [(coupon_issue_id, barcode, status)], source=source)
+
+
+def store_statuses(
+    db: Session,
+    items: Sequence[Tuple[int, str, CoufunStatus]],
+    *,
+    source: str,
+) -> datetime:
+    """
+    (coupon_issue_id, barcode, status) 목록을 한 번의 조회로 캐시에 반영한다.
+    DB 캐시 행은 호출 측 트랜잭션에 넣고, 프로세스 LRU는 그 트랜잭션이 커밋된 뒤에 갱신한다.
+    """
+    status_at = datetime.now(timezone.utc)
+    if not items:
+        return status_at
+    rows = {
+        row.coupon_issue_id: row
+        for row in db.scalars(
+            select(CoufunStatusCache).where(
+                CoufunStatusCache.coupon_issue_id.in_({item[0] for item in items})
+            )
+        )
+    }
+    entries: Dict[int, _Entry] = {}
+    for coupon_issue_id, barcode, status in items:
+        barcode_hash = _barcode_hash(barcode)
+        row = rows.get(coupon_issue_id)
+        if row is None:
+            row = CoufunStatusCache(coupon_issue_id=coupon_issue_id)
+            db.add(row)
+            rows[coupon_issue_id] = row
+        row.status = status.status
+        row.status_source = source
+        row.status_at = status_at
+        row.raw_payload = _serialize(status, barcode_hash)
+        entries[coupon_issue_id] = _Entry.build(barcode_hash, status, status_at)
+    db.flush()
+    db.info.setdefault(_PENDING_KEY, {}).update(entries)
+    for coupon_issue_id in entries:
+        # 커밋 전까지는 이전 값도 믿지 않는다.
+        _lru.discard(coupon_issue_id)
+    return status_at
+
+
+def invalidate(coupon_issue_id: int) -> None:
+    """
+    재발급 등으로 바코드가 바뀐 경우 프로세스 LRU에서 제거한다.
+    (DB 캐시는 바코드 해시가 달라져 자연히 무효 처리된다.)
+    """
+    _lru.discard(coupon_issue_id)
+
+
+def clear_local_cache() -> None:
+    _lru.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        for coupon_issue_id, entry in pending.items():
+            _lru.put(coupon_issue_id, entry)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_uncommitted(session: Session, transaction: Any) -> None:
+    # 커밋 없이 닫힌 세션(close)의 항목도 버린다. 커밋된 항목은 after_commit에서 이미 올라갔다.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def _load_entry(db: Session, coupon_issue_id: int) -> _Entry | None:
+    row = db.scalar(
+        select(CoufunStatusCache).where(CoufunStatusCache.coupon_issue_id == coupon_issue_id)
+    )
+    if row is None or not row.raw_payload:
+        return None
+    payload = row.raw_payload
+    barcode_hash = payload.get("barcode_hash")
+    if not barcode_hash:
+        return None
+    return _Entry.build(barcode_hash, _deserialize(payload), _as_utc(row.status_at))
+
+
+def _is_fresh(entry: _Entry) -> bool:
+    if entry.status.status in TERMINAL_STATUSES:
+        ttl = timedelta(seconds=settings.coupon_status_cache_terminal_ttl_seconds)
+    else:
+        ttl = timedelta(seconds=settings.coupon_status_cache_ttl_seconds)
+    return datetime.now(timezone.utc) - entry.status_at < ttl
+
+
+def _barcode_hash(barcode: str) -> str:
+    return hash_value(barcode).hex()
+
+
+def _serialize(status: CoufunStatus, barcode_hash: str) -> Dict[str, Any]:
+    # 바코드 원문은 저장하지 않고 해시만 남겨 재발급 여부 판별에 사용한다.
+    payload: Dict[str, Any] = {"barcode_hash": barcode_hash}
+    for field in _VALUE_FIELDS:
+        payload[field] = getattr(status, field)
+    for field in _DATETIME_FIELDS:
+        value = getattr(status, field)
+        payload[field] = value.isoformat() if value else None
+    return payload
+
+
+def _deserialize(payload: Dict[str, Any]) -> CoufunStatus:
+    values = {field: payload.get(field) for field in _VALUE_FIELDS}
+    dates = {
+        field: datetime.fromisoformat(payload[field]) if payload.get(field) else None
+        for field in _DATETIME_FIELDS
+    }
+    return CoufunStatus(barcode="", raw_payload={}, **values, **dates)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
@@ -12,10 +12,15 @@ from app.models.domain import (
     CouponProduct,
     CouponStatusHistory,
 )
-from app.services import coufun_service
+from app.services import coufun_service, coupon_status_cache_service
 
 
-def refresh_coupon_status(db: Session, coupon_issue_id: int) -> dict:
+def refresh_coupon_status(
+    db: Session,
+    coupon_issue_id: int,
+    *,
+    force_refresh: bool = False,
+) -> dict:
     issue = db.get(CouponIssue, coupon_issue_id)
     if not issue:
         raise ValueError("쿠폰 발급 정보를 찾을 수 없습니다.")
@@ -24,24 +29,33 @@ def refresh_coupon_status(db: Session, coupon_issue_id: int) -> dict:
         raise ValueError("바코드 복호화에 실패했습니다.")
 
     goods_id = _resolve_goods_id(db, issue.campaign_id)
-    status = coufun_service.get_coupon_status(goods_id, barcode)
-    issue.status = status.status
-
-    history = CouponStatusHistory(
-        coupon_issue_id=issue.id,
-        status=status.status,
-        status_source="COUFUN",
-        status_at=datetime.now(timezone.utc),
-        memo=f"remain={status.remain_amount}",
+    lookup = coupon_status_cache_service.get_coupon_status(
+        db,
+        issue,
+        goods_id=goods_id,
+        barcode=barcode,
+        force_refresh=force_refresh,
     )
-    db.add(history)
-    db.commit()
+    status = lookup.status
+    if not lookup.cached:
+        issue.status = status.status
+        history = CouponStatusHistory(
+            coupon_issue_id=issue.id,
+            status=status.status,
+            status_source="COUFUN",
+            status_at=lookup.status_at,
+            memo=f"remain={status.remain_amount}",
+        )
+        db.add(history)
+        db.commit()
     return {
         "barcode": barcode,
         "status": status.status,
         "status_label": status.status_label,
         "remain_amount": status.remain_amount,
         "coupon_type": status.coupon_type,
+        "status_at": lookup.status_at,
+        "cached": lookup.cached,
     }
 
 
@@ -56,6 +70,7 @@ def cancel_coupon(db: Session, coupon_issue_id: int, reason: str | None = None)
     goods_id = _resolve_goods_id(db, issue.campaign_id)
     status = coufun_service.cancel_coupon(goods_id, barcode, reason)
     issue.status = status.status
+    coupon_status_cache_service.store_status(db, issue.id, barcode, status, source="COUFUN")
 
     history = CouponStatusHistory(
         coupon_issue_id=issue.id,
@@ -22,7 +22,12 @@ from app.models.domain import (
     RenderedMmsAsset,
 )
 from app.schemas.cs import CsActionResponse, CsResendResponse, CsSearchResponse
-from app.services import coufun_service, snap_service
+from app.services import (
+    coufun_service,
+    coupon_status_cache_service,
+    recipient_hash_cache_service,
+    snap_service,
+)
 
 RENDER_DIR = Path("temp/rendered_mms")
 
@@ -190,6 +195,7 @@ def change_recipient_phone(
     except Exception:
         db.rollback()
         raise
+    recipient_hash_cache_service.invalidate(campaign.id)
     return CsActionResponse(action_id=action.id, action_type=action.action_type)
 
 
@@ -299,9 +305,16 @@ def _ensure_coupon_before_resend(
     if not barcode:
         _reissue_coupon(db, issue, campaign, goods_id, client_key, memo="reissue_missing_barcode")
         return
-    status = coufun_service.get_coupon_status(goods_id, barcode)
-    issue.status = status.status
-    _record_coupon_history(db, issue.id, status.status, f"COUFUN status={status.status}")
+    lookup = coupon_status_cache_service.get_coupon_status(
+        db,
+        issue,
+        goods_id=goods_id,
+        barcode=barcode,
+    )
+    status = lookup.status
+    if not lookup.cached:
+        issue.status = status.status
+        _record_coupon_history(db, issue.id, status.status, f"COUFUN status={status.status}")
     if status.status in {"USED", "CANCELLED", "EXPIRED", "ISSUE_FAILED"}:
         _reissue_coupon(db, issue, campaign, goods_id, client_key, memo="reissue_after_status")
 
@@ -321,6 +334,9 @@ def _replace_coupon_after_phone_change(
     if barcode:
         cancel_status = coufun_service.cancel_coupon(goods_id, barcode, reason)
         issue.status = cancel_status.status
+        coupon_status_cache_service.store_status(
+            db, issue.id, barcode, cancel_status, source="COUFUN"
+        )
         _record_coupon_history(
             db,
             issue.id,
@@ -342,7 +358,10 @@ def _reissue_coupon(
 ) -> None:
     result = coufun_service.issue_coupon(goods_id=goods_id, tr_id=client_key, create_count=1)
     issue.order_id = result.order_id
+    issue.order_seq = result.order_seq
     issue.barcode_enc = encrypt_value(result.barcode)
+    issue.barcode_hash = hash_value(result.barcode)
+    coupon_status_cache_service.invalidate(issue.id)
     issue.valid_end_date = result.valid_end_date
     issue.vendor_payload = result.raw_payload
     issue.status = "ISSUED"
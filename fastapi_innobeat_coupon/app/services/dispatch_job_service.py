@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.domain import Campaign, DispatchJob
+from app.services import dispatch_service
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "PENDING"
+JOB_RUNNING = "RUNNING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+JOB_CANCELLED = "CANCELLED"
+ACTIVE_JOB_STATUSES = (JOB_PENDING, JOB_RUNNING)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+# 이 프로세스에서 작업별로 돌고 있는 워커 수
+_local_workers: Dict[int, int] = {}
+# 이 프로세스 워커들의 수신자 점유 토큰 → campaign_id (하트비트가 점유를 갱신한다)
+_active_claims: Dict[str, int] = {}
+# 작업 하트비트에 남기는 이 프로세스 이름
+WORKER_NAME = f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def submit_dispatch_job(db: Session, *, campaign_id: int, requested_by: int | None) -> DispatchJob:
+    """
+    발송 작업을 PENDING으로 등록하고 이 프로세스의 워커를 붙인다. 캠페인당 진행 중인 작업은
+    하나만 허용하며, 다른 프로세스/노드의 워커도 폴링(run_dispatch_worker_poll)으로 같은 작업에 붙는다.
+    """
+    campaign = db.get(Campaign, campaign_id)
+    if not campaign:
+        raise ValueError("캠페인을 찾을 수 없습니다.")
+    active = db.scalar(
+        select(DispatchJob.id).where(
+            DispatchJob.campaign_id == campaign_id,
+            DispatchJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+    )
+    if active is not None:
+        raise ValueError(f"이미 진행 중인 발송 작업이 있습니다. (job_id={active})")
+    total = dispatch_service.reset_dispatch_state(db, campaign_id)
+    if not total:
+        db.rollback()
+        raise ValueError("VALIDATED 상태의 수신자가 없습니다.")
+
+    job = DispatchJob(
+        campaign_id=campaign_id,
+        status=JOB_PENDING,
+        total_count=total,
+        processed_count=0,
+        enqueued_count=0,
+        failed_count=0,
+        cancel_requested=False,
+        requested_by=requested_by,
+    )
+    db.add(job)
+    db.commit()
+    start_local_workers(job.id)
+    return job
+
+
+def get_dispatch_job(db: Session, campaign_id: int, job_id: int) -> DispatchJob:
+    job = db.get(DispatchJob, job_id)
+    if not job or job.campaign_id != campaign_id:
+        raise ValueError("발송 작업을 찾을 수 없습니다.")
+    return job
+
+
+def cancel_dispatch_job(db: Session, campaign_id: int, job_id: int) -> DispatchJob:
+    """
+    대기 중인 작업은 바로 취소하고, 실행 중인 작업은 취소 요청만 남긴다.
+    실행 중인 작업은 현재 청크를 커밋한 뒤 멈추므로 이미 적재된 메시지는 그대로 발송된다.
+    """
+    job = get_dispatch_job(db, campaign_id, job_id)
+    if job.status == JOB_PENDING:
+        job.status = JOB_CANCELLED
+        job.cancel_requested = True
+        job.finished_at = datetime.now(timezone.utc)
+    elif job.status == JOB_RUNNING:
+        job.cancel_requested = True
+    else:
+        raise ValueError("진행 중인 발송 작업만 취소할 수 있습니다.")
+    db.commit()
+    return job
+
+
+def run_dispatch_worker(job_id: int) -> None:
+    """
+    발송 워커 하나. 수신자 청크(DISPATCH_CHUNK_SIZE)를 claim_recipients로 점유해 처리하고,
+    청크마다 커밋하며 작업 행을 잠가 진행 카운터를 더한다. 같은 작업에 여러 워커(스레드/프로세스/
+    노드)가 동시에 붙어도 SKIP LOCKED 점유와 토큰 확인으로 수신자는 한 번만 적재된다.
+
+    점유할 수신자가 없으면 종료하며, 처리 중인 수신자도 남지 않았으면 작업을 완료 처리한다.
+    다른 워커가 처리 중인 청크 없이 미룬 수신자만 남았으면 작업을 PENDING으로 돌려(_suspend)
+    워커 폴링이 점유 시간 초과 뒤 다시 붙게 한다. 한 워커가 실패하면 작업을 FAILED로 바꾸고 다른 워커는 현재 청크까지만 처리한다. 점유된 채 남은
+    수신자는 다음 발송 요청에서 되돌려 이어서 처리한다.
+    """
+    claim_token = uuid.uuid4().hex
+    session = SessionLocal()
+    try:
+        job = _activate(session, job_id)
+        if job is None:
+            return
+        campaign = session.get(Campaign, job.campaign_id)
+        if campaign is None:
+            raise ValueError("캠페인을 찾을 수 없습니다.")
+        context = dispatch_service.load_dispatch_context(session, campaign)
+        with _executor_lock:
+            _active_claims[claim_token] = campaign.id
+        chunk_size = max(settings.dispatch_chunk_size, 1)
+
+        while True:
+            job = session.get(DispatchJob, job_id, populate_existing=True)
+            if job is None or job.status != JOB_RUNNING:
+                return
+            if job.cancel_requested:
+                _finish(session, job_id, JOB_CANCELLED)
+                return
+
+            recipient_ids = dispatch_service.claim_recipients(
+                session,
+                campaign.id,
+                claim_token=claim_token,
+                limit=chunk_size,
+            )
+            session.commit()
+            if not recipient_ids:
+                if not dispatch_service.has_pending_recipients(session, campaign.id):
+                    _finish(session, job_id, JOB_COMPLETED)
+                elif not dispatch_service.has_live_claims(session, campaign.id):
+                    _suspend(session, job_id)
+                return
+
+            result = dispatch_service.dispatch_recipients(
+                session,
+                context,
+                recipient_ids,
+                claim_token=claim_token,
+            )
+            job = session.get(DispatchJob, job_id, with_for_update=True, populate_existing=True)
+            job.heartbeat_at = datetime.now(timezone.utc)
+            job.owner_node = WORKER_NAME
+            job.processed_count += result.processed
+            job.enqueued_count += result.enqueued
+            job.failed_count += len(result.errors)
+            errors = list(job.errors or [])
+            if len(errors) < settings.dispatch_job_error_limit:
+                errors.extend(error.model_dump() for error in result.errors)
+                job.errors = errors[: settings.dispatch_job_error_limit]
+            session.commit()
+    except Exception as exc:  # noqa: BLE001
+        session.rollback()
+        if isinstance(exc, ValueError):
+            message = str(exc)
+        else:
+            logger.exception("발송 작업 실패 (job_id=%s)", job_id)
+            message = "발송 처리 중 오류가 발생했습니다. 다시 요청하면 남은 수신자만 처리합니다."
+        _mark_failed(session, job_id, message)
+    finally:
+        with _executor_lock:
+            _active_claims.pop(claim_token, None)
+        session.close()
+
+
+def start_local_workers(job_id: int) -> int:
+    """
+    이 프로세스에서 아직 워커가 없는 작업이면 DISPATCH_JOB_WORKERS개의 워커를 작업 풀에 넣는다.
+    """
+    with _executor_lock:
+        if _local_workers.get(job_id):
+            return 0
+        count = max(settings.dispatch_job_workers, 1)
+        _local_workers[job_id] = count
+    for _ in range(count):
+        _get_executor().submit(_run_local_worker, job_id)
+    return count
+
+
+def run_dispatch_worker_poll() -> int:
+    """
+    진행 중인 발송 작업을 찾아 이 프로세스의 워커를 붙인다. 여러 노드가 같은 작업을 나눠 처리하거나,
+    워커가 모두 끝난 뒤 점유 시간 초과로 풀린 수신자를 다시 처리하는 데 쓴다.
+    """
+    with SessionLocal() as session:
+        job_ids = list(
+            session.scalars(
+                select(DispatchJob.id)
+                .where(DispatchJob.status.in_(ACTIVE_JOB_STATUSES))
+                .order_by(DispatchJob.id.asc())
+            )
+        )
+    return sum(start_local_workers(job_id) for job_id in job_ids)
+
+
+def heartbeat_dispatch_jobs() -> int:
+    """
+    이 프로세스에 워커가 붙어 있는 작업의 heartbeat_at과 워커들이 점유 중인 수신자의 점유 시각을
+    갱신한다. 주기 작업으로 돌려 한 청크(발급 호출 포함)가 오래 걸려도 다른 노드가 작업을 중단된
+    것으로 보거나 수신자를 다시 점유하지 않게 한다.
+    """
+    with _executor_lock:
+        job_ids = [job_id for job_id, count in _local_workers.items() if count]
+        claims = dict(_active_claims)
+    if not job_ids:
+        return 0
+    with SessionLocal() as session:
+        dispatch_service.renew_claims(session, claims)
+        touched = session.execute(
+            update(DispatchJob)
+            .where(DispatchJob.id.in_(job_ids), DispatchJob.status.in_(ACTIVE_JOB_STATUSES))
+            .values(heartbeat_at=datetime.now(timezone.utc), owner_node=WORKER_NAME)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+    return touched
+
+
+def fail_stale_dispatch_jobs() -> int:
+    """
+    하트비트가 DISPATCH_JOB_STALE_SECONDS 이상 끊긴 PENDING/RUNNING 작업을 FAILED로 바꾼다.
+    워커가 살아 있는 작업은 어느 노드에서 돌든 하트비트가 갱신되므로 건드리지 않는다.
+    """
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=settings.dispatch_job_stale_seconds)
+    with SessionLocal() as session:
+        # 조회와 변경 사이에 하트비트가 갱신될 수 있으므로 조건부 UPDATE 한 번으로 처리한다.
+        failed = session.execute(
+            update(DispatchJob)
+            .where(
+                DispatchJob.status.in_(ACTIVE_JOB_STATUSES),
+                func.coalesce(DispatchJob.heartbeat_at, DispatchJob.updated_at) < stale_before,
+            )
+            .values(
+                status=JOB_FAILED,
+                error_message="발송 작업이 중단되었습니다. 다시 요청하면 남은 수신자만 처리합니다.",
+                finished_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+    return failed
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+        _local_workers.clear()
+        _active_claims.clear()
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _activate(session: Session, job_id: int) -> DispatchJob | None:
+    """
+    PENDING 작업을 RUNNING으로 바꾼 첫 워커가 발급 원장 복구를 한 번 수행한다.
+    이미 RUNNING이면 그대로 합류하고, 끝난 작업이면 None을 반환한다.
+    """
+    activated = session.execute(
+        update(DispatchJob)
+        .where(DispatchJob.id == job_id, DispatchJob.status == JOB_PENDING)
+        .values(
+            status=JOB_RUNNING,
+            started_at=datetime.now(timezone.utc),
+            heartbeat_at=datetime.now(timezone.utc),
+            owner_node=WORKER_NAME,
+        )
+    ).rowcount
+    session.commit()
+    job = session.get(DispatchJob, job_id, populate_existing=True)
+    if job is None or job.status != JOB_RUNNING:
+        return None
+    if activated:
+        dispatch_service.recover_dispatch(session, job.campaign_id)
+        session.commit()
+    return job
+
+
+def _finish(session: Session, job_id: int, status: str) -> None:
+    """
+    RUNNING 작업만 종료 상태로 바꾼다. 여러 워커가 동시에 끝나도 한 번만 반영된다.
+    """
+    job = session.get(DispatchJob, job_id, with_for_update=True, populate_existing=True)
+    if job is None or job.status != JOB_RUNNING:
+        session.rollback()
+        return
+    if status == JOB_COMPLETED and job.enqueued_count == 0 and job.failed_count:
+        status = JOB_FAILED
+        job.error_message = "모든 수신자 발송 준비에 실패했습니다."
+    job.status = status
+    job.finished_at = datetime.now(timezone.utc)
+    session.commit()
+
+
+def _suspend(session: Session, job_id: int) -> None:
+    """
+    마지막 워커가 나갈 때 RUNNING 작업을 PENDING으로 돌린다. 발급 결과를 확인 중이라 미룬 수신자는
+    점유 시간 초과 뒤에야 다시 점유되므로, 그때까지 작업을 열어 두고 워커 폴링이 다시 붙어
+    원장 복구부터 이어서 처리하게 한다. 아무 노드도 붙지 않으면 fail_stale_dispatch_jobs가
+    하트비트 만료로 FAILED 처리해 다음 발송 요청을 막지 않는다.
+    """
+    session.execute(
+        update(DispatchJob)
+        .where(DispatchJob.id == job_id, DispatchJob.status == JOB_RUNNING)
+        .values(status=JOB_PENDING, heartbeat_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+
+
+def _mark_failed(session: Session, job_id: int, message: str) -> None:
+    job = session.get(DispatchJob, job_id, populate_existing=True)
+    if job is None or job.status not in ACTIVE_JOB_STATUSES:
+        return
+    job.status = JOB_FAILED
+    job.error_message = message[:255]
+    job.finished_at = datetime.now(timezone.utc)
+    session.commit()
+
+
+def _run_local_worker(job_id: int) -> None:
+    try:
+        run_dispatch_worker(job_id)
+    finally:
+        with _executor_lock:
+            remaining = _local_workers.get(job_id, 1) - 1
+            if remaining > 0:
+                _local_workers[job_id] = remaining
+            else:
+                _local_workers.pop(job_id, None)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(settings.dispatch_job_workers, 1),
+                thread_name_prefix="campaign-dispatch",
+            )
+        return _executor
@@ -87,22 +87,21 @@ def _update_coupon_status(
     classification: DoneCodeClassification,
     done_desc: Optional[str],
 ) -> None:
-    issue = db.scalar(
+    issues = db.scalars(
         select(CouponIssue).where(CouponIssue.recipient_id == recipient_id)
-    )
-    if not issue:
-        return
-
-    issue.status = classification.coupon_status
-
-    history = CouponStatusHistory(
-        coupon_issue_id=issue.id,
-        status=classification.coupon_status,
-        status_source="SNAP",
-        status_at=datetime.now(timezone.utc),
-        memo=_build_memo(classification, done_desc),
-    )
-    db.add(history)
+    ).all()
+
+    for issue in issues:
+        issue.status = classification.coupon_status
+
+        history = CouponStatusHistory(
+            coupon_issue_id=issue.id,
+            status=classification.coupon_status,
+            status_source="SNAP",
+            status_at=datetime.now(timezone.utc),
+            memo=_build_memo(classification, done_desc),
+        )
+        db.add(history)
 
 
 def _build_memo(classification: DoneCodeClassification, done_desc: Optional[str]) -> str:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import List
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Sequence, Set
 
-from sqlalchemy import select
+from sqlalchemy import and_, exists, func, or_, select, update
 from sqlalchemy.orm import Session
 
-from app.core.crypto import decrypt_value, encrypt_value
+from app.core.config import settings
+from app.core.crypto import decrypt_many, decrypt_value
 from app.models.domain import (
     Campaign,
     CampaignProduct,
@@ -14,128 +16,383 @@ from app.models.domain import (
     CouponIssue,
     CouponProduct,
     MediaAsset,
-    MmsJob,
     RenderedMmsAsset,
 )
-from app.schemas.dispatch import DispatchError, DispatchSummary
-from app.services import coufun_service, snap_service
+from app.schemas.dispatch import DispatchError
+from app.services import issue_ledger_service, snap_service
+from app.services.coufun_service import MAX_CREATE_COUNT
+from app.services.issue_ledger_service import IssueIntent
 
 
-def dispatch_campaign_messages(db: Session, campaign_id: int) -> DispatchSummary:
-    campaign = db.get(Campaign, campaign_id)
-    if not campaign:
-        raise ValueError("캠페인을 찾을 수 없습니다.")
+RECIPIENT_VALIDATED = "VALIDATED"
+RECIPIENT_DISPATCHING = "DISPATCHING"
+RECIPIENT_QUEUED = "QUEUED"
+RECIPIENT_DISPATCH_FAILED = "DISPATCH_FAILED"
 
-    recipients = db.scalars(
-        select(CampaignRecipient).where(
+
+@dataclass
+class DispatchChunkResult:
+    processed: int = 0
+    enqueued: int = 0
+    errors: List[DispatchError] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class DispatchContext:
+    """
+    발송 작업 동안 바뀌지 않는 캠페인 단위 데이터. 작업 시작 시 한 번 읽어 청크마다 재사용한다.
+    """
+
+    campaign: Campaign
+    coupon_product: CouponProduct | None
+    banner_path: str | None
+
+
+@dataclass
+class DispatchPreload:
+    """
+    청크 수신자의 기존 발급 수와 렌더링 이미지 경로. 청크당 IN 조회 한 번씩으로 채운다.
+    """
+
+    issued_counts: Dict[int, int]
+    rendered_paths: Dict[int, str]
+
+
+def load_dispatch_context(db: Session, campaign: Campaign) -> DispatchContext:
+    coupon_product = db.scalar(
+        select(CouponProduct)
+        .join(CampaignProduct, CampaignProduct.coupon_product_id == CouponProduct.id)
+        .where(CampaignProduct.campaign_id == campaign.id)
+    )
+    banner_path = None
+    if campaign.banner_asset_id:
+        banner_path = db.scalar(
+            select(MediaAsset.storage_path).where(MediaAsset.id == campaign.banner_asset_id)
+        )
+    return DispatchContext(campaign=campaign, coupon_product=coupon_product, banner_path=banner_path)
+
+
+def recover_dispatch(db: Session, campaign_id: int) -> None:
+    """
+    발송 작업 시작 시 한 번 호출한다. 중단된 발급 원장을 복구해 미반영 발급 결과를 먼저 채운다.
+    """
+    issue_ledger_service.recover_ledger(db, campaign_id=campaign_id)
+    db.flush()
+
+
+def reset_dispatch_state(db: Session, campaign_id: int) -> int:
+    """
+    새 발송 요청 시 호출한다(진행 중인 작업이 없을 때만). 이전 실행에서 준비에 실패했거나
+    점유된 채 남은 수신자를 VALIDATED로 되돌리고, 발송 대상 수를 반환한다.
+    """
+    db.execute(
+        update(CampaignRecipient)
+        .where(
             CampaignRecipient.campaign_id == campaign_id,
-            CampaignRecipient.status == "VALIDATED",
+            CampaignRecipient.status.in_((RECIPIENT_DISPATCHING, RECIPIENT_DISPATCH_FAILED)),
+        )
+        .values(status=RECIPIENT_VALIDATED, dispatch_claim=None)
+    )
+    return db.scalar(
+        select(func.count(CampaignRecipient.id)).where(
+            CampaignRecipient.campaign_id == campaign_id,
+            CampaignRecipient.status == RECIPIENT_VALIDATED,
+        )
+    ) or 0
+
+
+def claim_recipients(db: Session, campaign_id: int, *, claim_token: str, limit: int) -> List[int]:
+    """
+    발송할 수신자 한 청크를 점유한다. SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커(다른 프로세스/
+    노드 포함)가 잡고 있는 행은 건너뛰고, 고른 행을 DISPATCHING + claim_token으로 표시한다.
+    행 잠금은 점유 표시에만 쓰므로 호출 측이 바로 커밋해야 한다. 쿠폰 발급 원장은 별도 세션에서
+    수신자를 FK로 참조하므로, 발급이 끝날 때까지 행 잠금을 쥐고 있으면 안 된다.
+
+    점유한 워커가 죽어 DISPATCH_CLAIM_TIMEOUT_SECONDS 넘게 DISPATCHING으로 남은 행은 다시 점유한다.
+    살아 있는 워커의 점유는 발송 작업 하트비트(renew_claims)가 갱신하므로, 한 청크의 발급이
+    오래 걸려도 시간 초과로 풀리지 않는다. 시간 초과는 하트비트 주기의 3배보다 짧게 잡지 않는다.
+    MySQL 8.0 / MariaDB 10.6 이상이 필요하다.
+    """
+    stale_before = _claim_stale_before()
+    claimable = or_(
+        CampaignRecipient.status == RECIPIENT_VALIDATED,
+        and_(
+            CampaignRecipient.status == RECIPIENT_DISPATCHING,
+            CampaignRecipient.updated_at < stale_before,
+        ),
+    )
+    while True:
+        recipient_ids = list(
+            db.scalars(
+                select(CampaignRecipient.id)
+                .where(CampaignRecipient.campaign_id == campaign_id, claimable)
+                .order_by(CampaignRecipient.id.asc())
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        if not recipient_ids:
+            return recipient_ids
+        # SKIP LOCKED를 지원하지 않는 DB에서도 두 워커가 같은 행을 잡지 않도록 상태를 다시 확인하며 표시한다.
+        claimed = db.execute(
+            update(CampaignRecipient)
+            .where(CampaignRecipient.id.in_(recipient_ids), claimable)
+            .values(status=RECIPIENT_DISPATCHING, dispatch_claim=claim_token)
+        ).rowcount
+        if claimed == len(recipient_ids):
+            return recipient_ids
+        if claimed:
+            return list(
+                db.scalars(
+                    select(CampaignRecipient.id)
+                    .where(
+                        CampaignRecipient.id.in_(recipient_ids),
+                        CampaignRecipient.dispatch_claim == claim_token,
+                    )
+                    .order_by(CampaignRecipient.id.asc())
+                )
+            )
+        # 고른 행을 모두 다른 워커가 먼저 가져갔으면 다음 후보를 다시 고른다.
+
+
+def renew_claims(db: Session, claims: Dict[str, int]) -> int:
+    """
+    살아 있는 워커의 점유(claim_token → campaign_id)를 갱신해 시간 초과 재점유를 막는다.
+    """
+    if not claims:
+        return 0
+    return db.execute(
+        update(CampaignRecipient)
+        .where(
+            CampaignRecipient.campaign_id.in_(set(claims.values())),
+            CampaignRecipient.status == RECIPIENT_DISPATCHING,
+            CampaignRecipient.dispatch_claim.in_(list(claims)),
+        )
+        .values(updated_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def has_pending_recipients(db: Session, campaign_id: int) -> bool:
+    return bool(
+        db.scalar(
+            select(
+                exists().where(
+                    CampaignRecipient.campaign_id == campaign_id,
+                    CampaignRecipient.status.in_((RECIPIENT_VALIDATED, RECIPIENT_DISPATCHING)),
+                )
+            )
+        )
+    )
+
+
+def has_live_claims(db: Session, campaign_id: int) -> bool:
+    """
+    점유 시간 초과 전인 DISPATCHING 수신자(다른 워커가 처리 중인 청크)가 있는지 확인한다.
+    """
+    return bool(
+        db.scalar(
+            select(
+                exists().where(
+                    CampaignRecipient.campaign_id == campaign_id,
+                    CampaignRecipient.status == RECIPIENT_DISPATCHING,
+                    CampaignRecipient.dispatch_claim.is_not(None),
+                    CampaignRecipient.updated_at >= _claim_stale_before(),
+                )
+            )
+        )
+    )
+
+
+def dispatch_recipients(
+    db: Session,
+    context: DispatchContext,
+    recipient_ids: Sequence[int],
+    *,
+    claim_token: str,
+) -> DispatchChunkResult:
+    """
+    수신자 한 청크에 대해 쿠폰 발급 → UMS_MSG/MmsJob 일괄 INSERT를 수행한다.
+    필요한 조회는 청크 앞에서 집합 단위로 끝내고, 수신자별 처리는 메모리 조회만 한다.
+
+    claim_recipients로 점유한 수신자만 처리한다. 적재 직전에 점유가 유지되는지 잠금과 함께 다시
+    확인하므로, 시간 초과로 다른 워커가 가져간 수신자는 중복 적재하지 않는다. 적재된 수신자는
+    QUEUED, 준비에 실패한 수신자는 DISPATCH_FAILED로 바꾸며, 호출 측(발송 작업)이 청크마다 커밋한다.
+
+    이전 발급 요청(같은 TR_ID)이 아직 진행 중인 수신자는 실패로 보지 않고 점유만 풀어 둔다.
+    DISPATCHING으로 남으므로 점유 시간 초과 뒤 원장 결과가 정리된 상태에서 다시 처리된다.
+    """
+    campaign = context.campaign
+    result = DispatchChunkResult()
+    recipients = db.scalars(
+        select(CampaignRecipient)
+        .where(
+            CampaignRecipient.id.in_(recipient_ids),
+            CampaignRecipient.dispatch_claim == claim_token,
         )
+        .order_by(CampaignRecipient.id.asc())
     ).all()
     if not recipients:
-        raise ValueError("VALIDATED 상태의 수신자가 없습니다.")
+        return result
 
-    errors: List[DispatchError] = []
-    success_count = 0
+    errors = result.errors
+    preload = _preload_chunk(db, campaign.id, [recipient.id for recipient in recipients])
+    issue_in_progress: Set[int] = set()
+    issue_failures = _ensure_coupon_issues(
+        db, context, recipients, preload.issued_counts, in_progress=issue_in_progress
+    )
+
+    phones = _decrypt_phones(recipients)
 
+    messages: List[snap_service.SnapMessage] = []
     for recipient in recipients:
+        if recipient.id in issue_in_progress:
+            continue
+        if recipient.id in issue_failures:
+            errors.append(DispatchError(recipient_id=recipient.id, reason=issue_failures[recipient.id]))
+            continue
         try:
-            phone = decrypt_value(recipient.enc_phone)
+            phone = phones[recipient.id] if phones is not None else decrypt_value(recipient.enc_phone)
             if not phone:
                 raise ValueError("전화번호 복호화 실패")
 
-            client_key = snap_service.build_client_key(campaign.campaign_key, recipient.id)
-            _ensure_coupon_issue(db, campaign, recipient, client_key)
-
-            media_path = _resolve_media_path(db, campaign.id, recipient.id, campaign.banner_asset_id)
-
-            snap_service.enqueue_mms_message(
-                db,
-                client_key=client_key,
-                phone=phone,
-                callback_number=campaign.sender_number,
-                title=campaign.message_title,
-                message=campaign.message_body,
-                media_path=media_path,
-            )
-
-            job = MmsJob(
-                campaign_id=campaign.id,
-                recipient_id=recipient.id,
-                client_key=client_key,
-                ums_msg_id=client_key,
-                req_date=datetime.now(timezone.utc),
-                status="READY",
+            messages.append(
+                snap_service.SnapMessage(
+                    client_key=snap_service.build_client_key(campaign.campaign_key, recipient.id),
+                    phone=phone,
+                    callback_number=campaign.sender_number,
+                    title=campaign.message_title,
+                    message=campaign.message_body,
+                    media_path=preload.rendered_paths.get(recipient.id) or context.banner_path,
+                    recipient_id=recipient.id,
+                )
             )
-            db.add(job)
-            success_count += 1
         except Exception as exc:  # noqa: BLE001
             errors.append(DispatchError(recipient_id=recipient.id, reason=str(exc)))
 
-    db.commit()
+    owned = set(
+        db.scalars(
+            select(CampaignRecipient.id)
+            .where(
+                CampaignRecipient.id.in_([recipient.id for recipient in recipients]),
+                CampaignRecipient.dispatch_claim == claim_token,
+            )
+            .with_for_update()
+        )
+    )
+    messages = [message for message in messages if message.recipient_id in owned]
+    result.errors = [error for error in errors if error.recipient_id in owned]
+    deferred = owned & issue_in_progress
+    result.processed = len(owned) - len(deferred)
 
-    if success_count == 0 and errors:
-        raise ValueError("모든 수신자 발송 준비에 실패했습니다.")
+    # UMS_MSG와 MmsJob은 청크 단위 일괄 INSERT로 적재한다. INSERT 실패는 청크 전체를 실패시킨다.
+    result.enqueued = snap_service.enqueue_mms_messages(db, messages, campaign_id=campaign.id)
+    _finish_claim(db, [message.recipient_id for message in messages], RECIPIENT_QUEUED)
+    _finish_claim(db, [error.recipient_id for error in result.errors], RECIPIENT_DISPATCH_FAILED)
+    _finish_claim(db, deferred, RECIPIENT_DISPATCHING)
+    return result
 
-    return DispatchSummary(enqueued=success_count, failed=len(errors), errors=errors)
 
+def _claim_stale_before() -> datetime:
+    timeout = max(settings.dispatch_claim_timeout_seconds, settings.dispatch_job_heartbeat_seconds * 3)
+    return datetime.now(timezone.utc) - timedelta(seconds=timeout)
 
-def _resolve_media_path(
-    db: Session,
-    campaign_id: int,
-    recipient_id: int,
-    banner_asset_id: int | None,
-) -> str | None:
-    rendered = db.scalars(
-        select(RenderedMmsAsset).where(
+
+def _finish_claim(db: Session, recipient_ids: Iterable[int], status: str) -> None:
+    recipient_ids = list(recipient_ids)
+    if recipient_ids:
+        db.execute(
+            update(CampaignRecipient)
+            .where(CampaignRecipient.id.in_(recipient_ids))
+            .values(status=status, dispatch_claim=None)
+        )
+
+
+def _preload_chunk(db: Session, campaign_id: int, recipient_ids: List[int]) -> DispatchPreload:
+    issued_counts: Dict[int, int] = dict(
+        db.execute(
+            select(CouponIssue.recipient_id, func.count(CouponIssue.id))
+            .where(
+                CouponIssue.campaign_id == campaign_id,
+                CouponIssue.recipient_id.in_(recipient_ids),
+            )
+            .group_by(CouponIssue.recipient_id)
+        ).all()
+    )
+    rendered_paths: Dict[int, str] = {}
+    rows = db.execute(
+        select(RenderedMmsAsset.recipient_id, RenderedMmsAsset.file_path)
+        .where(
             RenderedMmsAsset.campaign_id == campaign_id,
-            RenderedMmsAsset.recipient_id == recipient_id,
+            RenderedMmsAsset.recipient_id.in_(recipient_ids),
         )
-    ).first()
-    if rendered and rendered.file_path:
-        return rendered.file_path
-    if banner_asset_id:
-        media = db.get(MediaAsset, banner_asset_id)
-        if media:
-            return media.storage_path
-    return None
+        .order_by(RenderedMmsAsset.id.asc())
+    )
+    for recipient_id, file_path in rows:
+        # 수신자당 여러 템플릿이 렌더링된 경우 먼저 만들어진 이미지를 쓴다.
+        if file_path and recipient_id not in rendered_paths:
+            rendered_paths[recipient_id] = file_path
+    return DispatchPreload(issued_counts=issued_counts, rendered_paths=rendered_paths)
+
 
+def _decrypt_phones(recipients: Sequence[CampaignRecipient]) -> Dict[int, str | None] | None:
+    """
+    수신자 전화번호를 일괄 복호화한다. 손상된 값이 섞여 실패하면 None을 반환하고,
+    호출 측이 행 단위로 복호화해 실패한 수신자만 오류로 남긴다.
+    """
+    try:
+        plain = decrypt_many([recipient.enc_phone for recipient in recipients])
+    except Exception:  # noqa: BLE001
+        return None
+    return {recipient.id: phone for recipient, phone in zip(recipients, plain)}
 
-def _ensure_coupon_issue(
+
+def _ensure_coupon_issues(
     db: Session,
-    campaign: Campaign,
-    recipient: CampaignRecipient,
-    client_key: str,
-) -> CouponIssue:
-    existing = db.scalar(
-        select(CouponIssue).where(CouponIssue.recipient_id == recipient.id)
-    )
-    if existing:
-        return existing
+    context: DispatchContext,
+    recipients: Sequence[CampaignRecipient],
+    issued_counts: Dict[int, int],
+    *,
+    in_progress: Set[int] | None = None,
+) -> dict[int, str]:
+    """
+    수신자별로 부족한 쿠폰 수(coupons_per_recipient 기준)를 CREATE_CNT 한 번의 호출로
+    발급하며, 수신자 간 호출은 동시에 수행한다. 발급에 실패한 수신자 ID와 사유를 반환한다.
 
-    coupon_product = db.scalar(
-        select(CouponProduct)
-        .join(CampaignProduct, CampaignProduct.coupon_product_id == CouponProduct.id)
-        .where(CampaignProduct.campaign_id == campaign.id)
-    )
+    발급은 TR_ID 원장을 거치므로, 이전 실행이 중단된 캠페인은 recover_dispatch의 원장 복구로
+    미반영 결과가 채워진 상태에서 부족분만 요청한다.
+    """
+    campaign = context.campaign
+    quantity = min(max(campaign.coupons_per_recipient or 1, 1), MAX_CREATE_COUNT)
+    missing = [
+        (recipient, quantity - issued_counts.get(recipient.id, 0))
+        for recipient in recipients
+        if issued_counts.get(recipient.id, 0) < quantity
+    ]
+    if not missing:
+        return {}
+
+    coupon_product = context.coupon_product
     if not coupon_product:
-        raise ValueError("캠페인에 연결된 쿠폰 상품이 없습니다.")
+        reason = "캠페인에 연결된 쿠폰 상품이 없습니다."
+        return {recipient.id: reason for recipient, _ in missing}
 
-    issue_result = coufun_service.issue_coupon(
-        goods_id=coupon_product.goods_id,
-        tr_id=client_key,
-        create_count=1,
-    )
+    intents = [
+        IssueIntent(
+            campaign_id=campaign.id,
+            recipient_id=recipient.id,
+            goods_id=coupon_product.goods_id,
+            tr_id=_build_tr_id(campaign, recipient, issued_counts.get(recipient.id, 0)),
+            create_count=shortage,
+        )
+        for recipient, shortage in missing
+    ]
+    return issue_ledger_service.issue_with_ledger(db, intents, in_progress=in_progress)
 
-    issue = CouponIssue(
-        campaign_id=campaign.id,
-        recipient_id=recipient.id,
-        order_id=issue_result.order_id,
-        barcode_enc=encrypt_value(issue_result.barcode),
-        valid_end_date=issue_result.valid_end_date,
-        status="ISSUED",
-        vendor_payload=issue_result.raw_payload,
-        issued_at=datetime.now(timezone.utc),
-    )
-    db.add(issue)
-    return issue
+
+def _build_tr_id(campaign: Campaign, recipient: CampaignRecipient, already_issued: int) -> str:
+    client_key = snap_service.build_client_key(campaign.campaign_key, recipient.id)
+    if not already_issued:
+        return client_key
+    # 부분 발급 후 보충 발급은 TR_ID 중복(12)을 피하기 위해 접미사를 붙인다.
+    return f"{client_key}-{already_issued}"
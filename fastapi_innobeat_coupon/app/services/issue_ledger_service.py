@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import base64
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.crypto import decrypt_value, encrypt_value, hash_value
+from app.core.rate_limit import bulk_priority
+from app.models.domain import CouponIssue, CouponIssueLedger
+from app.services import coufun_service
+from app.services.coufun_async_service import CoufunIssueRequest, issue_many_blocking
+from app.services.coufun_service import ISSUE_COUNT_MISMATCH_CODE, CoufunAPIError, CoufunIssueResult
+
+logger = logging.getLogger(__name__)
+
+LEDGER_PENDING = "PENDING"
+LEDGER_ISSUED = "ISSUED"
+LEDGER_APPLIED = "APPLIED"
+LEDGER_FAILED = "FAILED"
+LEDGER_UNRESOLVED = "UNRESOLVED"
+# 운영자가 COUFUN에서 미발급을 확인한 UNRESOLVED 건. 다음 발급은 새 TR_ID로 요청한다.
+LEDGER_RELEASED = "RELEASED"
+# 같은 TR_ID가 이미 접수된 경우: 이전 시도가 COUFUN에서 발급됐을 수 있으므로 새 TR_ID로 재발급하지 않는다.
+DUPLICATE_TR_ID_CODES = {"12", "23"}
+# 발급 여부를 확정할 수 없어 자동 재시도하지 않고 UNRESOLVED로 남기는 오류 코드
+UNRESOLVED_ERROR_CODES = DUPLICATE_TR_ID_CODES | {ISSUE_COUNT_MISMATCH_CODE}
+
+
+@dataclass
+class IssueIntent:
+    campaign_id: int
+    recipient_id: int
+    goods_id: str
+    tr_id: str
+    create_count: int = 1
+
+
+def issue_with_ledger(
+    db: Session,
+    intents: Sequence[IssueIntent],
+    *,
+    in_progress: Set[int] | None = None,
+) -> Dict[int, str]:
+    """
+    TR_ID별 발급 의도를 먼저 원장에 커밋한 뒤 COUFUN을 호출하고, 결과(암호화 바코드 포함)를
+    다시 원장에 커밋한다. 이후 CouponIssue 행 생성과 원장 APPLIED 전환은 호출 측 세션(db)에
+    넣어 같은 트랜잭션으로 커밋되게 한다. 발급하지 못한 수신자 ID와 사유를 반환한다.
+
+    in_progress를 넘기면 같은 TR_ID가 아직 PENDING(다른 호출이 진행 중)인 수신자는 실패 대신
+    여기에 담는다. 호출 측은 이 수신자를 실패 처리하지 말고 나중에 다시 처리해야 한다.
+
+    원장 기록은 별도 세션으로 즉시 커밋하므로, 호출 측 커밋 전에 프로세스가 죽어도
+    발급 결과는 원장에 남고 recover_ledger가 이어서 반영한다.
+    """
+    if not intents:
+        return {}
+
+    failures: Dict[int, str] = {}
+    with Session(bind=db.get_bind()) as ledger:
+        entries = _record_intents(ledger, intents, failures, in_progress)
+        callable_entries = [entry for entry in entries if entry.status == LEDGER_PENDING]
+        if callable_entries:
+            _call_and_record(ledger, callable_entries)
+        ledger_ids = [entry.id for entry in entries]
+        for entry in entries:
+            if entry.status in {LEDGER_FAILED, LEDGER_UNRESOLVED}:
+                failures[entry.recipient_id] = _failure_reason(entry)
+
+    apply_issued(db, ledger_ids=ledger_ids)
+    return failures
+
+
+def recover_ledger(db: Session, *, campaign_id: int | None = None) -> Dict[str, int]:
+    """
+    원장 복구 패스.
+
+    - ISSUED(발급 결과는 있으나 CouponIssue 미반영): 원장에 저장된 결과로 반영한다.
+    - 오래된 PENDING(호출 도중 중단): 같은 TR_ID로 다시 호출한다. COUFUN이 이전 요청을
+      처리했다면 TR_ID 중복(12/23)으로 UNRESOLVED가 되어 중복 발급 없이 수동 확인 대상으로 남는다.
+
+    CouponIssue 반영분은 호출 측이 커밋한다.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.issue_ledger_stale_seconds)
+    with Session(bind=db.get_bind()) as ledger:
+        stmt = select(CouponIssueLedger).where(
+            CouponIssueLedger.status == LEDGER_PENDING,
+            CouponIssueLedger.requested_at < stale_before,
+        )
+        if campaign_id is not None:
+            stmt = stmt.where(CouponIssueLedger.campaign_id == campaign_id)
+        stale = list(ledger.scalars(stmt))
+        if stale:
+            for entry in stale:
+                entry.attempts += 1
+                entry.requested_at = datetime.now(timezone.utc)
+            ledger.commit()
+            _call_and_record(ledger, stale)
+
+    applied = apply_issued(db, campaign_id=campaign_id, include_all=True)
+    return {"retried": len(stale), "applied": applied}
+
+
+def apply_issued(
+    db: Session,
+    *,
+    ledger_ids: Sequence[int] | None = None,
+    campaign_id: int | None = None,
+    include_all: bool = False,
+) -> int:
+    """
+    ISSUED 상태 원장 결과로 CouponIssue 행을 만들고 원장을 APPLIED로 바꾼다 (커밋은 호출 측).
+    """
+    if not ledger_ids and not include_all:
+        return 0
+    stmt = select(CouponIssueLedger).where(CouponIssueLedger.status == LEDGER_ISSUED)
+    if ledger_ids:
+        stmt = stmt.where(CouponIssueLedger.id.in_(ledger_ids))
+    if campaign_id is not None:
+        stmt = stmt.where(CouponIssueLedger.campaign_id == campaign_id)
+    entries = list(db.scalars(stmt.with_for_update()))
+
+    applied_at = datetime.now(timezone.utc)
+    for entry in entries:
+        payload = entry.result_payload or {}
+        valid_end_date = _parse_iso(payload.get("valid_end_date"))
+        for coupon in payload.get("coupons", []):
+            barcode_enc = base64.b64decode(coupon["barcode_enc"])
+            barcode = decrypt_value(barcode_enc)
+            db.add(
+                CouponIssue(
+                    campaign_id=entry.campaign_id,
+                    recipient_id=entry.recipient_id,
+                    order_id=entry.order_id or entry.tr_id,
+                    order_seq=coupon.get("order_seq", 1),
+                    barcode_enc=barcode_enc,
+                    barcode_hash=hash_value(barcode) if barcode else None,
+                    valid_end_date=valid_end_date,
+                    status="ISSUED",
+                    vendor_payload=coupon.get("raw"),
+                    issued_at=entry.completed_at or applied_at,
+                )
+            )
+        entry.status = LEDGER_APPLIED
+    return len(entries)
+
+
+def count_unresolved(db: Session, *, campaign_id: int | None = None) -> int:
+    stmt = select(func.count(CouponIssueLedger.id)).where(CouponIssueLedger.status == LEDGER_UNRESOLVED)
+    if campaign_id is not None:
+        stmt = stmt.where(CouponIssueLedger.campaign_id == campaign_id)
+    return db.scalar(stmt) or 0
+
+
+def list_unresolved(
+    db: Session,
+    *,
+    campaign_id: int | None = None,
+    after_id: int | None = None,
+    limit: int = 100,
+) -> List[CouponIssueLedger]:
+    """
+    수동 확인이 필요한 UNRESOLVED 원장 목록 (id 오름차순 keyset 페이지).
+    """
+    stmt = select(CouponIssueLedger).where(CouponIssueLedger.status == LEDGER_UNRESOLVED)
+    if campaign_id is not None:
+        stmt = stmt.where(CouponIssueLedger.campaign_id == campaign_id)
+    if after_id is not None:
+        stmt = stmt.where(CouponIssueLedger.id > after_id)
+    return list(db.scalars(stmt.order_by(CouponIssueLedger.id.asc()).limit(limit)))
+
+
+def resolve_with_barcodes(db: Session, ledger_id: int, barcodes: Sequence[str]) -> CouponIssueLedger:
+    """
+    운영자가 COUFUN에서 확인한 바코드로 UNRESOLVED 건을 발급 완료 처리한다.
+    바코드마다 쿠폰 상태 조회(coufunPartAmountStatus)로 원장 상품의 쿠폰인지 확인한 뒤
+    CouponIssue 행을 만들고 원장을 APPLIED로 바꾼다 (커밋은 호출 측).
+    create_count보다 적게 확인됐으면 부족분은 다음 발송에서 보충 발급된다.
+    """
+    entry = _get_unresolved(db, ledger_id)
+    unique = list(dict.fromkeys(barcode.strip() for barcode in barcodes if barcode and barcode.strip()))
+    if not unique:
+        raise ValueError("바코드를 입력하세요.")
+    if len(unique) > entry.create_count:
+        raise ValueError(f"요청 수량({entry.create_count}개)보다 많은 바코드를 입력했습니다.")
+    existing = db.scalar(
+        select(func.count(CouponIssue.id)).where(
+            CouponIssue.barcode_hash.in_([hash_value(barcode) for barcode in unique])
+        )
+    )
+    if existing:
+        raise ValueError("이미 발급 건으로 등록된 바코드가 있습니다.")
+
+    results: List[CoufunIssueResult] = []
+    for seq, barcode in enumerate(unique, start=1):
+        try:
+            status = coufun_service.get_coupon_status(entry.goods_id, barcode)
+        except CoufunAPIError as exc:
+            raise ValueError(f"COUFUN에서 바코드를 확인하지 못했습니다. ({exc})") from exc
+        results.append(
+            CoufunIssueResult(
+                order_id=entry.order_id or entry.tr_id,
+                barcode=barcode,
+                valid_end_date=status.valid_end_date,
+                raw_payload={"RESOLVED": "MANUAL", "STATUS": status.status_code or ""},
+                order_seq=seq,
+            )
+        )
+
+    entry.status = LEDGER_ISSUED
+    entry.order_id = entry.order_id or entry.tr_id
+    entry.result_payload = _serialize_results(results)
+    entry.completed_at = datetime.now(timezone.utc)
+    db.flush()
+    apply_issued(db, ledger_ids=[entry.id])
+    db.flush()
+    return entry
+
+
+def release_unresolved(db: Session, ledger_id: int) -> CouponIssueLedger:
+    """
+    운영자가 COUFUN에서 미발급을 확인한 UNRESOLVED 건을 RELEASED로 바꾼다 (커밋은 호출 측).
+    COUFUN은 같은 TR_ID를 다시 받지 않으므로 다음 발송은 새 TR_ID로 요청한다.
+    """
+    entry = _get_unresolved(db, ledger_id)
+    entry.status = LEDGER_RELEASED
+    entry.completed_at = datetime.now(timezone.utc)
+    db.flush()
+    return entry
+
+
+def _get_unresolved(db: Session, ledger_id: int) -> CouponIssueLedger:
+    entry = db.get(CouponIssueLedger, ledger_id, with_for_update=True)
+    if entry is None:
+        raise ValueError("발급 원장을 찾을 수 없습니다.")
+    if entry.status != LEDGER_UNRESOLVED:
+        raise ValueError("수동 확인 대상(UNRESOLVED) 원장만 처리할 수 있습니다.")
+    return entry
+
+
+def _record_intents(
+    ledger: Session,
+    intents: Sequence[IssueIntent],
+    failures: Dict[int, str],
+    in_progress: Set[int] | None = None,
+) -> List[CouponIssueLedger]:
+    existing = {
+        entry.tr_id: entry
+        for entry in ledger.scalars(
+            select(CouponIssueLedger).where(
+                CouponIssueLedger.tr_id.in_([intent.tr_id for intent in intents])
+            )
+        )
+    }
+    now = datetime.now(timezone.utc)
+    entries: List[CouponIssueLedger] = []
+    for intent in intents:
+        tr_id = intent.tr_id
+        entry = existing.get(tr_id)
+        while entry is not None and entry.status == LEDGER_RELEASED:
+            # 미발급이 확인돼 놓아준 TR_ID는 COUFUN이 중복(12)으로 거절하므로 새 TR_ID를 쓴다.
+            tr_id = f"{intent.tr_id}-R{entry.id}"
+            entry = ledger.scalar(select(CouponIssueLedger).where(CouponIssueLedger.tr_id == tr_id))
+        if entry is None:
+            entry = CouponIssueLedger(
+                tr_id=tr_id,
+                campaign_id=intent.campaign_id,
+                recipient_id=intent.recipient_id,
+                goods_id=intent.goods_id,
+                create_count=intent.create_count,
+                status=LEDGER_PENDING,
+                attempts=1,
+                requested_at=now,
+            )
+            ledger.add(entry)
+        elif entry.status == LEDGER_FAILED:
+            # 명확히 실패한 요청은 같은 TR_ID로 다시 시도한다 (이미 처리됐다면 12/23으로 드러난다).
+            entry.status = LEDGER_PENDING
+            entry.create_count = intent.create_count
+            entry.attempts += 1
+            entry.requested_at = now
+            entry.error_code = None
+            entry.error_message = None
+        elif entry.status == LEDGER_PENDING:
+            if in_progress is not None:
+                in_progress.add(intent.recipient_id)
+            else:
+                failures[intent.recipient_id] = "이전 발급 요청의 결과를 확인 중입니다."
+            continue
+        elif entry.status == LEDGER_APPLIED:
+            continue
+        entries.append(entry)
+    try:
+        ledger.commit()
+    except IntegrityError as exc:
+        ledger.rollback()
+        raise ValueError("같은 TR_ID로 발급이 진행 중입니다. 잠시 후 다시 시도하세요.") from exc
+    return entries
+
+
+def _call_and_record(ledger: Session, entries: List[CouponIssueLedger]) -> None:
+    requests = [
+        CoufunIssueRequest(goods_id=entry.goods_id, tr_id=entry.tr_id, create_count=entry.create_count)
+        for entry in entries
+    ]
+    with bulk_priority():
+        results = issue_many_blocking(requests)
+
+    completed_at = datetime.now(timezone.utc)
+    for entry, result in zip(entries, results):
+        entry.completed_at = completed_at
+        if isinstance(result, CoufunAPIError):
+            entry.error_code = result.code
+            entry.error_message = str(result)
+            entry.status = LEDGER_UNRESOLVED if result.code in UNRESOLVED_ERROR_CODES else LEDGER_FAILED
+            if entry.status == LEDGER_UNRESOLVED:
+                logger.warning("발급 결과 확인 필요 (tr_id=%s, code=%s)", entry.tr_id, result.code)
+            continue
+        entry.status = LEDGER_ISSUED
+        entry.order_id = result[0].order_id if result else None
+        entry.result_payload = _serialize_results(result)
+    ledger.commit()
+
+
+def _serialize_results(results: List[CoufunIssueResult]) -> dict:
+    # 바코드는 암호화해 보관하고, 원문 응답에서도 바코드 값은 제외한다.
+    valid_end_date = results[0].valid_end_date if results else None
+    return {
+        "valid_end_date": valid_end_date.isoformat() if valid_end_date else None,
+        "coupons": [
+            {
+                "order_seq": result.order_seq,
+                "barcode_enc": base64.b64encode(encrypt_value(result.barcode)).decode("ascii"),
+                "raw": {
+                    key: value for key, value in result.raw_payload.items() if key != "BARCODE_NUM"
+                },
+            }
+            for result in results
+        ],
+    }
+
+
+def _failure_reason(entry: CouponIssueLedger) -> str:
+    if entry.status == LEDGER_UNRESOLVED and entry.error_code == ISSUE_COUNT_MISMATCH_CODE:
+        return f"발급 응답 바코드 수가 요청과 달라 수동 확인이 필요합니다. (tr_id={entry.tr_id})"
+    if entry.status == LEDGER_UNRESOLVED:
+        return f"TR_ID 중복 응답({entry.error_code})으로 수동 확인이 필요합니다. (tr_id={entry.tr_id})"
+    return entry.error_message or "쿠폰 발급 실패"
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
@@ -1,44 +1,38 @@
 from __future__ import annotations
 
+from itertools import islice
+from typing import Iterable, Iterator, List
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.domain import CouponProduct, ProductSyncLog
 from app.services import coufun_service
-from app.services.coufun_service import CoufunAPIError
+from app.services.coufun_service import CoufunAPIError, CoufunProduct
+
+SYNC_CHUNK_SIZE = 500
 
 
 def sync_coufun_products(db: Session) -> dict:
     request_payload = {"endpoint": "coufunProduct.do"}
     try:
-        response = coufun_service.fetch_goods_list()
-        products = response.products
+        stream = coufun_service.stream_goods_list()
         synced = 0
 
-        for product in products:
-            existing = db.scalar(
-                select(CouponProduct).where(CouponProduct.goods_id == product.goods_id)
-            )
-            if not existing:
-                existing = CouponProduct(goods_id=product.goods_id)
-                db.add(existing)
-            existing.name = product.name
-            existing.face_value = product.face_value
-            existing.purchase_price = product.purchase_price
-            existing.valid_days = product.valid_days
-            existing.vendor_status = product.status
-            synced += 1
+        # 상품 목록을 스트림으로 받아 청크 단위로 upsert 후 세션에서 분리해 메모리를 일정하게 유지한다.
+        for chunk in _chunked(stream, SYNC_CHUNK_SIZE):
+            synced += _upsert_products(db, chunk)
 
         log = ProductSyncLog(
             sync_type="COUFUN_GOODS",
-            request_payload={**request_payload, "count": len(products)},
-            response_code=response.result_code or "00",
+            request_payload={**request_payload, "count": stream.count},
+            response_code=stream.result_code or "00",
             synced_count=synced,
             status="SUCCESS",
         )
         db.add(log)
         db.commit()
-        return {"synced": synced, "result_code": response.result_code}
+        return {"synced": synced, "result_code": stream.result_code}
     except CoufunAPIError as exc:
         db.rollback()
         failure_log = ProductSyncLog(
@@ -52,3 +46,39 @@ def sync_coufun_products(db: Session) -> dict:
         db.add(failure_log)
         db.commit()
         raise
+
+
+def _upsert_products(db: Session, products: List[CoufunProduct]) -> int:
+    goods_ids = {product.goods_id for product in products}
+    existing_map = {
+        item.goods_id: item
+        for item in db.scalars(
+            select(CouponProduct).where(CouponProduct.goods_id.in_(goods_ids))
+        )
+    }
+
+    for product in products:
+        existing = existing_map.get(product.goods_id)
+        if not existing:
+            existing = CouponProduct(goods_id=product.goods_id)
+            db.add(existing)
+            existing_map[product.goods_id] = existing
+        existing.name = product.name
+        existing.face_value = product.face_value
+        existing.purchase_price = product.purchase_price
+        existing.valid_days = product.valid_days
+        existing.vendor_status = product.status
+
+    db.flush()
+    for item in existing_map.values():
+        db.expunge(item)
+    return len(products)
+
+
+def _chunked(items: Iterable[CoufunProduct], size: int) -> Iterator[List[CoufunProduct]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import FrozenSet, Iterable, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.domain import CampaignRecipient
+
+# (행 수, 최대 ID, 최대 updated_at): 추가/삭제/번호 변경이 있으면 달라진다.
+Signature = Tuple[int, int | None, datetime | None]
+
+
+@dataclass(frozen=True)
+class CampaignPhoneHashes:
+    signature: Signature
+    hashes: FrozenSet[bytes]
+
+    def __contains__(self, phone_hash: bytes) -> bool:
+        return phone_hash in self.hashes
+
+
+class _CampaignHashCache:
+    """
+    캠페인별 기존 수신자 phone_hash 집합 캐시. 업로드마다 서명 조회 한 번으로 유효성을 확인하고,
+    바뀐 경우에만 캠페인 전체 해시를 한 번에 다시 읽는다.
+    """
+
+    def __init__(self, max_campaigns: int) -> None:
+        self.max_campaigns = max(max_campaigns, 1)
+        self._items: OrderedDict[int, CampaignPhoneHashes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, campaign_id: int) -> CampaignPhoneHashes | None:
+        with self._lock:
+            entry = self._items.get(campaign_id)
+            if entry is not None:
+                self._items.move_to_end(campaign_id)
+            return entry
+
+    def put(self, campaign_id: int, entry: CampaignPhoneHashes) -> None:
+        with self._lock:
+            self._items[campaign_id] = entry
+            self._items.move_to_end(campaign_id)
+            while len(self._items) > self.max_campaigns:
+                self._items.popitem(last=False)
+
+    def discard(self, campaign_id: int) -> None:
+        with self._lock:
+            self._items.pop(campaign_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_cache = _CampaignHashCache(settings.recipient_hash_cache_campaigns)
+
+
+def load_phone_hashes(db: Session, campaign_id: int) -> CampaignPhoneHashes:
+    """
+    캠페인의 기존 수신자 phone_hash 집합을 반환한다 (캐시 적중 시 서명 조회 1회, 미스 시 1회 추가).
+    """
+    signature = _signature(db, campaign_id)
+    entry = _cache.get(campaign_id)
+    if entry is None or entry.signature != signature:
+        hashes = frozenset(
+            db.scalars(
+                select(CampaignRecipient.phone_hash).where(CampaignRecipient.campaign_id == campaign_id)
+            )
+        )
+        entry = CampaignPhoneHashes(signature=signature, hashes=hashes)
+        _cache.put(campaign_id, entry)
+    return entry
+
+
+def remember_added(
+    db: Session,
+    campaign_id: int,
+    base: CampaignPhoneHashes,
+    added: Iterable[bytes],
+) -> None:
+    """
+    업로드 커밋 후 새로 추가된 해시를 캐시에 합친다. 그 사이 다른 변경이 섞였다면(행 수 불일치)
+    캐시를 버려 다음 업로드에서 다시 읽게 한다.
+    """
+    added = frozenset(added)
+    signature = _signature(db, campaign_id)
+    if signature[0] != base.signature[0] + len(added):
+        _cache.discard(campaign_id)
+        return
+    _cache.put(campaign_id, CampaignPhoneHashes(signature=signature, hashes=base.hashes | added))
+
+
+def invalidate(campaign_id: int) -> None:
+    _cache.discard(campaign_id)
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+def _signature(db: Session, campaign_id: int) -> Signature:
+    count, max_id, max_updated_at = db.execute(
+        select(
+            func.count(CampaignRecipient.id),
+            func.max(CampaignRecipient.id),
+            func.max(CampaignRecipient.updated_at),
+        ).where(CampaignRecipient.campaign_id == campaign_id)
+    ).one()
+    return (int(count or 0), max_id, max_updated_at)
@@ -10,8 +10,8 @@ from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.crypto import decrypt_value
-from app.core.phone import mask_phone
+from app.core.crypto import decrypt_many, decrypt_value
+from app.core.phone import mask_phone, mask_phones
 from app.models.domain import (
     Campaign,
     CampaignProduct,
@@ -132,13 +132,14 @@ def get_campaign_detail(
         .order_by(CampaignRecipient.id.desc())
         .limit(recipient_limit)
     ).all()
+    masked_phones = mask_phones(decrypt_many([recipient.enc_phone for recipient in recipients]))
     recipient_items = [
         RecipientBrief(
             id=recipient.id,
             status=recipient.status,
-            phone_masked=mask_phone(decrypt_value(recipient.enc_phone)),
+            phone_masked=phone_masked,
         )
-        for recipient in recipients
+        for recipient, phone_masked in zip(recipients, masked_phones)
     ]
 
     return CampaignDetail(
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
-from sqlalchemy import text
+from sqlalchemy import insert, text
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.models.domain import MmsJob
 
 INSERT_UMS_SQL = text(
     """
@@ -54,6 +56,18 @@ def build_client_key(campaign_key: str, recipient_id: int) -> str:
     return f"{trimmed}-{suffix}"
 
 
+@dataclass(frozen=True)
+class SnapMessage:
+    client_key: str
+    phone: str
+    callback_number: str
+    title: str
+    message: str
+    media_path: Optional[str]
+    # 캠페인 발송이면 MmsJob 행을 함께 만든다.
+    recipient_id: Optional[int] = None
+
+
 def enqueue_mms_message(
     db: Session,
     *,
@@ -67,20 +81,70 @@ def enqueue_mms_message(
     """
     SNAP Agent UMS_MSG 테이블에 레코드를 INSERT 한다.
     """
-    params = {
-        "client_key": client_key,
+    params = _ums_params(
+        SnapMessage(
+            client_key=client_key,
+            phone=phone,
+            callback_number=callback_number,
+            title=title,
+            message=message,
+            media_path=media_path,
+        ),
+        datetime.now(timezone.utc),
+    )
+    db.execute(INSERT_UMS_SQL, params)
+
+
+def enqueue_mms_messages(
+    db: Session,
+    messages: Sequence[SnapMessage],
+    *,
+    campaign_id: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    여러 메시지를 UMS_MSG에 chunk_size 단위 executemany로 INSERT 한다.
+    PyMySQL은 INSERT executemany를 다중 행 VALUES 문장으로 묶어 보내므로 행마다 왕복하지 않는다.
+    campaign_id가 주어지면 같은 청크의 MmsJob(READY) 행도 일괄 INSERT 한다.
+    한 번의 호출에서 REQ_DATE는 같은 값을 쓰며, 커밋은 호출 측에서 한다.
+    """
+    size = max(chunk_size or settings.snap_enqueue_chunk_size, 1)
+    req_date = datetime.now(timezone.utc)
+    for start in range(0, len(messages), size):
+        chunk = messages[start : start + size]
+        db.execute(INSERT_UMS_SQL, [_ums_params(message, req_date) for message in chunk])
+        if campaign_id is not None:
+            db.execute(
+                insert(MmsJob),
+                [
+                    {
+                        "campaign_id": campaign_id,
+                        "recipient_id": message.recipient_id,
+                        "client_key": message.client_key,
+                        "ums_msg_id": message.client_key,
+                        "req_date": req_date,
+                        "status": "READY",
+                    }
+                    for message in chunk
+                ],
+            )
+    return len(messages)
+
+
+def _ums_params(message: SnapMessage, req_date: datetime) -> dict:
+    return {
+        "client_key": message.client_key,
         "req_ch": settings.snap_req_channel,
         "traffic_type": settings.snap_traffic_type,
-        "req_date": datetime.now(timezone.utc),
-        "callback_number": callback_number,
-        "phone": phone,
-        "msg": message,
-        "title": title,
-        "mms_file_list": media_path,
+        "req_date": req_date,
+        "callback_number": message.callback_number,
+        "phone": message.phone,
+        "msg": message.message,
+        "title": message.title,
+        "mms_file_list": message.media_path,
         "req_dept_code": settings.snap_req_dept_code,
         "req_user_id": settings.snap_req_user_id,
     }
-    db.execute(INSERT_UMS_SQL, params)
 
 
 def fetch_delivery_status(
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Set
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.crypto import hash_many
+from app.core.phone import normalize_phones, validate_phones
+from app.models.domain import PhoneSuppression
+
+SCREEN_QUERY_CHUNK_SIZE = 1000
+
+
+@dataclass
+class SuppressionImportResult:
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+
+
+class _SuppressionFilter:
+    """
+    발송 제외 번호 블룸 필터. 프로세스 안에서 공유하며, 마지막으로 읽은 id 이후 행만 읽어
+    증분으로 채운다. 삭제된 번호의 비트는 남지만 양성 판정은 항상 DB로 확인하므로 결과에는
+    영향이 없고, 용량을 넘기면 처음부터 다시 만든다.
+
+    id는 INSERT 시점에 정해지므로 늦게 커밋된 트랜잭션의 행은 이미 읽은 id보다 작을 수 있다.
+    그래서 직전 갱신 시각에서 SUPPRESSION_BLOOM_RESCAN_SECONDS만큼 거슬러 올라간 created_at
+    이후 행도 다시 읽고(비트 추가는 멱등), 그보다 오래 열린 트랜잭션은 주기적 전체 재구성
+    (SUPPRESSION_BLOOM_REBUILD_SECONDS)으로 보정한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bloom: BloomFilter | None = None
+        self._last_id = 0
+        self._last_refresh_at: datetime | None = None
+        self._built_at = 0.0
+
+    def refresh(self, db: Session) -> BloomFilter:
+        with self._lock:
+            started_at = datetime.now(timezone.utc)
+            if (
+                self._bloom is None
+                or self._bloom.saturated
+                or time.monotonic() - self._built_at >= settings.suppression_bloom_rebuild_seconds
+            ):
+                self._bloom = self._new_filter(db)
+                self._built_at = time.monotonic()
+                self._last_id = 0
+                self._last_refresh_at = None
+            stmt = select(PhoneSuppression.id, PhoneSuppression.phone_hash)
+            if self._last_refresh_at is None:
+                stmt = stmt.where(PhoneSuppression.id > self._last_id)
+            else:
+                rescan_since = self._last_refresh_at - timedelta(seconds=settings.suppression_bloom_rescan_seconds)
+                stmt = stmt.where(
+                    or_(PhoneSuppression.id > self._last_id, PhoneSuppression.created_at >= rescan_since)
+                )
+            rows = db.execute(stmt.execution_options(yield_per=SCREEN_QUERY_CHUNK_SIZE))
+            for suppression_id, phone_hash in rows:
+                self._bloom.add(phone_hash)
+                self._last_id = max(self._last_id, suppression_id)
+            self._last_refresh_at = started_at
+            return self._bloom
+
+    def add(self, phone_hashes: Iterable[bytes]) -> None:
+        """
+        방금 등록한 번호를 다음 갱신을 기다리지 않고 필터에 넣는다. 비트 갱신이 겹치지 않도록 잠금 안에서 한다.
+        """
+        with self._lock:
+            if self._bloom is None:
+                return
+            for phone_hash in phone_hashes:
+                self._bloom.add(phone_hash)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._last_id = 0
+            self._last_refresh_at = None
+
+    @staticmethod
+    def _new_filter(db: Session) -> BloomFilter:
+        current = db.scalar(select(func.count(PhoneSuppression.id))) or 0
+        # 현재 건수가 설정 용량을 넘으면 여유를 두고 늘린다.
+        capacity = max(settings.suppression_bloom_capacity, current * 2)
+        return BloomFilter(capacity, settings.suppression_bloom_error_rate)
+
+
+_filter = _SuppressionFilter()
+
+
+def refresh_filter(db: Session) -> BloomFilter:
+    """
+    블룸 필터를 최신 상태로 맞춘다. 새로 등록된 행이 없으면 빈 결과 조회 1회로 끝난다.
+    """
+    return _filter.refresh(db)
+
+
+def screen(db: Session, phone_hashes: Iterable[bytes], bloom: BloomFilter | None = None) -> Set[bytes]:
+    """
+    발송 제외 대상 phone_hash 집합을 반환한다. 블룸 필터로 걸러낸 후보만 IN 조회로 확인하므로
+    대부분의 청크는 DB 조회 없이 끝난다.
+    """
+    if bloom is None:
+        bloom = refresh_filter(db)
+    candidates = list({phone_hash for phone_hash in phone_hashes if phone_hash in bloom})
+    suppressed: Set[bytes] = set()
+    for start in range(0, len(candidates), SCREEN_QUERY_CHUNK_SIZE):
+        chunk = candidates[start : start + SCREEN_QUERY_CHUNK_SIZE]
+        suppressed.update(
+            db.scalars(select(PhoneSuppression.phone_hash).where(PhoneSuppression.phone_hash.in_(chunk)))
+        )
+    return suppressed
+
+
+def add_suppressions(
+    db: Session,
+    phones: List[str],
+    *,
+    reason: str | None = None,
+    source: str | None = None,
+    actor: str | None = None,
+    bloom: BloomFilter | None = None,
+) -> SuppressionImportResult:
+    """
+    번호 목록을 발송 제외 목록에 추가한다. 형식 오류와 이미 등록된 번호는 건너뛴다.
+    파일 가져오기처럼 여러 번 나눠 부르는 경우 refresh_filter 결과를 bloom으로 넘겨 필터 갱신을 한 번만 한다.
+    다른 요청이 같은 번호를 동시에 넣어도 충돌한 행은 무시하고 중복으로 센다. 커밋은 호출 측에서 한다.
+    """
+    result = SuppressionImportResult()
+    normalized = normalize_phones(phones)
+    valid = validate_phones(normalized)
+    result.invalid = valid.count(False)
+    hashes = list(dict.fromkeys(hash_many([phone for phone, ok in zip(normalized, valid) if ok])))
+    result.duplicates = (len(normalized) - result.invalid) - len(hashes)
+
+    existing = screen(db, hashes, bloom)
+    new_hashes = [phone_hash for phone_hash in hashes if phone_hash not in existing]
+    stmt = (
+        insert(PhoneSuppression.__table__)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    )
+    chunk_size = max(settings.upload_insert_chunk_size, 1)
+    for start in range(0, len(new_hashes), chunk_size):
+        rows = [
+            {
+                "phone_hash": phone_hash,
+                "reason": reason,
+                "source": source,
+                "created_by": actor,
+                "updated_by": actor,
+            }
+            for phone_hash in new_hashes[start : start + chunk_size]
+        ]
+        result.imported += db.execute(stmt, rows).rowcount
+    result.duplicates += len(hashes) - result.imported
+    _filter.add(new_hashes)
+    return result
+
+
+def remove_suppressions(db: Session, phones: List[str]) -> int:
+    """
+    발송 제외 목록에서 번호를 삭제한다. 블룸 필터는 그대로 두며(오탐만 늘어남) 커밋은 호출 측에서 한다.
+    """
+    normalized = normalize_phones(phones)
+    valid = validate_phones(normalized)
+    hashes = list(set(hash_many([phone for phone, ok in zip(normalized, valid) if ok])))
+    removed = 0
+    for start in range(0, len(hashes), SCREEN_QUERY_CHUNK_SIZE):
+        chunk = hashes[start : start + SCREEN_QUERY_CHUNK_SIZE]
+        removed += db.execute(delete(PhoneSuppression).where(PhoneSuppression.phone_hash.in_(chunk))).rowcount
+    return removed
+
+
+def reset_filter() -> None:
+    _filter.reset()
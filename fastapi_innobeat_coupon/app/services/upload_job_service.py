@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, List
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.domain import Campaign, CampaignRecipient, RecipientBatch, RecipientValidationError
+from app.services import recipient_hash_cache_service, upload_service
+
+logger = logging.getLogger(__name__)
+
+JOB_UPLOADING = "UPLOADING"
+JOB_PENDING = "PENDING"
+JOB_RUNNING = "RUNNING"
+JOB_COMPLETED = "COMPLETED"
+JOB_FAILED = "FAILED"
+JOB_CANCELLED = "CANCELLED"
+ACTIVE_JOB_STATUSES = upload_service.ACTIVE_UPLOAD_STATUSES
+
+JOB_DIR = Path(settings.upload_job_dir)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+# 이 프로세스의 작업 풀에 들어간(대기/실행 중) 배치. 주기 작업이 updated_at을 하트비트로 갱신한다.
+_inflight: set[int] = set()
+_inflight_lock = threading.Lock()
+
+
+@dataclass
+class UploadPart:
+    part_number: int
+    size: int
+
+
+def submit_upload_job(
+    db: Session,
+    *,
+    campaign_id: int,
+    filename: str | None,
+    source: BinaryIO,
+    uploaded_by: int | None,
+) -> RecipientBatch:
+    """
+    업로드 파일을 작업 디렉터리에 옮겨 두고 PENDING 배치를 만든 뒤 작업 풀에 넣는다.
+    검증/저장은 run_upload_job이 백그라운드에서 수행한다.
+    """
+    batch = _new_batch(db, campaign_id=campaign_id, filename=filename, uploaded_by=uploaded_by, status=JOB_PENDING)
+    path = _job_path(batch.id)
+    try:
+        _write_file(path, source)
+        batch.file_size = path.stat().st_size
+        if not batch.file_size:
+            raise ValueError("업로드된 파일이 비어 있습니다.")
+        db.commit()
+    except Exception:
+        db.rollback()
+        path.unlink(missing_ok=True)
+        raise
+
+    _submit(batch.id)
+    return batch
+
+
+def get_upload_job(db: Session, campaign_id: int, batch_id: int) -> RecipientBatch:
+    batch = db.get(RecipientBatch, batch_id)
+    if not batch or batch.campaign_id != campaign_id:
+        raise ValueError("업로드 작업을 찾을 수 없습니다.")
+    return batch
+
+
+def resume_upload_job(db: Session, campaign_id: int, batch_id: int) -> RecipientBatch:
+    """
+    실패한 작업을 체크포인트(last_committed_row) 다음 행부터 다시 처리한다.
+    """
+    batch = get_upload_job(db, campaign_id, batch_id)
+    if batch.status != JOB_FAILED:
+        raise ValueError("실패한 업로드 작업만 재개할 수 있습니다.")
+    _require_local_file(batch)
+    if not _job_path(batch.id).exists():
+        raise ValueError("재개할 업로드 파일이 없습니다. 파일을 다시 업로드하세요.")
+    upload_service.lock_campaign_for_upload(db, campaign_id)
+    db.refresh(batch)
+    if batch.status != JOB_FAILED:
+        raise ValueError("실패한 업로드 작업만 재개할 수 있습니다.")
+    batch.status = JOB_PENDING
+    batch.error_message = None
+    batch.finished_at = None
+    db.commit()
+    _submit(batch.id)
+    return batch
+
+
+def discard_upload_job(db: Session, campaign_id: int, batch_id: int) -> RecipientBatch:
+    """
+    실패했거나 업로드 중인 작업을 폐기한다. 이 배치로 들어간 수신자/오류 행과 파일을 모두 지운다.
+    """
+    batch = get_upload_job(db, campaign_id, batch_id)
+    if batch.status not in (JOB_FAILED, JOB_UPLOADING):
+        raise ValueError("실패했거나 업로드 중인 작업만 폐기할 수 있습니다.")
+    _require_local_file(batch)
+    _delete_batch_rows(db, batch.id)
+    batch.status = JOB_CANCELLED
+    batch.finished_at = datetime.now(timezone.utc)
+    db.commit()
+    recipient_hash_cache_service.invalidate(batch.campaign_id)
+    _remove_files(batch.id)
+    return batch
+
+
+def create_upload_session(
+    db: Session,
+    *,
+    campaign_id: int,
+    filename: str | None,
+    uploaded_by: int | None,
+) -> RecipientBatch:
+    """
+    분할 업로드 세션을 연다. 파트는 번호별로 따로 저장되므로 끊긴 파트만 다시 보내면 된다.
+    """
+    batch = _new_batch(db, campaign_id=campaign_id, filename=filename, uploaded_by=uploaded_by, status=JOB_UPLOADING)
+    batch.file_size = 0
+    db.commit()
+    return batch
+
+
+def put_upload_part(
+    db: Session,
+    campaign_id: int,
+    batch_id: int,
+    *,
+    part_number: int,
+    source: BinaryIO,
+) -> RecipientBatch:
+    batch = _get_uploading(db, campaign_id, batch_id)
+    if part_number < 1:
+        raise ValueError("파트 번호는 1 이상이어야 합니다.")
+    # 같은 번호를 다시 보내면 덮어쓴다. 임시 파일에 쓴 뒤 교체해 반쯤 쓰인 파트가 남지 않게 한다.
+    path = _part_path(batch.id, part_number)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        _write_file(tmp_path, source)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    batch.file_size = sum(part.size for part in list_upload_parts(batch.id))
+    db.commit()
+    return batch
+
+
+def complete_upload_session(db: Session, campaign_id: int, batch_id: int, *, part_count: int) -> RecipientBatch:
+    """
+    1..part_count 파트가 모두 도착했는지 확인하고 하나의 파일로 이어 붙인 뒤 작업을 시작한다.
+    """
+    batch = _get_uploading(db, campaign_id, batch_id)
+    upload_service.lock_campaign_for_upload(db, campaign_id)
+    received = {part.part_number for part in list_upload_parts(batch.id)}
+    missing = [number for number in range(1, part_count + 1) if number not in received]
+    if part_count < 1 or missing:
+        raise ValueError(f"누락된 파트가 있습니다: {missing[:20]}")
+    extra = sorted(received - set(range(1, part_count + 1)))
+    if extra:
+        raise ValueError(f"part_count보다 큰 번호의 파트가 있습니다: {extra[:20]}")
+
+    path = _job_path(batch.id)
+    with path.open("wb") as target:
+        for number in range(1, part_count + 1):
+            with _part_path(batch.id, number).open("rb") as part:
+                shutil.copyfileobj(part, target)
+    batch.file_size = path.stat().st_size
+    if not batch.file_size:
+        path.unlink(missing_ok=True)
+        raise ValueError("업로드된 파일이 비어 있습니다.")
+    batch.status = JOB_PENDING
+    db.commit()
+    for number in range(1, part_count + 1):
+        _part_path(batch.id, number).unlink(missing_ok=True)
+
+    _submit(batch.id)
+    return batch
+
+
+def list_upload_parts(batch_id: int) -> List[UploadPart]:
+    parts: List[UploadPart] = []
+    for path in JOB_DIR.glob(f"{batch_id}.part*"):
+        suffix = path.name.rsplit(".part", 1)[-1]
+        if suffix.isdigit():
+            parts.append(UploadPart(part_number=int(suffix), size=path.stat().st_size))
+    return sorted(parts, key=lambda part: part.part_number)
+
+
+def run_upload_job(batch_id: int) -> None:
+    """
+    청크마다 커밋해 진행 카운터와 체크포인트를 남긴다. 실패하면 커밋된 행은 그대로 두고
+    FAILED로 표시하며, 재개(resume_upload_job) 시 체크포인트 다음 행부터 이어서 처리한다.
+    """
+    path = _job_path(batch_id)
+    session = SessionLocal()
+    completed = False
+    try:
+        # 같은 배치가 두 번 제출돼도(재시작 복구 등) 한 워커만 PENDING → RUNNING으로 가져간다.
+        claimed = session.execute(
+            update(RecipientBatch)
+            .where(RecipientBatch.id == batch_id, RecipientBatch.status == JOB_PENDING)
+            .values(
+                status=JOB_RUNNING,
+                started_at=func.coalesce(RecipientBatch.started_at, datetime.now(timezone.utc)),
+            )
+        ).rowcount
+        session.commit()
+        batch = session.get(RecipientBatch, batch_id)
+        if not claimed or batch is None:
+            return
+
+        with path.open("rb") as stream:
+            result = upload_service.ingest_recipient_file(
+                session,
+                batch,
+                stream,
+                max_rows=settings.upload_job_max_rows,
+                on_chunk=session.commit,
+            )
+        batch.status = JOB_COMPLETED
+        batch.processed_bytes = batch.file_size or batch.processed_bytes
+        batch.finished_at = datetime.now(timezone.utc)
+        session.commit()
+        completed = True
+    except Exception as exc:  # noqa: BLE001
+        session.rollback()
+        if isinstance(exc, ValueError):
+            message = str(exc)
+        else:
+            logger.exception("수신자 업로드 작업 실패 (batch_id=%s)", batch_id)
+            message = "업로드 처리 중 오류가 발생했습니다. 재개할 수 있습니다."
+        _mark_failed(session, batch_id, message)
+    else:
+        try:
+            upload_service.remember_ingested(session, batch.campaign_id, result)
+        except Exception:  # noqa: BLE001
+            recipient_hash_cache_service.invalidate(batch.campaign_id)
+    finally:
+        session.close()
+        with _inflight_lock:
+            _inflight.discard(batch_id)
+        if completed:
+            path.unlink(missing_ok=True)
+
+
+def recover_stale_upload_jobs() -> tuple[int, int]:
+    """
+    주기적으로(기동 시 포함) 호출한다. 이 프로세스가 맡은 작업의 하트비트(updated_at)를 갱신한 뒤,
+    하트비트가 끊긴 PENDING/RUNNING 작업을 정리하고 (재개한 건수, 실패 처리한 건수)를 반환한다.
+
+    - 파일이 이 노드에 있는 작업: 하트비트 2주기 동안 갱신이 없으면 체크포인트부터 자동 재개한다.
+    - 다른 노드의 작업: UPLOAD_JOB_STALE_SECONDS 동안 갱신이 없으면 FAILED로 바꾼다.
+      파일을 가진 노드가 먼저 재개할 기회를 갖도록 기준을 더 길게 둔다.
+    """
+    now = datetime.now(timezone.utc)
+    orphan_before = now - timedelta(seconds=settings.upload_job_heartbeat_seconds * 2)
+    stale_before = now - timedelta(seconds=settings.upload_job_stale_seconds)
+    with _inflight_lock:
+        inflight = set(_inflight)
+    resumed: list[int] = []
+    failed = 0
+    with SessionLocal() as session:
+        if inflight:
+            session.execute(
+                update(RecipientBatch)
+                .where(RecipientBatch.id.in_(inflight), RecipientBatch.status.in_(ACTIVE_JOB_STATUSES))
+                .values(updated_at=now)
+            )
+            session.commit()
+        candidates = list(
+            session.scalars(
+                select(RecipientBatch).where(
+                    RecipientBatch.status.in_(ACTIVE_JOB_STATUSES),
+                    RecipientBatch.updated_at < orphan_before,
+                )
+            )
+        )
+        for batch in candidates:
+            if batch.id in inflight:
+                continue
+            if _is_file_local(batch) and _job_path(batch.id).exists():
+                # 같은 노드의 다른 프로세스와 겹치지 않도록 조건부 UPDATE로 가져간다.
+                claimed = session.execute(
+                    update(RecipientBatch)
+                    .where(
+                        RecipientBatch.id == batch.id,
+                        RecipientBatch.status.in_(ACTIVE_JOB_STATUSES),
+                        RecipientBatch.updated_at < orphan_before,
+                    )
+                    .values(status=JOB_PENDING, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                session.commit()
+                if claimed:
+                    resumed.append(batch.id)
+            elif _as_utc(batch.updated_at) < stale_before:
+                _mark_failed(session, batch.id, "업로드 작업이 중단되었습니다. 재개할 수 있습니다.")
+                failed += 1
+    for batch_id in resumed:
+        _submit(batch_id)
+    return len(resumed), failed
+
+
+def cleanup_expired_uploads() -> int:
+    """
+    보관 기한(UPLOAD_SESSION_TTL_HOURS)이 지난 분할 업로드 세션은 취소하고,
+    실패한 작업의 재개용 파일은 삭제한다.
+    """
+    expire_before = datetime.now(timezone.utc) - timedelta(hours=settings.upload_session_ttl_hours)
+    with SessionLocal() as session:
+        expired = list(
+            session.scalars(
+                select(RecipientBatch).where(
+                    RecipientBatch.status.in_((JOB_UPLOADING, JOB_FAILED)),
+                    RecipientBatch.updated_at < expire_before,
+                )
+            )
+        )
+        for batch in expired:
+            if batch.status == JOB_UPLOADING:
+                batch.status = JOB_CANCELLED
+                batch.finished_at = datetime.now(timezone.utc)
+            _remove_files(batch.id)
+        session.commit()
+    return len(expired)
+
+
+def shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _new_batch(
+    db: Session,
+    *,
+    campaign_id: int,
+    filename: str | None,
+    uploaded_by: int | None,
+    status: str,
+) -> RecipientBatch:
+    if status == JOB_PENDING:
+        upload_service.lock_campaign_for_upload(db, campaign_id)
+    elif not db.get(Campaign, campaign_id):
+        raise ValueError("캠페인을 찾을 수 없습니다.")
+    batch = RecipientBatch(
+        campaign_id=campaign_id,
+        upload_type="FILE",
+        original_filename=filename,
+        uploaded_by=uploaded_by,
+        status=status,
+        processed_bytes=0,
+        last_committed_row=0,
+        file_node=_node_name(),
+    )
+    db.add(batch)
+    db.flush()
+    return batch
+
+
+def _get_uploading(db: Session, campaign_id: int, batch_id: int) -> RecipientBatch:
+    batch = get_upload_job(db, campaign_id, batch_id)
+    if batch.status != JOB_UPLOADING:
+        raise ValueError("업로드 중인 세션이 아닙니다.")
+    _require_local_file(batch)
+    return batch
+
+
+def _mark_failed(session: Session, batch_id: int, message: str) -> None:
+    batch = session.get(RecipientBatch, batch_id)
+    if batch is None:
+        return
+    batch.status = JOB_FAILED
+    batch.error_message = message[:255]
+    batch.finished_at = datetime.now(timezone.utc)
+    session.commit()
+    recipient_hash_cache_service.invalidate(batch.campaign_id)
+
+
+def _delete_batch_rows(db: Session, batch_id: int) -> None:
+    db.execute(delete(CampaignRecipient).where(CampaignRecipient.batch_id == batch_id))
+    db.execute(delete(RecipientValidationError).where(RecipientValidationError.batch_id == batch_id))
+
+
+def _submit(batch_id: int) -> None:
+    with _inflight_lock:
+        _inflight.add(batch_id)
+    _get_executor().submit(run_upload_job, batch_id)
+
+
+def _node_name() -> str:
+    return settings.upload_job_node or socket.gethostname()
+
+
+def _is_file_local(batch: RecipientBatch) -> bool:
+    # file_node가 없는 기존 배치는 이 노드 파일로 본다.
+    return settings.upload_job_shared_storage or batch.file_node in (None, _node_name())
+
+
+def _require_local_file(batch: RecipientBatch) -> None:
+    if not _is_file_local(batch):
+        raise ValueError(
+            f"업로드 파일이 다른 서버({batch.file_node})에 있어 이 서버에서 처리할 수 없습니다. "
+            "해당 서버로 요청하거나 파일을 다시 업로드하세요."
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite 등 타임존 없이 돌려주는 드라이버 대비
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _write_file(path: Path, source: BinaryIO) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as target:
+        shutil.copyfileobj(source, target)
+
+
+def _remove_files(batch_id: int) -> None:
+    _job_path(batch_id).unlink(missing_ok=True)
+    for path in JOB_DIR.glob(f"{batch_id}.part*"):
+        path.unlink(missing_ok=True)
+
+
+def _job_path(batch_id: int) -> Path:
+    return JOB_DIR / f"{batch_id}.upload"
+
+
+def _part_path(batch_id: int, part_number: int) -> Path:
+    return JOB_DIR / f"{batch_id}.part{part_number:05d}"
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(settings.upload_job_workers, 1),
+                thread_name_prefix="recipient-upload",
+            )
+        return _executor
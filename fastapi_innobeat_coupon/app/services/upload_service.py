@@ -2,47 +2,149 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Iterable, List
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, Iterator, List, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.core.crypto import encrypt_value, hash_value
-from app.core.phone import is_valid_phone
+from app.core.config import settings
+from app.core.crypto import encrypt_many, hash_many
+from app.core.phone import validate_phones
+from app.db.bulk import ChunkedInserter
+from app.db.session import SessionLocal
 from app.models.domain import (
     Campaign,
     CampaignRecipient,
     RecipientBatch,
     RecipientValidationError,
 )
-from app.schemas.uploads import RecipientUploadSummary
+from app.schemas.uploads import (
+    RecipientUploadSummary,
+    RecipientValidationErrorFilters,
+    RecipientValidationErrorPage,
+    RecipientValidationErrorRead,
+    RecipientValidationErrorSummary,
+)
+from app.services import recipient_hash_cache_service, suppression_service
+
+XLSX_SIGNATURE = b"PK\x03\x04"
+ERROR_EXPORT_FETCH_SIZE = 1000
+# 수신자를 넣는 중인 업로드 작업 상태 (upload_job_service와 공유)
+ACTIVE_UPLOAD_STATUSES = ("PENDING", "RUNNING")
+T = TypeVar("T")
+
+
+def _parse_upload(stream: BinaryIO, *, require_name: bool = True) -> Iterator[tuple[int, str, str]]:
+    """
+    파일 시그니처로 XLSX(zip)와 CSV를 구분해 같은 (행 번호, phone, name) 스트림으로 만든다.
+    require_name=False면 phone 컬럼만 있어도 된다(이름은 빈 문자열).
+    """
+    signature = stream.read(len(XLSX_SIGNATURE))
+    stream.seek(0)
+    if signature == XLSX_SIGNATURE:
+        return _parse_xlsx(stream, require_name=require_name)
+    return _parse_csv(stream, require_name=require_name)
+
+
+def _parse_csv(stream: BinaryIO, *, require_name: bool = True) -> Iterator[tuple[int, str, str]]:
+    """
+    업로드 파일을 행 단위로 읽는다. UTF-8(BOM 허용) 디코딩도 청크 단위로 이뤄지므로
+    파일 전체를 메모리에 올리지 않는다.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text_stream)
+        if reader.fieldnames is None:
+            raise ValueError("업로드된 파일이 비어 있습니다.")
+        expected_headers = {"phone", "name"} if require_name else {"phone"}
+        if not expected_headers.issubset({h.strip() for h in reader.fieldnames}):
+            raise ValueError(f"CSV 헤더에 {'phone,name' if require_name else 'phone'} 컬럼이 필요합니다.")
+        for idx, row in enumerate(reader, start=2):  # header is row 1
+            phone = (row.get("phone") or "").strip()
+            name = (row.get("name") or "").strip()
+            yield idx, phone, name
+    except UnicodeDecodeError as exc:
+        raise ValueError("CSV 파일은 UTF-8 인코딩이어야 합니다.") from exc
+    finally:
+        # 래퍼를 닫으면 업로드 임시 파일까지 닫히므로 분리만 한다.
+        text_stream.detach()
+
+
+def _parse_xlsx(stream: BinaryIO, *, require_name: bool = True) -> Iterator[tuple[int, str, str]]:
+    """
+    첫 번째 워크시트를 read-only 모드로 한 행씩 읽는다. 통합 문서 전체를 메모리에 올리지 않는다.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:  # pragma: no cover - 선택 의존성
+        raise ValueError("XLSX 업로드를 사용하려면 openpyxl 설치가 필요합니다.") from exc
+
+    try:
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError("XLSX 파일을 읽을 수 없습니다.") from exc
+    try:
+        sheet = workbook.worksheets[0]
+        # 저장된 dimension 정보가 틀린 파일도 끝까지 읽도록 초기화한다.
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("업로드된 파일이 비어 있습니다.")
+        columns = {str(value).strip().lower(): idx for idx, value in enumerate(header) if value is not None}
+        if "phone" not in columns:
+            raise ValueError("XLSX 첫 행에 phone 컬럼이 필요합니다.")
+        if require_name and "name" not in columns:
+            raise ValueError("XLSX 첫 행에 phone,name 컬럼이 필요합니다.")
+        phone_idx, name_idx = columns["phone"], columns.get("name")
+        for idx, row in enumerate(rows, start=2):  # header is row 1
+            if not row or all(value is None for value in row):
+                continue
+            phone = _xlsx_phone(row[phone_idx] if phone_idx < len(row) else None)
+            name = _xlsx_text(row[name_idx] if name_idx is not None and name_idx < len(row) else None)
+            yield idx, phone, name
+    finally:
+        workbook.close()
+
+
+def _xlsx_text(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
 
-MAX_UPLOAD_ROWS = 20_000
 
+def _xlsx_phone(value: object) -> str:
+    text = _xlsx_text(value)
+    # 숫자 서식 셀은 앞자리 0이 빠진 채 저장된다 (01012345678 → 1012345678).
+    if isinstance(value, (int, float)) and len(text) == 10 and text.startswith("1"):
+        return f"0{text}"
+    return text
 
-def _parse_csv(file_bytes: bytes) -> Iterable[tuple[int, str, str]]:
-    text = file_bytes.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
-    expected_headers = {"phone", "name"}
-    if not reader.fieldnames or not expected_headers.issubset({h.strip() for h in reader.fieldnames}):
-        raise ValueError("CSV 헤더에 phone,name 컬럼이 필요합니다.")
-    for idx, row in enumerate(reader, start=2):  # header is row 1
-        phone = (row.get("phone") or "").strip()
-        name = (row.get("name") or "").strip()
-        yield idx, phone, name
+
+def _chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass
+class RecipientIngestResult:
+    existing_hashes: recipient_hash_cache_service.CampaignPhoneHashes
+    added_hashes: set[bytes] = field(default_factory=set)
+    errors: list[str] = field(default_factory=list)
 
 
 def handle_recipient_upload(
     db: Session,
     campaign_id: int,
     filename: str,
-    file_bytes: bytes,
+    stream: BinaryIO,
 ) -> RecipientUploadSummary:
-    campaign = db.get(Campaign, campaign_id)
-    if not campaign:
-        raise ValueError("캠페인을 찾을 수 없습니다.")
-    if not file_bytes:
-        raise ValueError("업로드된 파일이 비어 있습니다.")
+    lock_campaign_for_upload(db, campaign_id)
 
     batch = RecipientBatch(
         campaign_id=campaign_id,
@@ -52,116 +154,318 @@ def handle_recipient_upload(
     db.add(batch)
     db.flush()
 
-    uploaded_total = 0
-    valid_count = 0
-    invalid_count = 0
-    errors: list[str] = []
-    error_records: List[RecipientValidationError] = []
-    seen_hashes: set[bytes] = set()
-
-    for row_number, phone, name in _parse_csv(file_bytes):
-        uploaded_total += 1
-        if uploaded_total > MAX_UPLOAD_ROWS:
-            raise ValueError(f"CSV 1회 업로드는 최대 {MAX_UPLOAD_ROWS:,}건까지 지원합니다.")
-
-        if not is_valid_phone(phone):
-            invalid_count += 1
-            errors.append(f"{row_number}행: 전화번호 형식이 올바르지 않습니다.")
-            error_records.append(
-                RecipientValidationError(
-                    batch_id=batch.id,
-                    row_number=row_number,
-                    raw_phone=phone,
-                    raw_name=name or None,
-                    reason="INVALID_PHONE_FORMAT",
-                )
-            )
-            continue
-
-        phone_hash = hash_value(phone)
-        if phone_hash in seen_hashes:
-            _append_error(
-                batch_id=batch.id,
-                row_number=row_number,
-                raw_phone=phone,
-                raw_name=name,
-                reason="DUPLICATE_IN_FILE",
-                errors=errors,
-                error_records=error_records,
+    result = ingest_recipient_file(db, batch, stream, max_rows=settings.upload_max_rows)
+    db.commit()
+    remember_ingested(db, batch.campaign_id, result)
+
+    return RecipientUploadSummary(
+        batch_id=batch.id,
+        uploaded_total=batch.total_count,
+        valid_count=batch.valid_count,
+        invalid_count=batch.invalid_count,
+        errors=result.errors,
+        errors_truncated=batch.invalid_count > len(result.errors),
+    )
+
+
+def lock_campaign_for_upload(db: Session, campaign_id: int) -> Campaign:
+    """
+    캠페인 행을 잠그고 진행 중(PENDING/RUNNING)인 업로드 작업이 없는지 확인한다.
+    동기 업로드와 작업 등록/재개가 모두 이 잠금을 거치므로 한 캠페인에는 한 번에 하나의 업로드만
+    수신자를 넣는다. 잠금은 호출 측 트랜잭션이 끝날 때 풀린다.
+    """
+    campaign = db.get(Campaign, campaign_id, with_for_update=True, populate_existing=True)
+    if not campaign:
+        raise ValueError("캠페인을 찾을 수 없습니다.")
+    # 잠금 읽기로 조회해 트랜잭션 스냅샷과 무관하게 최신 커밋 상태를 본다.
+    active = db.scalar(
+        select(RecipientBatch.id)
+        .where(
+            RecipientBatch.campaign_id == campaign_id,
+            RecipientBatch.status.in_(ACTIVE_UPLOAD_STATUSES),
+        )
+        .limit(1)
+        .with_for_update()
+    )
+    if active is not None:
+        raise ValueError("이 캠페인에 진행 중인 업로드 작업이 있습니다. 작업이 끝난 뒤 다시 시도하세요.")
+    return campaign
+
+
+def ingest_recipient_file(
+    db: Session,
+    batch: RecipientBatch,
+    stream: BinaryIO,
+    *,
+    max_rows: int,
+    on_chunk: Callable[[], None] | None = None,
+) -> RecipientIngestResult:
+    """
+    파일을 청크 단위로 검증해 수신자/검증 오류 행을 넣고 배치 진행 카운터와 체크포인트
+    (last_committed_row)를 갱신한다. on_chunk는 청크마다 호출된다(백그라운드 작업은 여기서 커밋한다).
+
+    체크포인트가 있으면 그 행까지는 건너뛰고 이어서 처리한다. 이전 시도에서 이 배치로 들어간
+    번호는 파일 내 중복 판정에 포함한다.
+    """
+    resume_after = batch.last_committed_row or 0
+    uploaded_total = batch.total_count or 0
+    valid_count = batch.valid_count or 0
+    invalid_count = batch.invalid_count or 0
+    chunk_size = settings.upload_insert_chunk_size
+    recipient_rows = ChunkedInserter(db, CampaignRecipient, chunk_size=chunk_size)
+    error_rows = ChunkedInserter(db, RecipientValidationError, chunk_size=chunk_size)
+    result = RecipientIngestResult(
+        existing_hashes=recipient_hash_cache_service.load_phone_hashes(db, batch.campaign_id)
+    )
+    errors = result.errors
+    seen_hashes = result.added_hashes
+    existing_hashes = result.existing_hashes
+    prior_hashes: frozenset[bytes] = frozenset()
+    if resume_after:
+        prior_hashes = frozenset(
+            db.scalars(select(CampaignRecipient.phone_hash).where(CampaignRecipient.batch_id == batch.id))
+        )
+    # 발송 제외 목록은 파일당 한 번만 증분 갱신하고, 청크마다 블룸 양성 후보만 DB로 확인한다.
+    suppression_filter = suppression_service.refresh_filter(db)
+    parsed = _parse_upload(stream)
+    pending_rows = (row for row in parsed if row[0] > resume_after)
+    try:
+        for rows in _chunked(pending_rows, chunk_size):
+            uploaded_total += len(rows)
+            if uploaded_total > max_rows:
+                raise ValueError(f"1회 업로드는 최대 {max_rows:,}건까지 지원합니다.")
+
+            # 검증/해시/암호화는 청크 단위 일괄 API로 처리하고, 중복 판정만 행 순서대로 한다.
+            # 번호는 정규화하지 않고 원본 값으로 검증한다 (하이픈/공백이 섞인 값은 형식 오류).
+            phones = [phone for _, phone, _ in rows]
+            phone_valid = validate_phones(phones)
+            valid_hashes = hash_many([phone for phone, ok in zip(phones, phone_valid) if ok])
+            suppressed = suppression_service.screen(db, valid_hashes, suppression_filter)
+            phone_hashes = iter(valid_hashes)
+            accepted: list[tuple[str, str, bytes]] = []
+            for (row_number, phone, name), ok in zip(rows, phone_valid):
+                if not ok:
+                    invalid_count += 1
+                    _note_error(errors, f"{row_number}행: 전화번호 형식이 올바르지 않습니다.")
+                    error_rows.add(_error_row(batch.id, row_number, phone, name, "INVALID_PHONE_FORMAT"))
+                    continue
+
+                phone_hash = next(phone_hashes)
+                if phone_hash in seen_hashes or phone_hash in prior_hashes:
+                    _append_error(
+                        batch_id=batch.id,
+                        row_number=row_number,
+                        raw_phone=phone,
+                        raw_name=name,
+                        reason="DUPLICATE_IN_FILE",
+                        errors=errors,
+                        error_rows=error_rows,
+                    )
+                    invalid_count += 1
+                    continue
+
+                if phone_hash in suppressed:
+                    _append_error(
+                        batch_id=batch.id,
+                        row_number=row_number,
+                        raw_phone=phone,
+                        raw_name=name,
+                        reason="SUPPRESSED",
+                        errors=errors,
+                        error_rows=error_rows,
+                    )
+                    invalid_count += 1
+                    continue
+
+                if phone_hash in existing_hashes:
+                    _append_error(
+                        batch_id=batch.id,
+                        row_number=row_number,
+                        raw_phone=phone,
+                        raw_name=name,
+                        reason="DUPLICATE_IN_CAMPAIGN",
+                        errors=errors,
+                        error_rows=error_rows,
+                    )
+                    invalid_count += 1
+                    continue
+
+                accepted.append((phone, name, phone_hash))
+                seen_hashes.add(phone_hash)
+                valid_count += 1
+
+            # 전화번호와 이름을 한 번에 넘겨 청크 전체가 스레드 풀에 나뉘도록 한다.
+            encrypted = encrypt_many(
+                [phone for phone, _, _ in accepted] + [name or None for _, name, _ in accepted]
             )
-            invalid_count += 1
-            continue
-
-        if _phone_exists(db, campaign_id, phone_hash):
-            _append_error(
-                batch_id=batch.id,
-                row_number=row_number,
-                raw_phone=phone,
-                raw_name=name,
-                reason="DUPLICATE_IN_CAMPAIGN",
-                errors=errors,
-                error_records=error_records,
+            enc_phones, enc_names = encrypted[: len(accepted)], encrypted[len(accepted) :]
+            recipient_rows.extend(
+                {
+                    "campaign_id": batch.campaign_id,
+                    "batch_id": batch.id,
+                    "enc_phone": enc_phone,
+                    "phone_hash": phone_hash,
+                    "enc_name": enc_name or None,
+                    "status": "VALIDATED",
+                    "validation_error": None,
+                }
+                for (_, _, phone_hash), enc_phone, enc_name in zip(accepted, enc_phones, enc_names)
             )
-            invalid_count += 1
-            continue
-
-        recipient = CampaignRecipient(
-            campaign_id=campaign_id,
-            batch_id=batch.id,
-            enc_phone=encrypt_value(phone),
-            phone_hash=phone_hash,
-            enc_name=encrypt_value(name) if name else None,
-            status="VALIDATED",
-            validation_error=None,
-        )
-        db.add(recipient)
-        seen_hashes.add(phone_hash)
-        valid_count += 1
 
-    if error_records:
-        db.add_all(error_records)
+            recipient_rows.flush()
+            error_rows.flush()
+            batch.total_count = uploaded_total
+            batch.valid_count = valid_count
+            batch.invalid_count = invalid_count
+            batch.last_committed_row = rows[-1][0]
+            batch.processed_bytes = stream.tell()
+            if on_chunk is not None:
+                on_chunk()
+    finally:
+        # 실패 시에도 파일이 닫히기 전에 파서를 정리한다.
+        parsed.close()
 
-    batch.total_count = uploaded_total
-    batch.valid_count = valid_count
-    batch.invalid_count = invalid_count
+    return result
 
-    db.commit()
 
-    return RecipientUploadSummary(
-        batch_id=batch.id,
-        uploaded_total=uploaded_total,
-        valid_count=valid_count,
-        invalid_count=invalid_count,
-        errors=errors,
+def remember_ingested(db: Session, campaign_id: int, result: RecipientIngestResult) -> None:
+    # 커밋 이후에 호출해야 한다.
+    recipient_hash_cache_service.remember_added(
+        db, campaign_id, result.existing_hashes, result.added_hashes
+    )
+
+
+def import_suppression_file(
+    db: Session,
+    stream: BinaryIO,
+    *,
+    reason: str | None = None,
+    source: str | None = None,
+    actor: str | None = None,
+) -> suppression_service.SuppressionImportResult:
+    """
+    phone 컬럼이 있는 CSV/XLSX 파일을 발송 제외 목록으로 가져온다. 청크 단위로 넣으며
+    커밋은 호출 측에서 한다.
+    """
+    total = suppression_service.SuppressionImportResult()
+    # 필터 갱신은 가져오기 시작 시 한 번만 하고, 청크마다 새로 넣은 번호는 add_suppressions가 필터에 더한다.
+    suppression_filter = suppression_service.refresh_filter(db)
+    parsed = _parse_upload(stream, require_name=False)
+    try:
+        for rows in _chunked(parsed, settings.upload_insert_chunk_size):
+            result = suppression_service.add_suppressions(
+                db,
+                [phone for _, phone, _ in rows],
+                reason=reason,
+                source=source,
+                actor=actor,
+                bloom=suppression_filter,
+            )
+            total.imported += result.imported
+            total.duplicates += result.duplicates
+            total.invalid += result.invalid
+    finally:
+        parsed.close()
+    return total
+
+
+def list_validation_errors(
+    db: Session,
+    campaign_id: int,
+    filters: RecipientValidationErrorFilters,
+) -> RecipientValidationErrorPage:
+    """
+    검증 오류 keyset 페이지 조회 (id 오름차순, cursor 이후부터).
+    """
+    stmt = _validation_error_query(campaign_id, filters.batch_id).order_by(RecipientValidationError.id.asc())
+    if filters.cursor:
+        stmt = stmt.where(RecipientValidationError.id > filters.cursor)
+    rows = list(db.scalars(stmt.limit(filters.limit + 1)))
+    has_more = len(rows) > filters.limit
+    items = rows[: filters.limit]
+    return RecipientValidationErrorPage(
+        items=[RecipientValidationErrorRead.model_validate(row) for row in items],
+        next_cursor=items[-1].id if has_more and items else None,
     )
 
 
-def list_validation_errors(db: Session, campaign_id: int) -> list[RecipientValidationError]:
+def summarize_validation_errors(
+    db: Session,
+    campaign_id: int,
+    batch_id: int | None = None,
+) -> list[RecipientValidationErrorSummary]:
     stmt = (
-        select(RecipientValidationError)
+        select(RecipientValidationError.reason, func.count(RecipientValidationError.id))
         .join(RecipientBatch, RecipientBatch.id == RecipientValidationError.batch_id)
         .where(RecipientBatch.campaign_id == campaign_id)
-        .order_by(RecipientValidationError.row_number.asc())
+        .group_by(RecipientValidationError.reason)
+        .order_by(func.count(RecipientValidationError.id).desc())
     )
-    return list(db.scalars(stmt).all())
+    if batch_id is not None:
+        stmt = stmt.where(RecipientValidationError.batch_id == batch_id)
+    return [
+        RecipientValidationErrorSummary(reason=reason, count=count)
+        for reason, count in db.execute(stmt)
+    ]
+
+
+def has_validation_errors(db: Session, campaign_id: int, batch_id: int | None = None) -> bool:
+    stmt = _validation_error_query(campaign_id, batch_id).limit(1)
+    return db.scalar(stmt) is not None
 
 
-def generate_validation_error_csv(db: Session, campaign_id: int) -> str:
-    errors = list_validation_errors(db, campaign_id)
-    output = io.StringIO()
-    writer = csv.writer(output)
+def stream_validation_error_csv(campaign_id: int, batch_id: int | None = None) -> Iterator[bytes]:
+    """
+    검증 오류 CSV를 조각 단위로 만든다. 응답 스트리밍 동안 요청 세션과 무관하게 읽도록
+    자체 세션을 열고, yield_per로 서버 측 커서에서 나눠 가져온다.
+    """
+    columns = select(
+        RecipientValidationError.row_number,
+        RecipientValidationError.raw_phone,
+        RecipientValidationError.raw_name,
+        RecipientValidationError.reason,
+        RecipientValidationError.created_at,
+    )
+    stmt = (
+        columns.join(RecipientBatch, RecipientBatch.id == RecipientValidationError.batch_id)
+        .where(RecipientBatch.campaign_id == campaign_id)
+        .order_by(RecipientValidationError.id.asc())
+        .execution_options(yield_per=ERROR_EXPORT_FETCH_SIZE)
+    )
+    if batch_id is not None:
+        stmt = stmt.where(RecipientValidationError.batch_id == batch_id)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
     writer.writerow(["row_number", "phone", "name", "reason", "logged_at"])
-    for err in errors:
-        writer.writerow(
-            [
-                err.row_number,
-                err.raw_phone or "",
-                err.raw_name or "",
-                err.reason,
-                err.created_at.isoformat() if err.created_at else "",
-            ]
-        )
-    return output.getvalue()
+    yield buffer.getvalue().encode("utf-8-sig")
+
+    with SessionLocal() as session:
+        for partition in session.execute(stmt).partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                [
+                    row_number,
+                    raw_phone or "",
+                    raw_name or "",
+                    reason,
+                    created_at.isoformat() if created_at else "",
+                ]
+                for row_number, raw_phone, raw_name, reason, created_at in partition
+            )
+            yield buffer.getvalue().encode("utf-8")
+
+
+def _validation_error_query(campaign_id: int, batch_id: int | None):
+    stmt = (
+        select(RecipientValidationError)
+        .join(RecipientBatch, RecipientBatch.id == RecipientValidationError.batch_id)
+        .where(RecipientBatch.campaign_id == campaign_id)
+    )
+    if batch_id is not None:
+        stmt = stmt.where(RecipientValidationError.batch_id == batch_id)
+    return stmt
 
 
 def _append_error(
@@ -171,23 +475,29 @@ def _append_error(
     raw_name: str | None,
     reason: str,
     errors: list[str],
-    error_records: List[RecipientValidationError],
+    error_rows: ChunkedInserter,
 ) -> None:
-    errors.append(f"{row_number}행: {reason}")
-    error_records.append(
-        RecipientValidationError(
-            batch_id=batch_id,
-            row_number=row_number,
-            raw_phone=raw_phone,
-            raw_name=raw_name or None,
-            reason=reason,
-        )
-    )
+    _note_error(errors, f"{row_number}행: {reason}")
+    error_rows.add(_error_row(batch_id, row_number, raw_phone, raw_name, reason))
 
 
-def _phone_exists(db: Session, campaign_id: int, phone_hash: bytes) -> bool:
-    stmt = select(CampaignRecipient.id).where(
-        CampaignRecipient.campaign_id == campaign_id,
-        CampaignRecipient.phone_hash == phone_hash,
-    )
-    return db.execute(stmt).first() is not None
+def _note_error(errors: list[str], message: str) -> None:
+    # 응답에 싣는 오류 메시지는 앞부분만 남긴다. 전체 목록은 오류 조회/내보내기 API로 본다.
+    if len(errors) < settings.upload_response_error_limit:
+        errors.append(message)
+
+
+def _error_row(
+    batch_id: int,
+    row_number: int,
+    raw_phone: str,
+    raw_name: str | None,
+    reason: str,
+) -> dict:
+    return {
+        "batch_id": batch_id,
+        "row_number": row_number,
+        "raw_phone": raw_phone,
+        "raw_name": raw_name or None,
+        "reason": reason,
+    }
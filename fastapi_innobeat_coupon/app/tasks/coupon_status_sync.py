@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 
 from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.crypto import decrypt_value
+from app.core.rate_limit import bulk_priority
 from app.db.session import SessionLocal
 from app.models.domain import CampaignProduct, CouponIssue, CouponProduct, CouponStatusHistory
-from app.services import coufun_service
+from app.services import coupon_status_cache_service
+from app.services.coufun_service import CIRCUIT_OPEN_CODE, CoufunAPIError
 
 logger = logging.getLogger(__name__)
 TRACKING_STATUSES = {"ISSUED", "SENT", "DELIVERED", "REUSABLE"}
@@ -30,11 +31,17 @@ def run_coupon_status_sync_job() -> None:
         if not issues:
             return
 
-        for issue in issues:
-            try:
-                _sync_issue(session, issue)
-            except Exception:  # noqa: BLE001
-                logger.exception("쿠폰 상태 동기화 실패 (issue_id=%s)", issue.id)
+        with bulk_priority():
+            for issue in issues:
+                try:
+                    _sync_issue(session, issue)
+                except CoufunAPIError as exc:
+                    if exc.code == CIRCUIT_OPEN_CODE:
+                        logger.warning("COUFUN 서킷 오픈으로 상태 동기화를 중단합니다. (%s)", exc)
+                        break
+                    logger.exception("쿠폰 상태 동기화 실패 (issue_id=%s)", issue.id)
+                except Exception:  # noqa: BLE001
+                    logger.exception("쿠폰 상태 동기화 실패 (issue_id=%s)", issue.id)
         session.commit()
     finally:
         session.close()
@@ -45,7 +52,16 @@ def _sync_issue(session: SessionLocal, issue: CouponIssue) -> None:
     barcode = decrypt_value(issue.barcode_enc)
     if not goods_id or not barcode:
         return
-    status = coufun_service.get_coupon_status(goods_id, barcode)
+    lookup = coupon_status_cache_service.get_coupon_status(
+        session,
+        issue,
+        goods_id=goods_id,
+        barcode=barcode,
+    )
+    if lookup.cached:
+        # 최근 CS/화면 조회로 이미 갱신된 쿠폰은 COUFUN을 다시 호출하지 않는다.
+        return
+    status = lookup.status
     issue.status = status.status
     if status.valid_end_date:
         issue.valid_end_date = status.valid_end_date
@@ -53,7 +69,7 @@ def _sync_issue(session: SessionLocal, issue: CouponIssue) -> None:
         coupon_issue_id=issue.id,
         status=status.status,
         status_source="COUFUN_SYNC",
-        status_at=datetime.now(timezone.utc),
+        status_at=lookup.status_at,
         memo=status.status_label,
     )
     session.add(history)
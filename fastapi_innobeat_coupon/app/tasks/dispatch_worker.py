@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import logging
+
+from app.core.config import settings
+from app.services.dispatch_job_service import (
+    fail_stale_dispatch_jobs,
+    heartbeat_dispatch_jobs,
+    run_dispatch_worker_poll,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_dispatch_worker_job() -> None:
+    if not settings.dispatch_worker_enabled:
+        return
+    try:
+        started = run_dispatch_worker_poll()
+        if started:
+            logger.info("진행 중인 발송 작업에 워커 합류 (%s개)", started)
+    except Exception:  # noqa: BLE001
+        logger.exception("발송 워커 폴링 실패")
+
+
+def run_dispatch_heartbeat_job() -> None:
+    try:
+        heartbeat_dispatch_jobs()
+    except Exception:  # noqa: BLE001
+        logger.exception("발송 작업 하트비트 갱신 실패")
+
+
+def run_dispatch_stale_cleanup_job() -> None:
+    try:
+        failed = fail_stale_dispatch_jobs()
+        if failed:
+            logger.warning("하트비트가 끊긴 발송 작업 FAILED 처리 (%s건)", failed)
+    except Exception:  # noqa: BLE001
+        logger.exception("중단된 발송 작업 정리 실패")
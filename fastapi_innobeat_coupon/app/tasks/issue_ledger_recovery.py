@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import logging
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.issue_ledger_service import recover_ledger
+
+logger = logging.getLogger(__name__)
+
+
+def run_issue_ledger_recovery_job() -> None:
+    if not settings.issue_ledger_recovery_enabled:
+        return
+
+    session = SessionLocal()
+    try:
+        summary = recover_ledger(session)
+        session.commit()
+        if summary["retried"] or summary["applied"]:
+            logger.info(
+                "쿠폰 발급 원장 복구 완료 (retried=%s, applied=%s)",
+                summary["retried"],
+                summary["applied"],
+            )
+    except Exception:  # noqa: BLE001
+        session.rollback()
+        logger.exception("쿠폰 발급 원장 복구 실패")
+    finally:
+        session.close()
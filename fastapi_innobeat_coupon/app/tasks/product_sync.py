@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from app.core.config import settings
+from app.core.rate_limit import bulk_priority
 from app.db.session import SessionLocal
 from app.services.product_sync_service import sync_coufun_products
 
@@ -15,7 +16,8 @@ def run_product_sync_job() -> None:
 
     session = SessionLocal()
     try:
-        summary = sync_coufun_products(session)
+        with bulk_priority():
+            summary = sync_coufun_products(session)
         logger.info(
             "COUFUN 상품 동기화 완료 (synced=%s, result_code=%s)",
             summary.get("synced"),
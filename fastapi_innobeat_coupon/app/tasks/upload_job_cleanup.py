@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import logging
+
+from app.core.config import settings
+from app.services.upload_job_service import cleanup_expired_uploads, recover_stale_upload_jobs
+
+logger = logging.getLogger(__name__)
+
+
+def run_upload_job_cleanup_job() -> None:
+    if not settings.export_cleanup_enabled:
+        return
+    try:
+        expired = cleanup_expired_uploads()
+        if expired:
+            logger.info("만료된 업로드 세션/재개 파일 정리 (%s건)", expired)
+    except Exception:  # noqa: BLE001
+        logger.exception("업로드 작업 파일 정리 실패")
+
+
+def run_upload_job_recovery_job() -> None:
+    try:
+        resumed, failed = recover_stale_upload_jobs()
+        if resumed or failed:
+            logger.info("중단된 업로드 작업 정리 (재개 %s건, 실패 처리 %s건)", resumed, failed)
+    except Exception:  # noqa: BLE001
+        logger.exception("중단된 업로드 작업 정리 실패")
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+
+import uvicorn
+
+from app.services.coufun_simulator import (
+    CoufunSimulator,
+    LatencyModel,
+    SimulatorProfile,
+    create_app,
+    parse_endpoint_latency,
+    parse_error_rates,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 COUFUN 시뮬레이터 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="지연 분포 (fixed:MS, uniform:MIN:MAX, normal:MEAN:STD, lognormal:MEDIAN:SIGMA, exponential:MEAN)",
+    )
+    parser.add_argument(
+        "--endpoint-latency",
+        default="",
+        help='엔드포인트별 지연 (예: "coufunCreate=lognormal:300:0.4;coufunProduct=fixed:800")',
+    )
+    parser.add_argument("--error-rates", default="", help='결과코드별 비율 (예: "50:0.03,99:0.02")')
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="HTTP 503 응답 비율")
+    parser.add_argument("--goods-count", type=int, default=50, help="상품 목록 건수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (재현용)")
+    args = parser.parse_args()
+
+    profile = SimulatorProfile(
+        latency=LatencyModel.parse(args.latency),
+        endpoint_latency=parse_endpoint_latency(args.endpoint_latency),
+        error_rates=parse_error_rates(args.error_rates),
+        http_error_rate=args.http_error_rate,
+        goods_count=args.goods_count,
+        seed=args.seed,
+    )
+    print(f"COUFUN 시뮬레이터: http://{args.host}:{args.port} (COUFUN_BASE_URL로 지정)")
+    uvicorn.run(create_app(CoufunSimulator(profile)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+coupon_issues.barcode_hash 백필 (마이그레이션 b7e3c1d9a4f2 적용 후 1회 실행).
+
+바코드는 암호문으로만 저장돼 있어 SQL로 해시를 만들 수 없으므로, 운영 암호화 키로 복호화해
+해시를 채운다. 키와 앱 코드에 의존하므로 마이그레이션이 아닌 별도 스크립트로 둔다.
+barcode_hash가 비어 있는 행만 처리하므로 여러 번 실행해도 된다.
+
+    python -m scripts.backfill_barcode_hash [--batch-size 1000] [--database-url ...]
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import bindparam, create_engine, select, update
+
+from app.core.crypto import decrypt_value, hash_value
+from app.db.session import DATABASE_URL
+from app.models.domain import CouponIssue
+
+
+def backfill(engine, *, batch_size: int) -> int:
+    filled = 0
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(CouponIssue.id, CouponIssue.barcode_enc)
+                .where(
+                    CouponIssue.id > last_id,
+                    CouponIssue.barcode_hash.is_(None),
+                    CouponIssue.barcode_enc.is_not(None),
+                )
+                .order_by(CouponIssue.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return filled
+            params = []
+            for row in rows:
+                barcode = decrypt_value(row.barcode_enc)
+                if barcode:
+                    params.append({"issue_id": row.id, "hash": hash_value(barcode)})
+            if params:
+                conn.execute(
+                    update(CouponIssue.__table__)
+                    .where(CouponIssue.__table__.c.id == bindparam("issue_id"))
+                    .values(barcode_hash=bindparam("hash")),
+                    params,
+                )
+            filled += len(params)
+            last_id = rows[-1].id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="coupon_issues.barcode_hash 백필")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    args = parser.parse_args()
+
+    filled = backfill(create_engine(args.database_url), batch_size=max(args.batch_size, 1))
+    print(f"barcode_hash backfilled: {filled}")
+
+
+if __name__ == "__main__":
+    main()
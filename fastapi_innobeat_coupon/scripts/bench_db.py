@@ -0,0 +1,25 @@
+"""
+벤치마크 스크립트 공용 DB 준비.
+
+운영 스키마는 MySQL/MariaDB 기준이라 BIGINT PK가 SQLite에서 자동 증가하지 않는다.
+SQLite URL이면 BIGINT를 INTEGER(rowid 별칭)로 만들도록 바꾸고 테이블을 직접 만든다.
+MySQL/MariaDB는 alembic upgrade head가 끝난 DB를 그대로 쓴다.
+"""
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.db.base import Base
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw) -> str:
+    return "INTEGER"
+
+def create_bench_engine(database_url: str) -> Engine:
+    engine = create_engine(database_url)
+    if engine.dialect.name == "sqlite":
+        Base.metadata.create_all(engine)
+    return engine
@@ -0,0 +1,111 @@
+"""
+수신자 업로드 INSERT 경로(ORM vs 청크 executemany) 벤치마크.
+
+    python -m scripts.bench_recipient_insert --database-url sqlite:////tmp/bench.db
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.crypto import encrypt_value, hash_value
+from app.db.bulk import bulk_insert
+from app.db.session import DATABASE_URL
+from app.models.domain import Campaign, CampaignRecipient, RecipientBatch, RecipientValidationError
+from scripts.bench_db import create_bench_engine
+
+
+def _build_rows(campaign_id: int, batch_id: int, count: int) -> tuple[list[dict], list[dict]]:
+    recipients = []
+    errors = []
+    for idx in range(count):
+        phone = f"010{idx:08d}"
+        recipients.append(
+            {
+                "campaign_id": campaign_id,
+                "batch_id": batch_id,
+                "enc_phone": encrypt_value(phone),
+                "phone_hash": hash_value(phone),
+                "enc_name": encrypt_value(f"수신자{idx}"),
+                "status": "VALIDATED",
+                "validation_error": None,
+            }
+        )
+        # 실제 업로드와 비슷하게 약 5% 비율로 검증 오류 행을 섞는다.
+        if idx % 20 == 0:
+            errors.append(
+                {
+                    "batch_id": batch_id,
+                    "row_number": idx + 2,
+                    "raw_phone": phone[:-1],
+                    "raw_name": None,
+                    "reason": "INVALID_PHONE_FORMAT",
+                }
+            )
+    return recipients, errors
+
+
+def _insert_orm(db: Session, recipients: list[dict], errors: list[dict]) -> None:
+    for row in recipients:
+        db.add(CampaignRecipient(**row))
+    db.add_all(RecipientValidationError(**row) for row in errors)
+    db.flush()
+
+
+def _insert_bulk(db: Session, recipients: list[dict], errors: list[dict], chunk_size: int) -> None:
+    bulk_insert(db, CampaignRecipient, recipients, chunk_size=chunk_size)
+    bulk_insert(db, RecipientValidationError, errors, chunk_size=chunk_size)
+
+
+def run(engine, *, rows: int, mode: str, chunk_size: int) -> float:
+    with Session(engine) as db:
+        campaign = Campaign(
+            campaign_key=f"BENCH-{uuid.uuid4().hex[:12]}",
+            event_name="bulk insert benchmark",
+            sender_number="0000",
+            message_title="bench",
+            message_body="bench",
+        )
+        db.add(campaign)
+        db.flush()
+        batch = RecipientBatch(campaign_id=campaign.id, upload_type="FILE", original_filename="bench.csv")
+        db.add(batch)
+        db.flush()
+        recipients, errors = _build_rows(campaign.id, batch.id, rows)
+
+        started = time.perf_counter()
+        if mode == "orm":
+            _insert_orm(db, recipients, errors)
+        else:
+            _insert_bulk(db, recipients, errors, chunk_size)
+        elapsed = time.perf_counter() - started
+        # 측정용 데이터는 남기지 않는다.
+        db.rollback()
+    return (len(recipients) + len(errors)) / elapsed if elapsed else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="수신자 업로드 INSERT 경로 벤치마크 (초당 행 수)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 200_000])
+    parser.add_argument("--mode", choices=["orm", "bulk", "both"], default="both")
+    parser.add_argument("--chunk-size", type=int, nargs="+", default=[settings.upload_insert_chunk_size])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    args = parser.parse_args()
+
+    engine = create_bench_engine(args.database_url)
+    modes = ["orm", "bulk"] if args.mode == "both" else [args.mode]
+    print(f"{'rows':>8} {'mode':>5} {'chunk':>6} {'rows/s':>12}")
+    for rows in args.rows:
+        for mode in modes:
+            chunk_sizes = args.chunk_size if mode == "bulk" else [0]
+            for chunk_size in chunk_sizes:
+                rate = run(engine, rows=rows, mode=mode, chunk_size=chunk_size)
+                print(f"{rows:>8} {mode:>5} {chunk_size or '-':>6} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
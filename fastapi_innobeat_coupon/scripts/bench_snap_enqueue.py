@@ -0,0 +1,148 @@
+"""
+UMS_MSG + MmsJob 적재 경로(건별 vs 청크 executemany) 벤치마크.
+
+    python -m scripts.bench_snap_enqueue --database-url sqlite:////tmp/bench.db
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy import insert, inspect, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import DATABASE_URL
+from app.models.domain import Campaign, CampaignRecipient, MmsJob
+from app.services import snap_service
+from scripts.bench_db import create_bench_engine
+
+# 로컬 SQLite 등 SNAP 스키마가 없는 DB에서 측정할 때만 만드는 최소 UMS_MSG 테이블.
+CREATE_UMS_SQL = text(
+    """
+    CREATE TABLE UMS_MSG (
+        CLIENT_KEY VARCHAR(40) PRIMARY KEY,
+        REQ_CH VARCHAR(10),
+        TRAFFIC_TYPE VARCHAR(10),
+        MSG_STATUS VARCHAR(10),
+        REQ_DATE DATETIME,
+        CALLBACK_NUMBER VARCHAR(20),
+        PHONE VARCHAR(20),
+        MSG TEXT,
+        TITLE VARCHAR(100),
+        MMS_FILE_LIST VARCHAR(255),
+        REQ_DEPT_CODE VARCHAR(20),
+        REQ_USER_ID VARCHAR(50)
+    )
+"""
+)
+
+
+def _ensure_ums_table(engine) -> None:
+    if not inspect(engine).has_table("UMS_MSG"):
+        with engine.begin() as conn:
+            conn.execute(CREATE_UMS_SQL)
+
+
+def _build_messages(campaign: Campaign, recipient_ids: list[int]) -> list[snap_service.SnapMessage]:
+    return [
+        snap_service.SnapMessage(
+            client_key=snap_service.build_client_key(campaign.campaign_key, recipient_id),
+            phone=f"010{idx:08d}",
+            callback_number=campaign.sender_number,
+            title=campaign.message_title,
+            message=campaign.message_body,
+            media_path=None,
+            recipient_id=recipient_id,
+        )
+        for idx, recipient_id in enumerate(recipient_ids)
+    ]
+
+
+def _enqueue_single(db: Session, campaign: Campaign, messages: list[snap_service.SnapMessage]) -> None:
+    # 기존 경로: 수신자마다 UMS_MSG INSERT 1회 + MmsJob ORM add
+    for message in messages:
+        snap_service.enqueue_mms_message(
+            db,
+            client_key=message.client_key,
+            phone=message.phone,
+            callback_number=message.callback_number,
+            title=message.title,
+            message=message.message,
+            media_path=message.media_path,
+        )
+        db.add(
+            MmsJob(
+                campaign_id=campaign.id,
+                recipient_id=message.recipient_id,
+                client_key=message.client_key,
+                ums_msg_id=message.client_key,
+                status="READY",
+            )
+        )
+    db.flush()
+
+
+def run(engine, *, rows: int, mode: str, chunk_size: int) -> float:
+    with Session(engine) as db:
+        campaign = Campaign(
+            # build_client_key가 해시 접미사로 줄이지 않도록 짧게 둔다.
+            campaign_key=f"B{uuid.uuid4().hex[:8]}",
+            event_name="snap enqueue benchmark",
+            sender_number="0000",
+            message_title="bench",
+            message_body="bench",
+        )
+        db.add(campaign)
+        db.flush()
+        # MmsJob FK를 맞추기 위한 수신자 행 (측정 대상 아님)
+        db.execute(
+            insert(CampaignRecipient),
+            [
+                {"campaign_id": campaign.id, "enc_phone": b"-", "phone_hash": b"-", "status": "VALIDATED"}
+                for _ in range(rows)
+            ],
+        )
+        recipient_ids = list(
+            db.scalars(
+                select(CampaignRecipient.id)
+                .where(CampaignRecipient.campaign_id == campaign.id)
+                .order_by(CampaignRecipient.id)
+            )
+        )
+        messages = _build_messages(campaign, recipient_ids)
+
+        started = time.perf_counter()
+        if mode == "single":
+            _enqueue_single(db, campaign, messages)
+        else:
+            snap_service.enqueue_mms_messages(db, messages, campaign_id=campaign.id, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - started
+        # 측정용 데이터는 남기지 않는다 (SNAP Agent는 커밋된 행만 읽는다).
+        db.rollback()
+    return rows / elapsed if elapsed else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="UMS_MSG + MmsJob 적재 경로 벤치마크 (초당 메시지 수)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 20_000, 100_000])
+    parser.add_argument("--mode", choices=["single", "batch", "both"], default="both")
+    parser.add_argument("--chunk-size", type=int, nargs="+", default=[settings.snap_enqueue_chunk_size])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    args = parser.parse_args()
+
+    engine = create_bench_engine(args.database_url)
+    _ensure_ums_table(engine)
+    modes = ["single", "batch"] if args.mode == "both" else [args.mode]
+    print(f"{'rows':>8} {'mode':>6} {'chunk':>6} {'msgs/s':>12}")
+    for rows in args.rows:
+        for mode in modes:
+            chunk_sizes = args.chunk_size if mode == "batch" else [0]
+            for chunk_size in chunk_sizes:
+                rate = run(engine, rows=rows, mode=mode, chunk_size=chunk_size)
+                print(f"{rows:>8} {mode:>6} {chunk_size or '-':>6} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+공용 픽스처. 운영 스키마(MySQL/MariaDB)를 파일 SQLite로 만들어 서비스 코드를 그대로 실행한다.
+발급 원장처럼 별도 세션(커넥션)을 여는 코드가 있으므로 메모리 DB 대신 파일 DB를 쓴다.
+"""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.domain import Campaign
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw) -> str:
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가한다.
+    return "INTEGER"
+
+
+class FakeClock:
+    """
+    time 모듈 대신 끼워 넣는 시계. monotonic()은 advance()로만 움직인다.
+    """
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    # 테스트마다 새 DB를 쓰므로 id로 키를 잡는 프로세스 전역 캐시를 비운다.
+    from app.services import recipient_hash_cache_service, suppression_service
+
+    recipient_hash_cache_service._cache.clear()
+    suppression_service.reset_filter()
+    yield
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def campaign(db) -> Campaign:
+    campaign = Campaign(
+        campaign_key="TEST",
+        event_name="test",
+        sender_number="0000",
+        message_title="title",
+        message_body="body",
+    )
+    db.add(campaign)
+    db.commit()
+    return campaign
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from sqlalchemy import event, func, select
+
+from app.db.bulk import ChunkedInserter, bulk_insert
+from app.models.domain import CampaignRecipient
+
+
+def _rows(campaign_id: int, count: int) -> list[dict]:
+    return [
+        {"campaign_id": campaign_id, "enc_phone": b"-", "phone_hash": idx.to_bytes(4, "big"), "status": "VALIDATED"}
+        for idx in range(count)
+    ]
+
+
+def _count_statements(engine) -> list[int]:
+    batches: list[int] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO campaign_recipients"):
+            batches.append(len(parameters) if executemany else 1)
+
+    return batches
+
+
+def test_inserter_flushes_every_chunk(db, engine, campaign):
+    batches = _count_statements(engine)
+    inserter = ChunkedInserter(db, CampaignRecipient, chunk_size=4)
+    inserter.extend(_rows(campaign.id, 10))
+    assert batches == [4, 4]
+    inserter.flush()
+    inserter.flush()
+    db.commit()
+
+    assert batches == [4, 4, 2]
+    assert inserter.inserted == 10
+    assert db.scalar(select(func.count(CampaignRecipient.id))) == 10
+
+
+def test_bulk_insert_follows_the_caller_transaction(db, campaign):
+    assert bulk_insert(db, CampaignRecipient, _rows(campaign.id, 5), chunk_size=2) == 5
+    db.rollback()
+    assert db.scalar(select(func.count(CampaignRecipient.id))) == 0
+    assert bulk_insert(db, CampaignRecipient, [], chunk_size=2) == 0
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core import circuit_breaker
+from app.core.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock) -> CircuitBreaker:
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return CircuitBreaker("coufunCreate", failure_threshold=3, recovery_seconds=30, half_open_max_calls=1)
+
+
+def _fail(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.on_failure()
+
+
+def test_opens_after_consecutive_failures(breaker):
+    _fail(breaker, 2)
+    assert breaker.state == STATE_CLOSED
+    _fail(breaker, 1)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_the_failure_count(breaker):
+    _fail(breaker, 2)
+    breaker.before_call()
+    breaker.on_success()
+    _fail(breaker, 2)
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 2
+
+
+def test_half_open_allows_limited_trial_calls_then_closes(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(29)
+    assert breaker.state == STATE_OPEN
+    clock.advance(1)
+    assert breaker.state == STATE_HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == STATE_CLOSED
+    breaker.before_call()
+
+
+def test_failed_trial_call_reopens(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(30)
+    breaker.before_call()
+    breaker.on_failure()
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert [(t["from"], t["to"]) for t in breaker.snapshot()["transitions"]] == [
+        (STATE_CLOSED, STATE_OPEN),
+        (STATE_OPEN, STATE_HALF_OPEN),
+        (STATE_HALF_OPEN, STATE_OPEN),
+    ]
+
+
+def test_unreported_trial_slot_is_released_after_recovery_window(breaker, clock):
+    _fail(breaker, 3)
+    clock.advance(30)
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.advance(30)
+    breaker.before_call()
+    assert breaker.state == STATE_HALF_OPEN
+
+
+def test_latency_is_keyed_like_breakers_and_limiters(monkeypatch):
+    from app.core.metrics import LatencyRecorder
+    from app.services import coufun_service
+
+    recorder = LatencyRecorder()
+    monkeypatch.setattr(coufun_service, "latency_recorder", recorder)
+    coufun_service.record_latency("coufunCreate.do", 0.1, success=True)
+    coufun_service.record_latency("coufunCreate", 0.3, success=False)
+    stats = recorder.snapshot()
+    assert list(stats) == ["coufunCreate"]
+    assert stats["coufunCreate"]["count"] == 2
+    assert stats["coufunCreate"]["errors"] == 1
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.core import crypto
+from app.core.config import settings
+
+
+@pytest.fixture
+def chunk_threads(monkeypatch) -> list[tuple[str, int]]:
+    """
+    crypto 청크 함수를 감싸 (실행 스레드 이름, 청크 크기)를 기록한다.
+    """
+    monkeypatch.setattr(settings, "crypto_workers", 4)
+    calls: list[tuple[str, int]] = []
+    for name in ("_encrypt_chunk", "_decrypt_chunk", "_hash_chunk"):
+        original = getattr(crypto, name)
+
+        def _record(values, _original=original):
+            calls.append((threading.current_thread().name, len(values)))
+            return _original(values)
+
+        monkeypatch.setattr(crypto, name, _record)
+    yield calls
+    crypto.shutdown_executor()
+
+
+def test_upload_chunk_runs_on_the_executor(chunk_threads):
+    phones = [f"010{idx:08d}" for idx in range(settings.upload_insert_chunk_size)]
+
+    encrypted = crypto.encrypt_many(phones)
+
+    assert len(chunk_threads) == 4
+    assert all(name.startswith("crypto") for name, _ in chunk_threads)
+    assert sum(size for _, size in chunk_threads) == len(phones)
+    assert [crypto.decrypt_value(blob) for blob in encrypted] == phones
+
+
+def test_batch_results_keep_input_order(chunk_threads):
+    values = [f"010{idx:08d}" if idx % 7 else None for idx in range(500)]
+
+    decrypted = crypto.decrypt_many(crypto.encrypt_many(values))
+    hashes = crypto.hash_many([value for value in values if value])
+
+    assert decrypted == values
+    assert hashes == [crypto.hash_value(value) for value in values if value]
+    assert all(name.startswith("crypto") for name, _ in chunk_threads)
+
+
+def test_small_batches_stay_on_the_calling_thread(chunk_threads):
+    crypto.encrypt_many([f"010{idx:08d}" for idx in range(settings.crypto_parallel_min_items - 1)])
+
+    assert chunk_threads == [(threading.current_thread().name, settings.crypto_parallel_min_items - 1)]
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.crypto import encrypt_value
+from app.models.domain import (
+    CampaignProduct,
+    CampaignRecipient,
+    CouponIssueLedger,
+    CouponProduct,
+    DispatchJob,
+)
+from app.services import dispatch_job_service, dispatch_service, issue_ledger_service, snap_service
+from app.services.coufun_service import CoufunIssueResult
+
+
+@pytest.fixture
+def recipients(db, campaign) -> list[CampaignRecipient]:
+    rows = [
+        CampaignRecipient(
+            campaign_id=campaign.id,
+            enc_phone=encrypt_value(f"010{idx:08d}"),
+            phone_hash=bytes([idx]),
+            status=dispatch_service.RECIPIENT_VALIDATED,
+        )
+        for idx in range(6)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def _age_claims(db, seconds: float) -> None:
+    db.execute(
+        update(CampaignRecipient).values(updated_at=datetime.now(timezone.utc) - timedelta(seconds=seconds))
+    )
+    db.commit()
+
+
+def _statuses(db) -> dict[int, tuple[str, str | None]]:
+    db.expire_all()
+    return {row.id: (row.status, row.dispatch_claim) for row in db.scalars(select(CampaignRecipient))}
+
+
+def _pending_ledger(db, campaign, recipient) -> CouponIssueLedger:
+    entry = CouponIssueLedger(
+        tr_id=snap_service.build_client_key(campaign.campaign_key, recipient.id),
+        campaign_id=campaign.id,
+        recipient_id=recipient.id,
+        goods_id="0000000001",
+        status=issue_ledger_service.LEDGER_PENDING,
+        attempts=1,
+        requested_at=datetime.now(timezone.utc),
+    )
+    db.add(entry)
+    db.commit()
+    return entry
+
+
+def test_workers_claim_disjoint_chunks(db, campaign, recipients):
+    first = dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=4)
+    db.commit()
+    second = dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=4)
+    db.commit()
+
+    assert first == [row.id for row in recipients[:4]]
+    assert second == [row.id for row in recipients[4:]]
+    assert dispatch_service.claim_recipients(db, campaign.id, claim_token="C", limit=4) == []
+    assert {claim for _, claim in _statuses(db).values()} == {"A", "B"}
+    assert dispatch_service.has_pending_recipients(db, campaign.id)
+
+
+def test_expired_claims_are_reclaimed(db, campaign, recipients, monkeypatch):
+    monkeypatch.setattr(settings, "dispatch_claim_timeout_seconds", 600)
+    monkeypatch.setattr(settings, "dispatch_job_heartbeat_seconds", 60)
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=6)
+    db.commit()
+
+    _age_claims(db, 500)
+    assert dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=6) == []
+    _age_claims(db, 700)
+    assert len(dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=6)) == 6
+
+
+def test_claim_timeout_is_at_least_three_heartbeats(db, campaign, recipients, monkeypatch):
+    monkeypatch.setattr(settings, "dispatch_claim_timeout_seconds", 10)
+    monkeypatch.setattr(settings, "dispatch_job_heartbeat_seconds", 60)
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=6)
+    db.commit()
+
+    _age_claims(db, 120)
+    assert dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=6) == []
+
+
+def test_renewed_claims_are_not_reclaimed(db, campaign, recipients):
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=3)
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=3)
+    db.commit()
+    _age_claims(db, 3600)
+
+    assert dispatch_service.renew_claims(db, {"A": campaign.id}) == 3
+    db.commit()
+    reclaimed = dispatch_service.claim_recipients(db, campaign.id, claim_token="C", limit=6)
+    assert reclaimed == [row.id for row in recipients[3:]]
+
+
+def test_reset_dispatch_state_releases_leftover_claims(db, campaign, recipients):
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=6)
+    db.commit()
+    assert dispatch_service.reset_dispatch_state(db, campaign.id) == 6
+    assert all(claim is None for _, claim in _statuses(db).values())
+
+
+class _Dispatch:
+    """
+    쿠폰 발급(issue_many_blocking)과 SNAP 적재를 대신한다. on_issue로 발급 도중의 경쟁을 흉내 낸다.
+    """
+
+    def __init__(self) -> None:
+        self.issued: list[str] = []
+        self.enqueued: list[int] = []
+        self.on_issue = None
+
+    def issue(self, requests):
+        self.issued.extend(request.tr_id for request in requests)
+        if self.on_issue:
+            self.on_issue()
+        return [
+            [CoufunIssueResult(order_id=f"O-{request.tr_id}", barcode=f"B-{request.tr_id}", valid_end_date=None, raw_payload={})]
+            for request in requests
+        ]
+
+    def enqueue(self, db, messages, *, campaign_id, chunk_size=None):
+        self.enqueued.extend(message.recipient_id for message in messages)
+        return len(messages)
+
+
+@pytest.fixture
+def dispatch(db, campaign, monkeypatch) -> _Dispatch:
+    product = CouponProduct(
+        goods_id="0000000001", name="coupon", face_value=1000, purchase_price=900, vendor_status="ON_SALE"
+    )
+    db.add(product)
+    db.flush()
+    db.add(CampaignProduct(campaign_id=campaign.id, coupon_product_id=product.id, unit_price=1000))
+    db.commit()
+    fake = _Dispatch()
+    monkeypatch.setattr(issue_ledger_service, "issue_many_blocking", fake.issue)
+    monkeypatch.setattr(snap_service, "enqueue_mms_messages", fake.enqueue)
+    return fake
+
+
+def test_recipient_with_in_flight_issue_is_deferred_not_failed(db, campaign, recipients, dispatch):
+    busy = recipients[2]
+    _pending_ledger(db, campaign, busy)
+    ids = dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=6)
+    db.commit()
+
+    context = dispatch_service.load_dispatch_context(db, campaign)
+    result = dispatch_service.dispatch_recipients(db, context, ids, claim_token="A")
+    db.commit()
+
+    assert (result.processed, result.enqueued, result.errors) == (5, 5, [])
+    assert busy.id not in dispatch.enqueued
+    statuses = _statuses(db)
+    assert statuses[busy.id] == (dispatch_service.RECIPIENT_DISPATCHING, None)
+    assert all(
+        status == (dispatch_service.RECIPIENT_QUEUED, None)
+        for recipient_id, status in statuses.items()
+        if recipient_id != busy.id
+    )
+    # 점유가 풀린 채 남은 수신자는 시간 초과 뒤 다시 점유된다.
+    assert dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=6) == []
+    _age_claims(db, 3600)
+    assert dispatch_service.claim_recipients(db, campaign.id, claim_token="B", limit=6) == [busy.id]
+
+
+def test_recipients_reclaimed_during_issuance_are_not_enqueued_twice(
+    db, session_factory, campaign, recipients, dispatch
+):
+    ids = dispatch_service.claim_recipients(db, campaign.id, claim_token="A", limit=6)
+    db.commit()
+    stolen = ids[:2]
+
+    def reclaim_by_other_worker() -> None:
+        with session_factory() as other:
+            other.execute(
+                update(CampaignRecipient).where(CampaignRecipient.id.in_(stolen)).values(dispatch_claim="B")
+            )
+            other.commit()
+
+    dispatch.on_issue = reclaim_by_other_worker
+    context = dispatch_service.load_dispatch_context(db, campaign)
+    result = dispatch_service.dispatch_recipients(db, context, ids, claim_token="A")
+    db.commit()
+
+    assert result.processed == 4
+    assert sorted(dispatch.enqueued) == sorted(ids[2:])
+    statuses = _statuses(db)
+    assert all(statuses[recipient_id] == (dispatch_service.RECIPIENT_DISPATCHING, "B") for recipient_id in stolen)
+
+
+@pytest.fixture
+def job_runner(session_factory, monkeypatch) -> list[int]:
+    """
+    워커 풀 대신 시작 요청된 job_id만 모은다. 테스트가 run_dispatch_worker를 직접 호출한다.
+    """
+    started: list[int] = []
+    monkeypatch.setattr(dispatch_job_service, "SessionLocal", session_factory)
+    monkeypatch.setattr(dispatch_job_service, "start_local_workers", started.append)
+    return started
+
+
+def test_last_worker_suspends_a_job_left_with_deferred_recipients(db, campaign, recipients, dispatch, job_runner):
+    busy = recipients[0]
+    entry = _pending_ledger(db, campaign, busy)
+    job = dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+
+    dispatch_job_service.run_dispatch_worker(job.id)
+    db.expire_all()
+    job = db.get(DispatchJob, job.id)
+    assert (job.status, job.processed_count, job.enqueued_count) == (dispatch_job_service.JOB_PENDING, 5, 5)
+    assert job.heartbeat_at is not None
+
+    # 미룬 수신자의 점유 시간 초과 전에는 다시 붙어도 처리할 것이 없어 PENDING으로 돌아간다.
+    dispatch_job_service.run_dispatch_worker(job.id)
+    db.expire_all()
+    assert db.get(DispatchJob, job.id).status == dispatch_job_service.JOB_PENDING
+
+    entry.status = issue_ledger_service.LEDGER_FAILED
+    db.commit()
+    _age_claims(db, 3600)
+    dispatch_job_service.run_dispatch_worker(job.id)
+    db.expire_all()
+    job = db.get(DispatchJob, job.id)
+    assert (job.status, job.processed_count, job.enqueued_count) == (dispatch_job_service.JOB_COMPLETED, 6, 6)
+    assert busy.id in dispatch.enqueued
+
+
+def test_worker_leaves_the_job_running_while_another_worker_holds_claims(
+    db, campaign, recipients, dispatch, job_runner
+):
+    job = dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+    dispatch_service.claim_recipients(db, campaign.id, claim_token="other", limit=2)
+    db.commit()
+
+    dispatch_job_service.run_dispatch_worker(job.id)
+    db.expire_all()
+    job = db.get(DispatchJob, job.id)
+    assert (job.status, job.processed_count) == (dispatch_job_service.JOB_RUNNING, 4)
+
+
+def test_abandoned_jobs_are_failed_and_unblock_new_dispatches(db, campaign, recipients, dispatch, job_runner):
+    job = dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+    with pytest.raises(ValueError, match="이미 진행 중인 발송 작업"):
+        dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+    db.rollback()
+
+    assert dispatch_job_service.fail_stale_dispatch_jobs() == 0
+    db.execute(
+        update(DispatchJob).values(heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    )
+    db.commit()
+    assert dispatch_job_service.fail_stale_dispatch_jobs() == 1
+    db.expire_all()
+    assert db.get(DispatchJob, job.id).status == dispatch_job_service.JOB_FAILED
+    assert dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None).id != job.id
+
+
+def test_rerun_after_a_crash_mid_chunk_skips_queued_recipients(
+    db, campaign, recipients, dispatch, job_runner, monkeypatch
+):
+    monkeypatch.setattr(settings, "dispatch_chunk_size", 2)
+    enqueue = dispatch.enqueue
+
+    def crash_on_second_chunk(session, messages, **kwargs):
+        if dispatch.enqueued:
+            raise RuntimeError("worker killed")
+        return enqueue(session, messages, **kwargs)
+
+    monkeypatch.setattr(snap_service, "enqueue_mms_messages", crash_on_second_chunk)
+    first = dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+    dispatch_job_service.run_dispatch_worker(first.id)
+    db.expire_all()
+    assert db.get(DispatchJob, first.id).status == dispatch_job_service.JOB_FAILED
+    queued = [row.id for row in recipients[:2]]
+    assert sorted(dispatch.enqueued) == queued
+    statuses = _statuses(db)
+    assert all(statuses[recipient_id][0] == dispatch_service.RECIPIENT_QUEUED for recipient_id in queued)
+
+    monkeypatch.setattr(snap_service, "enqueue_mms_messages", enqueue)
+    issued_before = len(dispatch.issued)
+    second = dispatch_job_service.submit_dispatch_job(db, campaign_id=campaign.id, requested_by=None)
+    assert second.total_count == 4
+    dispatch_job_service.run_dispatch_worker(second.id)
+    db.expire_all()
+
+    second = db.get(DispatchJob, second.id)
+    assert (second.status, second.processed_count) == (dispatch_job_service.JOB_COMPLETED, 4)
+    assert sorted(dispatch.enqueued) == sorted(row.id for row in recipients)
+    first_chunk_tr_ids = {snap_service.build_client_key(campaign.campaign_key, recipient_id) for recipient_id in queued}
+    assert not first_chunk_tr_ids & set(dispatch.issued[issued_before:])
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.core.crypto import decrypt_value
+from app.models.domain import CampaignRecipient, CouponIssue, CouponIssueLedger
+from app.services import coufun_service, issue_ledger_service
+from app.services.coufun_service import ISSUE_COUNT_MISMATCH_CODE, CoufunAPIError, CoufunIssueResult
+from app.services.issue_ledger_service import (
+    LEDGER_APPLIED,
+    LEDGER_FAILED,
+    LEDGER_PENDING,
+    LEDGER_RELEASED,
+    LEDGER_UNRESOLVED,
+    IssueIntent,
+)
+
+GOODS_ID = "0000000001"
+
+
+class FakeCoufun:
+    """
+    issue_many_blocking 대역. TR_ID별 오류 코드를 지정하지 않으면 create_count만큼 바코드를 발급한다.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.errors: dict[str, str] = {}
+
+    def __call__(self, requests):
+        results = []
+        for request in requests:
+            self.calls.append(request.tr_id)
+            code = self.errors.get(request.tr_id)
+            if code:
+                results.append(CoufunAPIError(f"error {code}", code=code))
+                continue
+            results.append(
+                [
+                    CoufunIssueResult(
+                        order_id=f"O-{request.tr_id}",
+                        barcode=f"B-{request.tr_id}-{seq}",
+                        valid_end_date=None,
+                        raw_payload={"BARCODE_NUM": "hidden", "ORDER_SEQ": str(seq)},
+                        order_seq=seq,
+                    )
+                    for seq in range(1, request.create_count + 1)
+                ]
+            )
+        return results
+
+
+@pytest.fixture
+def coufun(monkeypatch) -> FakeCoufun:
+    fake = FakeCoufun()
+    monkeypatch.setattr(issue_ledger_service, "issue_many_blocking", fake)
+    return fake
+
+
+@pytest.fixture
+def recipients(db, campaign) -> list[CampaignRecipient]:
+    rows = [
+        CampaignRecipient(campaign_id=campaign.id, enc_phone=b"-", phone_hash=bytes([idx]), status="DISPATCHING")
+        for idx in range(3)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def _intent(recipient: CampaignRecipient, tr_id: str, create_count: int = 1) -> IssueIntent:
+    return IssueIntent(
+        campaign_id=recipient.campaign_id,
+        recipient_id=recipient.id,
+        goods_id=GOODS_ID,
+        tr_id=tr_id,
+        create_count=create_count,
+    )
+
+
+def _ledger(db, tr_id: str) -> CouponIssueLedger:
+    return db.scalar(select(CouponIssueLedger).where(CouponIssueLedger.tr_id == tr_id))
+
+
+def test_issued_results_become_coupon_issues(db, coufun, recipients):
+    failures = issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1", create_count=2)])
+    db.commit()
+
+    assert failures == {}
+    assert _ledger(db, "T1").status == LEDGER_APPLIED
+    issues = db.scalars(select(CouponIssue).order_by(CouponIssue.order_seq)).all()
+    assert [(issue.order_id, issue.order_seq) for issue in issues] == [("O-T1", 1), ("O-T1", 2)]
+    assert decrypt_value(issues[0].barcode_enc) == "B-T1-1"
+    # 원장/발급 행의 원문 응답에는 바코드가 남지 않는다.
+    assert "BARCODE_NUM" not in issues[0].vendor_payload
+
+
+def test_applied_tr_id_is_not_called_again(db, coufun, recipients):
+    issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    db.commit()
+    issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    db.commit()
+    assert coufun.calls == ["T1"]
+    assert db.scalar(select(CouponIssue.id).where(CouponIssue.order_id == "O-T1"))
+
+
+def test_failed_request_is_retried_with_the_same_tr_id(db, coufun, recipients):
+    coufun.errors["T1"] = "99"
+    failures = issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    db.commit()
+    assert recipients[0].id in failures
+    assert _ledger(db, "T1").status == LEDGER_FAILED
+
+    del coufun.errors["T1"]
+    assert issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")]) == {}
+    db.commit()
+    entry = _ledger(db, "T1")
+    assert (entry.status, entry.attempts) == (LEDGER_APPLIED, 2)
+    assert coufun.calls == ["T1", "T1"]
+
+
+@pytest.mark.parametrize("code", ["12", "23", ISSUE_COUNT_MISMATCH_CODE])
+def test_ambiguous_results_are_left_unresolved(db, coufun, recipients, code):
+    coufun.errors["T1"] = code
+    failures = issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    db.commit()
+    assert "수동 확인" in failures[recipients[0].id]
+    assert _ledger(db, "T1").status == LEDGER_UNRESOLVED
+
+    # UNRESOLVED는 자동으로 다시 호출하지 않는다.
+    issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    assert coufun.calls == ["T1"]
+    assert issue_ledger_service.count_unresolved(db) == 1
+
+
+def test_pending_entry_is_reported_in_progress(db, coufun, recipients):
+    db.add(
+        CouponIssueLedger(
+            tr_id="T1",
+            campaign_id=recipients[0].campaign_id,
+            recipient_id=recipients[0].id,
+            goods_id=GOODS_ID,
+            status=LEDGER_PENDING,
+            attempts=1,
+            requested_at=datetime.now(timezone.utc),
+        )
+    )
+    db.commit()
+
+    in_progress: set[int] = set()
+    failures = issue_ledger_service.issue_with_ledger(
+        db, [_intent(recipients[0], "T1"), _intent(recipients[1], "T2")], in_progress=in_progress
+    )
+    assert failures == {}
+    assert in_progress == {recipients[0].id}
+    assert coufun.calls == ["T2"]
+
+    # in_progress를 넘기지 않는 호출 측에는 기존처럼 실패로 알린다.
+    failures = issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    assert recipients[0].id in failures
+
+
+def test_recover_ledger_retries_stale_pending_entries(db, coufun, recipients, monkeypatch):
+    stale_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    for recipient, tr_id, requested_at in (
+        (recipients[0], "T1", stale_at),
+        (recipients[1], "T2", datetime.now(timezone.utc)),
+    ):
+        db.add(
+            CouponIssueLedger(
+                tr_id=tr_id,
+                campaign_id=recipient.campaign_id,
+                recipient_id=recipient.id,
+                goods_id=GOODS_ID,
+                status=LEDGER_PENDING,
+                attempts=1,
+                requested_at=requested_at,
+            )
+        )
+    db.commit()
+
+    result = issue_ledger_service.recover_ledger(db, campaign_id=recipients[0].campaign_id)
+    db.commit()
+    assert result == {"retried": 1, "applied": 1}
+    assert coufun.calls == ["T1"]
+    assert _ledger(db, "T1").status == LEDGER_APPLIED
+    assert _ledger(db, "T2").status == LEDGER_PENDING
+
+
+def test_released_entry_is_retried_with_a_new_tr_id(db, coufun, recipients):
+    coufun.errors["T1"] = "12"
+    issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")])
+    db.commit()
+    entry = issue_ledger_service.list_unresolved(db)[0]
+
+    issue_ledger_service.release_unresolved(db, entry.id)
+    db.commit()
+    assert _ledger(db, "T1").status == LEDGER_RELEASED
+    with pytest.raises(ValueError):
+        issue_ledger_service.release_unresolved(db, entry.id)
+    db.rollback()
+
+    assert issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1")]) == {}
+    db.commit()
+    assert coufun.calls == ["T1", f"T1-R{entry.id}"]
+    assert _ledger(db, f"T1-R{entry.id}").status == LEDGER_APPLIED
+
+
+def test_resolve_with_barcodes_applies_verified_coupons(db, coufun, recipients, monkeypatch):
+    coufun.errors["T1"] = "23"
+    issue_ledger_service.issue_with_ledger(db, [_intent(recipients[0], "T1", create_count=2)])
+    db.commit()
+    entry = issue_ledger_service.list_unresolved(db)[0]
+
+    checked: list[tuple[str, str]] = []
+
+    def fake_status(goods_id: str, barcode: str):
+        checked.append((goods_id, barcode))
+        if barcode == "UNKNOWN":
+            raise CoufunAPIError("not found", code="05")
+        return coufun_service.CoufunStatus(
+            barcode=barcode,
+            status="ISSUED",
+            remain_amount=None,
+            coupon_type=None,
+            status_code="000",
+            status_label=None,
+            total_amount=None,
+            order_date=None,
+            valid_end_date=None,
+            exchanged_at=None,
+            cancelled_at=None,
+            raw_payload={},
+        )
+
+    monkeypatch.setattr(coufun_service, "get_coupon_status", fake_status)
+    with pytest.raises(ValueError):
+        issue_ledger_service.resolve_with_barcodes(db, entry.id, ["A", "B", "C"])
+    with pytest.raises(ValueError):
+        issue_ledger_service.resolve_with_barcodes(db, entry.id, ["UNKNOWN"])
+    db.rollback()
+
+    issue_ledger_service.resolve_with_barcodes(db, entry.id, ["BC-1", " BC-1 ", "BC-2"])
+    db.commit()
+    assert _ledger(db, "T1").status == LEDGER_APPLIED
+    assert checked[-2:] == [(GOODS_ID, "BC-1"), (GOODS_ID, "BC-2")]
+    barcodes = sorted(decrypt_value(issue.barcode_enc) for issue in db.scalars(select(CouponIssue)))
+    assert barcodes == ["BC-1", "BC-2"]
+    assert issue_ledger_service.count_unresolved(db) == 0
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import io
+
+from sqlalchemy import select
+
+from app.core.crypto import decrypt_value
+from app.core.phone import (
+    is_valid_phone,
+    mask_phone,
+    mask_phones,
+    normalize_phone,
+    normalize_phones,
+    validate_phones,
+)
+from app.models.domain import CampaignRecipient, RecipientValidationError
+from app.services import upload_service
+
+FULL_WIDTH = "010１２３４５６７８"
+SAMPLES = [
+    "01012345678",
+    "010-1234-5678",
+    "010 1234 5678",
+    FULL_WIDTH,
+    "０１０12345678",
+    "0101234567",
+    "011-123-4567",
+    "12",
+    "abc",
+    "",
+    None,
+    "010\n12345678",
+    "010\x0012345678",
+]
+
+
+def test_batch_functions_match_the_row_functions():
+    assert normalize_phones(SAMPLES) == [normalize_phone(phone) for phone in SAMPLES]
+    assert validate_phones(SAMPLES) == [is_valid_phone(phone) for phone in SAMPLES]
+    assert mask_phones(SAMPLES) == [mask_phone(phone) for phone in SAMPLES]
+    assert normalize_phones([]) == validate_phones([]) == mask_phones([]) == []
+
+
+def test_validation_uses_the_raw_value():
+    assert validate_phones(["01012345678", "010-1234-5678", "010 1234 5678"]) == [True, False, False]
+    assert normalize_phones([FULL_WIDTH]) == [FULL_WIDTH]
+    assert validate_phones([FULL_WIDTH]) == [True]
+
+
+def test_upload_rejects_formatted_numbers_and_keeps_full_width_digits(db, campaign):
+    payload = "phone,name\n01012345678,a\n010-1234-5679,b\n010 1234 5670,c\n" + FULL_WIDTH + ",d\n"
+
+    summary = upload_service.handle_recipient_upload(db, campaign.id, "r.csv", io.BytesIO(payload.encode()))
+    db.commit()
+
+    assert (summary.valid_count, summary.invalid_count) == (2, 2)
+    stored = [decrypt_value(row.enc_phone) for row in db.scalars(select(CampaignRecipient))]
+    assert sorted(stored) == sorted(["01012345678", FULL_WIDTH])
+    rejected = db.scalars(select(RecipientValidationError.raw_phone).order_by(RecipientValidationError.row_number))
+    assert list(rejected) == ["010-1234-5679", "010 1234 5670"]
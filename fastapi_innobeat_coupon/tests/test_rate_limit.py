@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import PRIORITY_BULK, PRIORITY_INTERACTIVE, AdaptiveTokenBucket, bulk_priority
+
+
+@pytest.fixture
+def bucket(monkeypatch, clock) -> AdaptiveTokenBucket:
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return AdaptiveTokenBucket(rate=10, capacity=10, min_rate=1, max_rate=20, interactive_reserve=0.2)
+
+
+def test_success_increases_rate_once_per_interval(bucket, clock):
+    for _ in range(500):
+        bucket.on_success()
+    assert bucket.rate == 10
+
+    clock.advance(1.0)
+    bucket.on_success()
+    bucket.on_success()
+    assert bucket.rate == 11
+
+
+def test_rate_never_exceeds_max_rate(bucket, clock):
+    for _ in range(50):
+        clock.advance(1.0)
+        bucket.on_success()
+    assert bucket.rate == 20
+
+
+def test_throttle_halves_rate_once_per_cooldown(bucket, clock):
+    bucket.on_throttle()
+    bucket.on_throttle()
+    assert bucket.rate == 5
+    assert bucket.throttle_count == 1
+
+    clock.advance(1.0)
+    bucket.on_throttle()
+    assert bucket.rate == 2.5
+
+    for _ in range(5):
+        clock.advance(1.0)
+        bucket.on_throttle()
+    assert bucket.rate == 1
+
+
+def test_throttle_postpones_the_next_increase(bucket, clock):
+    clock.advance(5.0)
+    bucket.on_throttle()
+    clock.advance(0.5)
+    bucket.on_success()
+    assert bucket.rate == 5
+
+    clock.advance(0.5)
+    bucket.on_success()
+    assert bucket.rate == 6
+
+
+def test_bulk_calls_leave_the_interactive_reserve(bucket):
+    acquired = 0
+    with bulk_priority():
+        assert rate_limit.current_priority() == PRIORITY_BULK
+        while bucket.try_acquire() == 0:
+            acquired += 1
+    # capacity 10 중 20%(2개)는 대화형 호출 몫으로 남는다.
+    assert acquired == 8
+    assert rate_limit.current_priority() == PRIORITY_INTERACTIVE
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() > 0
+
+
+def test_acquire_waits_for_refill(bucket, clock):
+    for _ in range(10):
+        bucket.acquire(PRIORITY_INTERACTIVE)
+    started = clock.now
+    bucket.acquire(PRIORITY_INTERACTIVE)
+    assert clock.now - started == pytest.approx(0.1)
+
+
+def test_process_budget_is_split_across_processes(monkeypatch):
+    from app.core.config import settings
+    from app.services import coufun_service
+
+    monkeypatch.setattr(coufun_service, "_rate_limiters", {})
+    monkeypatch.setattr(settings, "coufun_rate_limit_processes", 4)
+    monkeypatch.setattr(settings, "coufun_rate_limit_per_second", 40)
+    monkeypatch.setattr(settings, "coufun_rate_limit_max_per_second", 80)
+    limiter = coufun_service.get_rate_limiter("coufunCreate")
+    assert limiter.rate == 10
+    assert limiter.max_rate == 20
+    assert coufun_service.get_rate_limiter("coufunCreate") is limiter
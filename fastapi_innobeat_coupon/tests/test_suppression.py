@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.crypto import hash_value
+from app.models.domain import PhoneSuppression
+from app.services import suppression_service, upload_service
+
+
+def _digest(value: int) -> bytes:
+    return hashlib.sha256(str(value).encode()).digest()
+
+
+@pytest.fixture(autouse=True)
+def _small_filter(monkeypatch):
+    monkeypatch.setattr(settings, "suppression_bloom_capacity", 1000)
+    monkeypatch.setattr(settings, "suppression_bloom_rebuild_seconds", 3600)
+    monkeypatch.setattr(settings, "suppression_bloom_rescan_seconds", 600)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    for value in range(1000):
+        bloom.add(_digest(value))
+    assert all(_digest(value) in bloom for value in range(1000))
+    false_positives = sum(_digest(value) in bloom for value in range(1000, 11000))
+    assert false_positives < 300
+    assert not bloom.saturated
+    bloom.add(_digest(-1))
+    assert bloom.saturated
+
+
+def test_refresh_reads_new_rows_incrementally(db):
+    db.add(PhoneSuppression(id=10, phone_hash=_digest(10)))
+    db.commit()
+    assert _digest(10) in suppression_service.refresh_filter(db)
+
+    db.add(PhoneSuppression(id=11, phone_hash=_digest(11)))
+    db.commit()
+    assert _digest(11) in suppression_service.refresh_filter(db)
+
+
+def test_refresh_picks_up_rows_committed_late_with_a_lower_id(db):
+    db.add(PhoneSuppression(id=10, phone_hash=_digest(10)))
+    db.commit()
+    suppression_service.refresh_filter(db)
+
+    # id 5는 먼저 INSERT됐지만 id 10보다 늦게 커밋된 트랜잭션의 행이다.
+    db.add(PhoneSuppression(id=5, phone_hash=_digest(5)))
+    db.commit()
+    assert _digest(5) in suppression_service.refresh_filter(db)
+
+
+def test_rows_older_than_the_rescan_window_wait_for_the_rebuild(db, monkeypatch):
+    db.add(PhoneSuppression(id=10, phone_hash=_digest(10)))
+    db.commit()
+    suppression_service.refresh_filter(db)
+
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+    db.add(PhoneSuppression(id=6, phone_hash=_digest(6), created_at=long_ago))
+    db.commit()
+    assert _digest(6) not in suppression_service.refresh_filter(db)
+
+    monkeypatch.setattr(settings, "suppression_bloom_rebuild_seconds", 0)
+    assert _digest(6) in suppression_service.refresh_filter(db)
+
+
+def test_screen_confirms_bloom_hits_against_the_table(db):
+    db.add(PhoneSuppression(phone_hash=_digest(1)))
+    db.commit()
+    bloom = suppression_service.refresh_filter(db)
+    # 삭제된 번호의 비트는 남아도 DB 확인에서 걸러진다.
+    bloom.add(_digest(2))
+    assert suppression_service.screen(db, [_digest(1), _digest(2), _digest(3)], bloom) == {_digest(1)}
+
+
+def test_add_and_remove_suppressions(db):
+    result = suppression_service.add_suppressions(
+        db, ["010-1234-5678", "01012345678", "12345", "01099998888"], reason="OPT_OUT"
+    )
+    db.commit()
+    assert (result.imported, result.duplicates, result.invalid) == (2, 1, 1)
+
+    again = suppression_service.add_suppressions(db, ["01099998888"])
+    assert (again.imported, again.duplicates) == (0, 1)
+
+    assert suppression_service.remove_suppressions(db, ["01012345678"]) == 1
+    db.commit()
+    assert suppression_service.screen(db, [hash_value("01012345678"), hash_value("01099998888")]) == {
+        hash_value("01099998888")
+    }
+
+
+def test_file_import_refreshes_the_filter_once(db, monkeypatch):
+    monkeypatch.setattr(settings, "upload_insert_chunk_size", 10)
+    refreshes: list[int] = []
+    original = suppression_service._filter.refresh
+
+    def _refresh(session):
+        refreshes.append(1)
+        return original(session)
+
+    monkeypatch.setattr(suppression_service._filter, "refresh", _refresh)
+    phones = [f"010{idx:08d}" for idx in range(45)]
+    payload = ("phone\n" + "\n".join(phones + phones[:5]) + "\n").encode()
+
+    result = upload_service.import_suppression_file(db, io.BytesIO(payload), reason="OPT_OUT")
+    db.commit()
+
+    assert refreshes == [1]
+    assert (result.imported, result.duplicates, result.invalid) == (45, 5, 0)
+    bloom = suppression_service._filter._bloom
+    assert all(hash_value(phone) in bloom for phone in phones)
+
+
+def test_concurrently_inserted_numbers_count_as_duplicates(db, session_factory, monkeypatch):
+    # 다른 가져오기가 screen 이후에 같은 번호를 먼저 커밋한 상황.
+    with session_factory() as other:
+        other.add(PhoneSuppression(phone_hash=hash_value("01012345678")))
+        other.commit()
+    monkeypatch.setattr(suppression_service, "screen", lambda session, hashes, bloom=None: set())
+
+    result = suppression_service.add_suppressions(db, ["01012345678", "01099998888"])
+    db.commit()
+
+    assert (result.imported, result.duplicates) == (1, 1)
+    assert db.scalar(select(func.count(PhoneSuppression.id))) == 2
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from app.models.domain import CampaignRecipient, RecipientBatch
+from app.services import upload_job_service, upload_service
+
+
+def _csv(count: int, start: int = 0) -> bytes:
+    lines = ["phone,name"] + [f"010{idx:08d},수신자{idx}" for idx in range(start, start + count)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+@pytest.fixture
+def jobs(monkeypatch, tmp_path, session_factory) -> list[int]:
+    """
+    작업 풀 대신 제출된 batch_id만 모은다. 테스트가 run_upload_job을 직접 호출한다.
+    """
+    submitted: list[int] = []
+    monkeypatch.setattr(upload_job_service, "SessionLocal", session_factory)
+    monkeypatch.setattr(upload_job_service, "JOB_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(upload_job_service, "_submit", submitted.append)
+    return submitted
+
+
+def _submit(db, campaign_id: int, payload: bytes) -> RecipientBatch:
+    return upload_job_service.submit_upload_job(
+        db, campaign_id=campaign_id, filename="recipients.csv", source=io.BytesIO(payload), uploaded_by=None
+    )
+
+
+def test_upload_job_ingests_the_file(db, campaign, jobs):
+    batch = _submit(db, campaign.id, _csv(2500))
+    assert jobs == [batch.id]
+
+    upload_job_service.run_upload_job(batch.id)
+    db.expire_all()
+    batch = db.get(RecipientBatch, batch.id)
+    assert (batch.status, batch.valid_count, batch.last_committed_row) == ("COMPLETED", 2500, 2501)
+    assert not upload_job_service._job_path(batch.id).exists()
+
+
+def test_second_upload_is_refused_while_a_job_is_active(db, campaign, jobs):
+    first = _submit(db, campaign.id, _csv(10))
+
+    with pytest.raises(ValueError, match="진행 중인 업로드"):
+        _submit(db, campaign.id, _csv(10, start=5))
+    db.rollback()
+    with pytest.raises(ValueError, match="진행 중인 업로드"):
+        upload_service.handle_recipient_upload(db, campaign.id, "sync.csv", io.BytesIO(_csv(10, start=5)))
+    db.rollback()
+
+    upload_job_service.run_upload_job(first.id)
+    second = _submit(db, campaign.id, _csv(10, start=5))
+    upload_job_service.run_upload_job(second.id)
+    db.expire_all()
+    second = db.get(RecipientBatch, second.id)
+    assert (second.valid_count, second.invalid_count) == (5, 5)
+    assert db.scalar(select(func.count(CampaignRecipient.id))) == 15
+
+
+def test_job_runs_only_once_when_submitted_twice(db, campaign, jobs):
+    batch = _submit(db, campaign.id, _csv(10))
+    upload_job_service.run_upload_job(batch.id)
+    upload_job_service.run_upload_job(batch.id)
+    assert db.scalar(select(func.count(CampaignRecipient.id))) == 10
+
+
+def test_campaign_phone_is_unique(db, campaign):
+    for _ in range(2):
+        db.add(CampaignRecipient(campaign_id=campaign.id, enc_phone=b"-", phone_hash=b"same", status="VALIDATED"))
+    with pytest.raises(IntegrityError):
+        db.commit()
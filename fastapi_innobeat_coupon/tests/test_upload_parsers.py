@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from app.services.upload_service import _parse_upload
+
+
+def _xlsx(rows: list[tuple]) -> io.BytesIO:
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in rows:
+        sheet.append(list(row))
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def test_csv_rows_are_streamed_with_file_row_numbers():
+    # BOM은 건너뛰고 값의 앞뒤 공백은 제거한다.
+    stream = io.BytesIO("﻿phone,name\n010-1234-5678 , 홍길동 \n01011112222,\n".encode())
+    assert list(_parse_upload(stream)) == [(2, "010-1234-5678", "홍길동"), (3, "01011112222", "")]
+    # 파서가 끝나도 업로드 임시 파일은 닫히지 않는다.
+    assert not stream.closed
+
+
+def test_csv_requires_headers_and_utf8():
+    with pytest.raises(ValueError, match="phone,name"):
+        list(_parse_upload(io.BytesIO(b"mobile,name\n01012345678,a\n")))
+    with pytest.raises(ValueError, match="비어"):
+        list(_parse_upload(io.BytesIO(b"")))
+    with pytest.raises(ValueError, match="UTF-8"):
+        list(_parse_upload(io.BytesIO("phone,name\n01012345678,홍길동\n".encode("cp949"))))
+    # 이름 없이 번호만 받는 경로 (발송 제외 목록)
+    assert list(_parse_upload(io.BytesIO(b"phone\n01012345678\n"), require_name=False)) == [(2, "01012345678", "")]
+
+
+def test_xlsx_restores_leading_zero_and_skips_blank_rows():
+    stream = _xlsx(
+        [
+            ("Name", "Phone"),
+            ("홍길동", 1012345678),
+            (None, None),
+            ("김철수", "010-2222-3333"),
+            (12345.0, 1011112222.0),
+        ]
+    )
+    assert list(_parse_upload(stream)) == [
+        (2, "01012345678", "홍길동"),
+        (4, "010-2222-3333", "김철수"),
+        (5, "01011112222", "12345"),
+    ]
+
+
+def test_xlsx_requires_phone_column():
+    with pytest.raises(ValueError, match="phone"):
+        list(_parse_upload(_xlsx([("mobile", "name"), ("01012345678", "a")])))
+    with pytest.raises(ValueError, match="phone,name"):
+        list(_parse_upload(_xlsx([("phone",), ("01012345678",)])))
+    assert list(_parse_upload(_xlsx([("phone",), ("01012345678",)]), require_name=False)) == [
+        (2, "01012345678", "")
+    ]
+
+
+def test_corrupt_xlsx_is_reported():
+    with pytest.raises(ValueError, match="XLSX"):
+        list(_parse_upload(io.BytesIO(b"PK\x03\x04not-a-zip")))